@@ -0,0 +1,45 @@
+"""
+Hatch build hook compiling the stopword lists into a binary pack.
+
+The pack (see yake/core/stopwords.py) lets the installed package load any
+language's stopwords with a single file read. It is generated for wheel
+builds only; source trees and editable installs read the text files.
+"""
+
+import importlib.util
+import os
+import shutil
+import tempfile
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface  # pylint: disable=import-error
+
+# Location of the pack inside the wheel
+PACK_TARGET = "yake/core/StopwordsList/stopwords.pack"
+
+
+class StopwordPackBuildHook(BuildHookInterface):
+    """Build hook adding the precompiled stopword pack to wheels."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        """Compile the pack into a temporary directory and include it in the wheel."""
+        if self.target_name != "wheel":
+            return
+
+        # Load the registry module by path: the package's runtime
+        # dependencies are not installed in the build environment
+        module_path = os.path.join(self.root, "yake", "core", "stopwords.py")
+        spec = importlib.util.spec_from_file_location("_yake_stopwords", module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        self._pack_dir = tempfile.mkdtemp(prefix="yake-stopwords-")
+        pack_path = module.build_pack(os.path.join(self._pack_dir, "stopwords.pack"))
+        build_data["force_include"][pack_path] = PACK_TARGET
+
+    def finalize(self, version, build_data, artifact_path):
+        """Remove the temporary pack once the wheel is written."""
+        pack_dir = getattr(self, "_pack_dir", None)
+        if pack_dir:
+            shutil.rmtree(pack_dir, ignore_errors=True)
@@ -295,3 +295,42 @@ def test_lemmatization_comparison_with_without():
     
     # This might be equal if spacy is not installed (graceful degradation)
     assert len(unique_with_lemma) <= len(unique_no_lemma)
+
+
+class _FakeToken:
+    def __init__(self, text):
+        self.lemma_ = text.lower().rstrip("s")
+
+
+class _FakeSpacy:
+    """Stand-in for a spaCy pipeline that records how it is called."""
+
+    pipe_names = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text):
+        raise AssertionError("keywords must be lemmatized with nlp.pipe")
+
+    def pipe(self, texts, disable=(), batch_size=None):
+        texts = list(texts)
+        self.calls.append((texts, sorted(disable)))
+        return [[_FakeToken(word) for word in text.split()] for text in texts]
+
+
+def test_lemmatization_batched_pipe_and_lemma_cache():
+    """Keywords are lemmatized in one nlp.pipe call and cached across documents."""
+    kw = yake.KeywordExtractor(lan="en", lemmatize=True, lemma_cache_size=3)
+    nlp = kw._lemmatizer_instance = _FakeSpacy()
+
+    keywords = [("Trees", 0.1), ("tree", 0.2), ("forest", 0.3), ("Trees", 0.4)]
+    result = kw._lemmatize_keywords(keywords)
+    assert result == [("Trees", 0.1), ("forest", 0.3)]
+    assert nlp.calls == [(["Trees", "tree", "forest"], ["ner", "parser"])]
+
+    # Known keywords are not lemmatized again; the LRU keeps 3 entries
+    kw._lemmatize_keywords([("forest", 0.1), ("rivers", 0.2)])
+    assert nlp.calls[-1][0] == ["rivers"]
+    assert kw._lemma_cache.keys() == ["tree", "forest", "rivers"]
+    assert kw.worker_params()["lemma_cache_size"] == 3
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: skip-file
+
+"""
+Tests for yake.data.tokenizers module.
+
+The regex backend must reproduce the segtok backend: agreement is measured on
+the bundled multilingual texts, generated documents in several languages and
+hand-picked sentences with abbreviations, contractions, URLs and entities.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+import yake
+from yake.bench import bundled_corpora, generate_document
+from yake.data import DataCore, RegexTokenizer, SegtokTokenizer, Tokenizer, get_tokenizer
+from yake.data.tokenizers import tokenizer_agreement
+
+# Minimum share of segtok's sentences and tokens the regex backend must match
+MIN_AGREEMENT = 0.99
+
+TRICKY_TEXTS = [
+    "Dr. Smith went to Washington D.C. on Jan. 5th, 2020. He didn't like it.",
+    "See https://example.com/a?b=c or mail me at foo.bar@baz.org! It's great (really).",
+    "The U.S.A. is big. e.g. this one; i.e. that one. Prof. Müller's lab — 3.5% growth.",
+    "Ele disse: \"Não sei.\" Depois saiu. O Sr. Silva chegou às 10h30.",
+    "Hyphen-\nated words and \"quotes\" [1]. Mr. O'Neil can't won't. 1. First item 2. Second item",
+    "Der Vertrag wurde am 3. Oktober unterzeichnet. Die Firma z.B. wächst. Das ist's!",
+    "E = mc^2, x+y=3; a/b & c. &amp; entity... ellipsis?! Yes!!! No?? ok.",
+]
+
+
+@pytest.mark.parametrize("lan", sorted(bundled_corpora()))
+def test_regex_agreement_on_bundled_texts(lan):
+    texts = [text for _, text in bundled_corpora()[lan]]
+    agreement = tokenizer_agreement(texts, "regex")
+    assert agreement["sentences"] > 0
+    assert agreement["sentence_agreement"] >= MIN_AGREEMENT
+    assert agreement["token_agreement"] >= MIN_AGREEMENT
+
+
+@pytest.mark.parametrize("lan", ["en", "pt", "de", "fr", "es", "it"])
+def test_regex_agreement_on_generated_texts(lan):
+    texts = [generate_document(1000, lan, seed) for seed in range(3)]
+    agreement = tokenizer_agreement(texts, "regex")
+    assert agreement["sentence_agreement"] >= MIN_AGREEMENT
+    assert agreement["token_agreement"] >= MIN_AGREEMENT
+
+
+def test_regex_matches_segtok_on_tricky_texts():
+    regex, segtok = RegexTokenizer(), SegtokTokenizer()
+    for text in TRICKY_TEXTS:
+        assert regex.tokenize_sentences(text) == segtok.tokenize_sentences(text)
+    assert tokenizer_agreement(TRICKY_TEXTS, "regex")["token_agreement"] == 1.0
+
+    # segtok keeps trailing punctuation on URLs; so does the regex backend
+    tokens = regex.tokenize("He didn't visit https://example.com/x, did he?")
+    assert tokens == ["He", "did", "n't", "visit", "https://example.com/x,", "did", "he", "?"]
+
+
+def test_get_tokenizer():
+    assert get_tokenizer() is get_tokenizer("segtok")
+    assert isinstance(get_tokenizer("regex"), RegexTokenizer)
+    custom = RegexTokenizer()
+    assert get_tokenizer(custom) is custom
+    with pytest.raises(ValueError, match="Unknown tokenizer"):
+        get_tokenizer("whitespace")
+    with pytest.raises(ValueError, match="Unknown tokenizer"):
+        yake.KeywordExtractor(tokenizer="whitespace")
+
+
+def test_incomplete_backend_fails_on_creation():
+    class SentencesOnly(Tokenizer):
+        def split_sentences(self, text):
+            return [text]
+
+    with pytest.raises(TypeError):
+        SentencesOnly()
+    with pytest.raises(TypeError):
+        Tokenizer()
+
+
+def test_datacore_tokenizer_backends_and_stream():
+    text = " ".join(text for texts in bundled_corpora().values() for _, text in texts)
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+    segtok = DataCore(text, stopwords, {"n": 3})
+    regex = DataCore(text, stopwords, {"n": 3, "tokenizer": "regex"})
+    assert segtok.tokenizer.name == "segtok" and regex.tokenizer.name == "regex"
+    assert regex.sentences_str == segtok.sentences_str
+
+    # Incremental building cuts at the regex backend's own segments
+    stream = DataCore(None, stopwords, {"n": 3, "tokenizer": "regex"})
+    for start in range(0, len(text), 97):
+        stream.feed(text[start:start + 97])
+    stream.finalize()
+    assert stream.number_of_sentences == regex.number_of_sentences
+    assert stream.number_of_words == regex.number_of_words
+    assert set(stream.candidates) == set(regex.candidates)
+
+
+def test_extractor_regex_tokenizer_keywords():
+    for lan, texts in bundled_corpora().items():
+        for _, text in texts:
+            segtok = yake.KeywordExtractor(lan=lan).extract_keywords(text)
+            regex = yake.KeywordExtractor(lan=lan, tokenizer="regex").extract_keywords(text)
+            assert regex == segtok
+
+    extractor = yake.KeywordExtractor(tokenizer="regex")
+    assert extractor.worker_params()["tokenizer"] == "regex"
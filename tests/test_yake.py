@@ -8,10 +8,11 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+import pytest
 from click.testing import CliRunner
 
 import yake
-from yake.core.highlight import TextHighlighter
+from yake.core.highlight import KeywordMatcher, TextHighlighter
 
 
 def test_phraseless_example():
@@ -943,7 +944,7 @@ def test_iso_encoding_fallback():
     # which is complex in a test environment. We verify the method exists.
     extractor = yake.KeywordExtractor(lan="en")
     stopwords = extractor._load_stopwords(None)
-    assert isinstance(stopwords, set)
+    assert isinstance(stopwords, frozenset)
     assert len(stopwords) > 0
 
 
@@ -1730,3 +1731,1122 @@ def test_negative_scores_preserved():
             f"Scores not properly ordered: {scores[i]} > {scores[i + 1]}"
 
 
+
+
+def test_extract_keywords_batch_matches_sequential():
+    """Batch extraction keeps input order and matches per-document results."""
+    docs = [
+        "Google is acquiring data science community Kaggle.",
+        "",
+        "Machine learning competitions are hosted on the Kaggle platform.",
+        None,
+        "Python programming language and data science tools.",
+    ]
+    extractor = yake.KeywordExtractor(lan="en", n=2, top=5)
+    expected = [extractor.extract_keywords(doc) for doc in docs]
+
+    assert extractor.extract_keywords_batch(docs, workers=1) == expected
+    assert extractor.extract_keywords_batch(iter(docs), workers=2, chunksize=1) == expected
+
+
+def test_extract_keywords_batch_custom_stopwords():
+    """Workers are initialised with the extractor's custom stopwords."""
+    docs = ["machine learning is powerful", "deep learning is popular"]
+    extractor = yake.KeywordExtractor(lan="en", n=1, top=5, stopwords={"learning", "is"})
+
+    params = extractor.worker_params()
+    assert params["stopwords"] == {"learning", "is"}
+    assert yake.KeywordExtractor(lan="en").worker_params()["stopwords"] is None
+
+    results = extractor.extract_keywords_batch(docs, workers=2)
+    assert results == [extractor.extract_keywords(doc) for doc in docs]
+    assert all(kw != "learning" for doc_result in results for kw, _ in doc_result)
+
+
+def test_cooccurrence_graph_matches_networkx():
+    """The compact co-occurrence store gives the same metrics as a DiGraph."""
+    import networkx as nx
+    from yake.data import DataCore, CooccurrenceGraph
+
+    text = "data science and data mining. Data science is fun, data data science."
+    dc = DataCore(text=text, stopword_set={"and", "is"}, config={"windows_size": 2, "n": 3})
+    assert isinstance(dc.g, CooccurrenceGraph)
+
+    reference = nx.DiGraph()
+    reference.add_nodes_from(range(dc.g.number_of_nodes()))
+    for left, right, weight in dc.g.edges():
+        reference.add_edge(left, right, tf=weight)
+    assert dc.g.number_of_edges() == reference.number_of_edges()
+
+    for term in dc.terms.values():
+        compact = term.get_graph_metrics()
+        nx_term = yake.SingleWord(term.unique_term, term.id, reference)
+        assert compact == nx_term.get_graph_metrics()
+        for left, right in reference.edges():
+            assert dc.g.has_edge(left, right)
+            assert dc.g[left][right]["tf"] == reference[left][right]["tf"]
+
+    # Unknown nodes behave like isolated nodes
+    assert not dc.g.has_edge(10_000, 0)
+    assert dc.g.node_metrics(10_000) == (0, 0.0, 0, 0.0)
+
+
+def test_vectorized_single_term_features_match_scalar():
+    """The NumPy term feature engine reproduces the per-term scores exactly."""
+    from yake.data import DataCore
+
+    text = (
+        "Google is acquiring data science community Kaggle. Sources tell us that "
+        "Google is acquiring Kaggle, a platform that hosts data science and machine "
+        "learning competitions. Kaggle co-founder CEO Anthony Goldbloom declined."
+    ) * 3
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+    config = {"windows_size": 1, "n": 3}
+
+    scalar = DataCore(text=text, stopword_set=stopwords, config=config)
+    scalar.build_single_terms_features()
+
+    vectorized = DataCore(text=text, stopword_set=stopwords, config=config)
+    arrays = vectorized.term_feature_arrays()
+    assert len(arrays["h"]) == len(vectorized.terms)
+    vectorized.build_single_terms_features(vectorized=True)
+
+    for key, term in scalar.terms.items():
+        other = vectorized.terms[key]
+        for metric in ("wrel", "wfreq", "wspread", "wcase", "wpos", "pl", "pr", "h"):
+            assert other.get_metric(metric) == term.get_metric(metric), (key, metric)
+        assert arrays["h"][term.id] == term.h
+
+
+def test_vectorized_extraction_matches_default():
+    """KeywordExtractor(vectorized=True) returns the same keywords."""
+    text = "data science and machine learning. Data science is fun! " * 20
+    for features in (None, ["wfreq", "wpos"]):
+        default = yake.KeywordExtractor(lan="en", n=3, top=10, features=features)
+        fast = yake.KeywordExtractor(lan="en", n=3, top=10, features=features, vectorized=True)
+        assert fast.extract_keywords(text) == default.extract_keywords(text)
+
+
+def test_vectorized_candidate_scores_match_update_h():
+    """The batched n-gram scorer matches ComposedWord.update_h exactly."""
+    from yake.data import DataCore
+
+    text = (
+        "The quality of the new version of the system is much better than before. "
+        "This is a test of the ability of the algorithm to handle phrases. "
+        "The system of the year is the best system of all."
+    ) * 2
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+    config = {"windows_size": 2, "n": 5}
+
+    dc = DataCore(text=text, stopword_set=stopwords, config=config)
+    dc.build_single_terms_features()
+    candidates = [c for c in dc.candidates.values() if c.is_valid()]
+    assert any(t.stopword for c in candidates for t in c.terms)
+
+    for features in (None, ["wfreq"]):
+        arrays = dc.candidate_feature_arrays(candidates, features=features)
+        dc.build_mult_terms_features(features=features)
+        assert arrays["h"].tolist() == [c.h for c in candidates]
+
+    # The DataCore setting switches build_mult_terms_features to the batched path
+    fast = DataCore(text=text, stopword_set=stopwords, config=dict(config, vectorized=True))
+    fast.build_single_terms_features()
+    fast.build_mult_terms_features()
+    dc.build_mult_terms_features()
+    assert [c.h for c in fast.candidates.values()] == [c.h for c in dc.candidates.values()]
+
+
+def test_incremental_datacore_matches_one_shot():
+    """DataCore.feed()/finalize() builds the same data as the one-shot path."""
+    import random
+    from yake.data import DataCore
+
+    text = (
+        "Dr. Smith went to Washington. he said (e.g. this one) is it.\n\n"
+        "  Next paragraph? Yes! \"Quoted.\" Then the U.S.A. etc.\tTabbed text\n"
+        "line two\n\n\n Capital Line\n   lower line. Google is acquiring Kaggle, "
+        "a platform that hosts data science and machine learning competitions."
+    ) * 3
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+
+    def snapshot(dc):
+        return (
+            dc.number_of_sentences,
+            dc.number_of_words,
+            {key: (term.id, term.tf, term.occurs) for key, term in dc.terms.items()},
+            [(key, cand.tf) for key, cand in dc.candidates.items()],
+            sorted(dc.g.edges()),
+        )
+
+    expected = snapshot(DataCore(text=text, stopword_set=stopwords))
+    rng = random.Random(42)
+    for _ in range(10):
+        dc = DataCore(text=None, stopword_set=stopwords)
+        position = 0
+        while position < len(text):
+            size = rng.choice([1, 2, 5, 13, 40, 200])
+            dc.feed(text[position:position + size])
+            position += size
+        dc.finalize()
+        assert snapshot(dc) == expected
+        assert not dc.sentences_obj
+
+    with pytest.raises(RuntimeError):
+        dc.feed("more text")
+
+
+def test_extract_keywords_stream_matches_extract_keywords():
+    """Streaming extraction returns the same keywords as the one-shot call."""
+    text = (
+        "Google is acquiring data science community Kaggle. Sources tell us that "
+        "Google is acquiring Kaggle, a platform that hosts data science and machine "
+        "learning competitions.\nDetails about the transaction remain somewhat vague, "
+        "but given that Google is hosting its Cloud Next conference in San Francisco."
+    ) * 4
+    extractor = yake.KeywordExtractor(lan="en", n=3, top=10)
+    chunks = [text[i:i + 37] for i in range(0, len(text), 37)]
+    assert extractor.extract_keywords_stream(chunks) == extractor.extract_keywords(text)
+    assert extractor.extract_keywords_stream(iter(text.splitlines(True))) == (
+        extractor.extract_keywords(text)
+    )
+    assert extractor.extract_keywords_stream([]) == []
+
+
+def test_pre_filter_streaming_matches_one_shot():
+    """iter_pre_filter() yields exactly pre_filter() for any chunking."""
+    from yake.data.utils import pre_filter, iter_pre_filter
+
+    text = "First Line\n  second line\n\n\tThird\n \n  \nlast\tline\nEnd"
+    expected = pre_filter(text)
+    assert expected == (
+        "\n\nFirst Line   second line \n\n Third      last line\n\nEnd"
+    )
+    for size in range(1, len(text) + 1):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert "".join(iter_pre_filter(chunks)) == expected
+    assert "".join(iter_pre_filter([])) == pre_filter("")
+
+
+def test_pre_filter_scales_linearly():
+    """pre_filter() runtime grows linearly with the number of lines."""
+    import time
+    from yake.data.utils import pre_filter
+
+    def best_time(text):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            pre_filter(text)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    line = "Short line\nand a continuation\n"
+    small = best_time(line * 20000)
+    large = best_time(line * 160000)
+
+    # 8x the input; a quadratic implementation would take ~64x as long
+    assert large / small < 24, f"pre_filter scaled by {large / small:.1f}x for 8x input"
+
+
+def test_candidate_table_matches_per_occurrence_candidates():
+    """Candidates counted by word ids equal one ComposedWord merged per occurrence."""
+    from yake.data import DataCore, ComposedWord
+
+    text = (
+        "The Data. the data 12 data 1,2 The DATA x1y The Data science. "
+        "Data science is fun; DATA SCIENCE is the data science of data."
+    )
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+    dc = DataCore(text=text, stopword_set=stopwords, config={"n": 3})
+
+    expected = {}
+    for sentence in dc.sentences_obj:
+        for block in sentence:
+            for end in range(len(block)):
+                for start in range(end, max(-1, end - 3), -1):
+                    cand = ComposedWord(block[start:end + 1])
+                    if cand.unique_kw in expected:
+                        expected[cand.unique_kw].update_cand(cand)
+                    else:
+                        expected[cand.unique_kw] = cand
+                    expected[cand.unique_kw].tf += 1.0
+
+    assert list(dc.candidates) == list(expected)
+    for key, cand in dc.candidates.items():
+        other = expected[key]
+        assert (cand.kw, cand.tags, cand.tf) == (other.kw, other.tags, other.tf)
+        assert [t.id for t in cand.terms] == [t.id for t in other.terms]
+    assert dc.candidates["data"].tags == {"p", "n", "a"}
+
+
+def test_iter_by_score_matches_stable_sort():
+    """Heap-based ranking yields candidates exactly in stable sorted order."""
+    import random
+    from types import SimpleNamespace
+
+    rng = random.Random(0)
+    candidates = [SimpleNamespace(h=rng.choice([0.1, 0.25, 0.5, 1.0, rng.random()]))
+                  for _ in range(500)]
+    ranked = list(yake.KeywordExtractor._iter_by_score(candidates))
+    expected = sorted(candidates, key=lambda c: c.h)
+    assert [id(c) for c in ranked] == [id(c) for c in expected]
+
+
+def test_top_k_selection_without_deduplication():
+    """Top-k selection without dedup equals slicing the fully sorted list."""
+    text = "data science and machine learning. Data science is fun! " * 20
+    full = yake.KeywordExtractor(lan="en", n=3, dedup_lim=1.0, top=1000).extract_keywords(text)
+    for top in (1, 5, 10):
+        extractor = yake.KeywordExtractor(lan="en", n=3, dedup_lim=1.0, top=top)
+        assert extractor.extract_keywords(text) == full[:top]
+
+
+def test_dedup_index_proposes_every_near_duplicate():
+    """The blocking index never hides a pair the similarity would reject."""
+    import random
+    from yake.core.dedup import DedupIndex
+
+    rng = random.Random(5)
+    extractor = yake.KeywordExtractor()
+    for method in ("levs", "jaro", "seqm"):
+        similarity = getattr(extractor, method)
+        for threshold in (0.5, 0.8, 0.9):
+            index = DedupIndex(method, threshold)
+            accepted = []
+            for _ in range(150):
+                keyword = "".join(rng.choice("abcd ") for _ in range(rng.randint(1, 10))).strip()
+                if not keyword:
+                    continue
+                proposed = index.candidates(keyword)
+                assert proposed == [kw for kw in accepted if kw in proposed]
+                for other in accepted:
+                    if similarity(keyword, other) > threshold:
+                        assert other in proposed, (method, threshold, keyword, other)
+                if keyword not in accepted and rng.random() < 0.5:
+                    accepted.append(keyword)
+                    index.add(keyword)
+
+
+def test_dedup_index_keeps_keywords():
+    """Extraction with the dedup index returns the same keywords."""
+    text = (
+        "Google is acquiring data science community Kaggle. Sources tell us that "
+        "Google is acquiring Kaggle, a platform that hosts data science and machine "
+        "learning competitions. Kaggle co-founder CEO Anthony Goldbloom declined."
+    ) * 5
+    for dedup_func in ("levs", "jaro", "seqm"):
+        for dedup_lim in (0.6, 0.9):
+            results = [
+                yake.KeywordExtractor(
+                    lan="en", top=100, dedup_func=dedup_func, dedup_lim=dedup_lim,
+                    dedup_index=enabled,
+                ).extract_keywords(text)
+                for enabled in (False, True)
+            ]
+            assert results[0] == results[1]
+
+
+def test_bit_parallel_levenshtein_matches_dynamic_programming():
+    """The bit-vector distance equals the textbook dynamic program."""
+    import random
+    from yake.core.Levenshtein import Levenshtein
+
+    def reference(a, b):
+        previous = list(range(len(b) + 1))
+        for i, char_a in enumerate(a, 1):
+            current = [i] + [0] * len(b)
+            for j, char_b in enumerate(b, 1):
+                current[j] = min(current[j - 1] + 1, previous[j] + 1,
+                                 previous[j - 1] + (char_a != char_b))
+            previous = current
+        return previous[-1]
+
+    rng = random.Random(1)
+    for _ in range(2000):
+        a = "".join(rng.choice("abcé ") for _ in range(rng.randint(1, 12)))
+        b = "".join(rng.choice("abcé ") for _ in range(rng.randint(0, 12)))
+        assert Levenshtein._bit_parallel_distance(a, b) == reference(a, b)
+
+    # Long strings use Python integers wider than a machine word
+    a = "abcdefghij" * 10
+    b = "abcdefghij" * 9 + "abcdefXhij"
+    assert Levenshtein.distance(a, b) == 1
+
+
+def test_levenshtein_distance_many():
+    """The NumPy batch gives the same distances as the scalar method."""
+    import random
+    from yake.core.Levenshtein import Levenshtein
+
+    rng = random.Random(3)
+    for length in (0, 1, 5, 20, 64, 70):
+        seq = "".join(rng.choice("abcd") for _ in range(length))
+        others = ["".join(rng.choice("abcde") for _ in range(rng.randint(0, 40)))
+                  for _ in range(25)]
+        expected = [Levenshtein.distance(seq, other) for other in others]
+        assert Levenshtein.distance_many(seq, others).tolist() == expected
+    assert Levenshtein.distance_many("abc", []).tolist() == []
+
+
+def test_levenshtein_distance_at_most_and_is_similar():
+    """Bounded distance and threshold tests agree with the full computation."""
+    import random
+    from yake.core.Levenshtein import Levenshtein
+
+    rng = random.Random(11)
+    for _ in range(2000):
+        a = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 12)))
+        b = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 12)))
+        full = Levenshtein._bit_parallel_distance(a, b) if a else len(b)
+        for bound in (0, 1, 2, 4):
+            assert Levenshtein.distance_at_most(a, b, bound) == min(full, bound + 1)
+        if a or b:
+            for threshold in (0.0, 0.5, 0.75, 0.9):
+                assert Levenshtein.is_similar(a, b, threshold) == (
+                    Levenshtein.ratio(a, b) > threshold
+                )
+
+    extractor = yake.KeywordExtractor(dedup_func="levs", dedup_lim=0.8)
+    assert extractor.is_similar("machine learning", "machine learnings")
+    assert not extractor.is_similar("machine learning", "data science")
+    jaro = yake.KeywordExtractor(dedup_func="jaro", dedup_lim=0.8)
+    assert jaro.is_similar("kaggle", "kagle") == (jaro.jaro("kaggle", "kagle") > 0.8)
+
+
+def test_stopword_registry_shares_language_sets():
+    """Extractors of one language share a single frozenset."""
+    from yake.core import stopwords as registry
+
+    first = yake.KeywordExtractor(lan="en")
+    second = yake.KeywordExtractor(lan="english", n=2)
+    assert first.stopword_set is second.stopword_set
+    assert isinstance(first.stopword_set, frozenset)
+    assert "en" in registry.loaded_languages()
+    assert registry.resolve_language("xx") == registry.FALLBACK_LANGUAGE
+
+    # Resolution touches the file system once per language
+    import unittest.mock
+
+    with unittest.mock.patch.object(registry.os.path, "exists", side_effect=AssertionError):
+        assert registry.resolve_language("xx") == registry.FALLBACK_LANGUAGE
+        yake.KeywordExtractor(lan="english")
+
+    # Shared sets are immutable: callers add words through extra_stopwords
+    with pytest.raises(AttributeError):
+        first.stopword_set.add("kaggle")
+
+    # Extra stopwords copy the shared set only when they add something
+    same = yake.KeywordExtractor(lan="en", extra_stopwords=["the"])
+    assert same.stopword_set is first.stopword_set
+    extended = yake.KeywordExtractor(lan="en", extra_stopwords=["Kaggle"])
+    assert "kaggle" in extended.stopword_set
+    assert "kaggle" not in first.stopword_set
+    assert extended.stopword_set >= first.stopword_set
+
+
+def test_stopword_pack_matches_text_files(tmp_path):
+    """The compiled pack holds exactly the lists read from the text files."""
+    from yake.core import stopwords as registry
+
+    languages = registry.text_languages()
+    assert len(languages) == 35  # 34 languages plus the language-agnostic list
+    from_text = {code: registry._read_text_list(registry._text_path(code)) for code in languages}
+
+    pack_path = registry.build_pack(str(tmp_path / "stopwords.pack"))
+    try:
+        registry.clear_registry()
+        assert registry.load_pack(pack_path)
+        for code in languages:
+            assert registry._pack_list(code) == from_text[code]
+        assert registry.get_stopwords("pt") == from_text["pt"]
+        assert registry.get_stopwords("xx") == from_text[registry.FALLBACK_LANGUAGE]
+    finally:
+        registry.clear_registry()
+
+    assert not registry.load_pack(str(tmp_path / "missing.pack"))
+    registry.clear_registry()
+
+
+def test_extract_keywords_async_matches_sync():
+    """Async extraction gives the sync results in thread and process pools."""
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    docs = [
+        "Google is acquiring data science community Kaggle.",
+        "",
+        "Machine learning competitions are hosted on the Kaggle platform.",
+        "Python programming language and data science tools.",
+    ]
+    extractor = yake.KeywordExtractor(lan="en", n=2, top=5)
+    expected = [extractor.extract_keywords(doc) for doc in docs]
+
+    async def run():
+        single = await extractor.extract_keywords_async(docs[0], timeout=30)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            threaded = [
+                item async for item in extractor.extract_keywords_batch_async(
+                    docs, executor=pool, max_concurrency=2)
+            ]
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            in_process = await extractor.extract_keywords_async(docs[2], executor=pool)
+            unordered = [
+                item async for item in extractor.extract_keywords_batch_async(
+                    iter(docs), executor=pool, ordered=False)
+            ]
+        owned = [
+            item async for item in extractor.extract_keywords_batch_async(docs, executor="process")
+        ]
+        return single, threaded, in_process, unordered, owned
+
+    single, threaded, in_process, unordered, owned = asyncio.run(run())
+    assert single == expected[0]
+    assert threaded == list(enumerate(expected))
+    assert in_process == expected[2]
+    assert sorted(unordered) == sorted(enumerate(expected))
+    assert owned == list(enumerate(expected))
+
+    # Workers of an executor made for the extractor build it at start, so
+    # tasks only carry the configuration digest
+    from yake.core.aio import _extraction_caller, create_executor
+
+    with create_executor("process", 1, extractor) as pool:
+        call = _extraction_caller(extractor, pool)(docs[0])
+        assert call.args[1] is None
+        assert pool.submit(call).result() == expected[0]
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        assert _extraction_caller(extractor, pool)(docs[0]).args[1] is not None
+
+
+def test_extract_keywords_batch_async_backpressure_and_timeouts():
+    """Pending work stays within the limit; timeouts and early exits are handled."""
+    import asyncio
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    extractor = yake.KeywordExtractor(lan="en", top=3)
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0, "calls": 0}
+
+    def slow_extract(text):
+        if text == "slow":
+            # Outlives its timeout; the thread finishes in the background
+            time.sleep(0.5)
+            return [(text, 0.1)]
+        with lock:
+            state["running"] += 1
+            state["calls"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+        return [(text, 0.1)]
+
+    extractor.extract_keywords = slow_extract
+
+    async def texts():
+        for index in range(20):
+            yield "slow" if index == 3 else f"doc {index}"
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = [
+                item async for item in extractor.extract_keywords_batch_async(
+                    texts(), executor=pool, max_concurrency=3, timeout=0.2,
+                    return_exceptions=True)
+            ]
+            with pytest.raises(asyncio.TimeoutError):
+                async for _ in extractor.extract_keywords_batch_async(
+                        ["slow"], executor=pool, timeout=0.05):
+                    pass
+
+            # Leaving the loop early stops reading the input
+            state["calls"] = 0
+            batch = extractor.extract_keywords_batch_async(
+                (f"doc {i}" for i in range(1000)), executor=pool, max_concurrency=2)
+            async for index, _ in batch:
+                if index == 1:
+                    break
+            await batch.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert [index for index, _ in results] == list(range(20))
+    assert isinstance(results[3][1], asyncio.TimeoutError)
+    assert results[4][1] == [("doc 4", 0.1)]
+    assert state["peak"] <= 3
+    assert state["calls"] <= 4
+
+
+def test_cli_batch_inputs(tmp_path):
+    """The CLI streams one result per document for every batch input."""
+    import json
+    from yake.cli import keywords
+
+    docs = {
+        "a": "Google is acquiring data science community Kaggle.",
+        "b": "Machine learning competitions are hosted on the Kaggle platform.",
+    }
+    extractor = yake.KeywordExtractor(lan="en", top=3)
+    expected = {doc_id: extractor.extract_keywords(text) for doc_id, text in docs.items()}
+    runner = CliRunner()
+
+    def parse(output):
+        records = [json.loads(line) for line in output.splitlines()]
+        return {
+            record["id"]: [(kw["keyword"], kw["score"]) for kw in record["keywords"]]
+            for record in records
+        }
+
+    stdin = "".join(json.dumps({"id": k, "text": v}) + "\n" for k, v in docs.items())
+    result = runner.invoke(keywords, ["--jsonl", "-t", "3", "-j", "2"], input=stdin)
+    assert result.exit_code == 0, result.output
+    assert parse(result.output) == expected
+
+    for doc_id, text in docs.items():
+        (tmp_path / f"{doc_id}.txt").write_text(text, encoding="utf-8")
+    result = runner.invoke(keywords, ["-d", str(tmp_path), "-t", "3", "--keep-order"])
+    assert result.exit_code == 0, result.output
+    assert parse(result.output) == {
+        str(tmp_path / f"{doc_id}.txt"): kws for doc_id, kws in expected.items()
+    }
+    result = runner.invoke(keywords, ["-g", str(tmp_path / "b*.txt"), "-t", "3"])
+    assert list(parse(result.output)) == [str(tmp_path / "b.txt")]
+
+    result = runner.invoke(
+        keywords, ["--lines", "-t", "3", "-f", "csv"], input=docs["a"] + "\n\n" + docs["b"] + "\n"
+    )
+    assert result.exit_code == 0, result.output
+    rows = result.output.splitlines()
+    assert rows[0] == "id,rank,keyword,score"
+    assert [row.split(",")[:3] for row in rows[1:]] == [
+        [str(line), str(rank), kw]
+        for line, doc_id in ((1, "a"), (3, "b"))
+        for rank, (kw, _) in enumerate(expected[doc_id], start=1)
+    ]
+
+    # A record with a non-string text is reported and the batch goes on
+    bad = json.dumps({"id": "bad", "text": 5}) + "\n" + stdin
+    result = runner.invoke(keywords, ["--jsonl", "-t", "3", "--keep-order"], input=bad)
+    assert result.exit_code == 1
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert records[0] == {"id": "bad", "error": 'Line 1: "text" must be a string, not int'}
+    assert parse("\n".join(result.stdout.splitlines()[1:])) == expected
+    assert "1 document(s) could not be processed" in result.stderr
+
+    # Malformed lines and non-object lines become error records too
+    lines = [json.dumps({"id": k, "text": v}) for k, v in docs.items()]
+    for bad_line, message in (("not json", "Invalid JSON on line 2"),
+                              ("[1, 2]", "Line 2 is not a JSON object")):
+        stdin = "\n".join([lines[0], bad_line, lines[1]]) + "\n"
+        for jobs in ("1", "2"):
+            result = runner.invoke(keywords, ["--jsonl", "-t", "3", "-j", jobs], input=stdin)
+            assert result.exit_code == 1
+            records = [json.loads(line) for line in result.stdout.splitlines()]
+            errors = [record for record in records if "error" in record]
+            assert len(errors) == 1 and errors[0]["id"] == 2
+            assert errors[0]["error"].startswith(message)
+            assert parse("\n".join(
+                json.dumps(record) for record in records if "error" not in record
+            )) == expected
+
+    result = runner.invoke(keywords, ["--jsonl", "--lines"], input="")
+    assert result.exit_code == 1
+    result = runner.invoke(keywords, ["-ti", "text", "-d", str(tmp_path)])
+    assert result.exit_code == 1
+
+
+def test_result_cache_hits_and_keys(tmp_path):
+    """Cached results match fresh ones and are keyed by text and settings."""
+    path = str(tmp_path / "results.sqlite")
+    text = "Google is acquiring data science community Kaggle. Kaggle hosts competitions."
+    expected = yake.KeywordExtractor(lan="en", top=5).extract_keywords(text)
+
+    extractor = yake.KeywordExtractor(lan="en", top=5, result_cache=path)
+    assert extractor.extract_keywords(text) == expected
+    assert extractor.extract_keywords(text) == expected
+    stats = extractor.get_cache_stats()["result_cache"]
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    # A new process-level instance reuses the file; other settings miss
+    again = yake.KeywordExtractor(lan="en", top=5, result_cache=yake.ResultCache(path))
+    assert again.extract_keywords(text) == expected
+    assert again.result_cache.stats()["hits"] == 1
+    assert yake.KeywordExtractor(lan="en", top=5).get_cache_stats()["result_cache"] is None
+
+    other_keys = {
+        yake.KeywordExtractor(lan="en", top=5)._result_cache_key(text),
+        yake.KeywordExtractor(lan="en", top=4)._result_cache_key(text),
+        yake.KeywordExtractor(lan="en", top=5, lemmatize=True)._result_cache_key(text),
+        yake.KeywordExtractor(lan="en", top=5, extra_stopwords=["kaggle"])._result_cache_key(text),
+        yake.KeywordExtractor(lan="en", top=5)._result_cache_key(text + " "),
+    }
+    assert len(other_keys) == 5
+
+    # The fingerprint is computed once per extractor and covers the source code
+    from yake.core import result_cache
+
+    assert extractor._result_cache_key(text) == extractor._result_cache_key(text)
+    settings = {"top": 5}
+    fingerprint = result_cache.config_fingerprint(settings, "")
+    result_cache.code_digest.cache_clear()
+    original = result_cache.PACKAGE_DIR
+    result_cache.PACKAGE_DIR = str(tmp_path)  # Stands for edited scoring code
+    try:
+        assert result_cache.config_fingerprint(settings, "") != fingerprint
+    finally:
+        result_cache.PACKAGE_DIR = original
+        result_cache.code_digest.cache_clear()
+    assert result_cache.config_fingerprint(settings, "") == fingerprint
+
+    # Workers open their own connection to the same file
+    docs = [text, "Machine learning competitions on the Kaggle platform."]
+    assert extractor.extract_keywords_batch(docs, workers=2) == [
+        yake.KeywordExtractor(lan="en", top=5).extract_keywords(doc) for doc in docs
+    ]
+    assert len(extractor.result_cache) == 2
+
+
+def test_result_cache_lru_eviction(tmp_path, monkeypatch):
+    """The stored size stays under the limit by dropping least recently used entries."""
+    import pickle
+    from yake.core import result_cache
+
+    # Hits within ACCESS_RESOLUTION of the last access are read-only
+    coarse = yake.ResultCache(str(tmp_path / "coarse.sqlite"))
+    coarse.put("key", [("keyword", 0.5)])
+    connection = coarse._connect()
+    changes = connection.total_changes
+    assert coarse.get("key") is not None and connection.total_changes == changes
+    coarse.close()
+
+    monkeypatch.setattr(result_cache, "ACCESS_RESOLUTION", 0)
+    cache = yake.ResultCache(str(tmp_path / "lru.sqlite"), max_bytes=400)
+    entry = [("keyword", 0.5)] * 4
+    for index in range(6):
+        cache.put(f"key-{index:02d}", entry)
+        if index == 2:
+            assert cache.get("key-00") is not None  # Refresh the oldest entry
+
+    stats = cache.stats()
+    assert stats["size_bytes"] <= 400
+    assert stats["evictions"] > 0
+    assert cache.get("key-00") == entry
+    assert cache.get("key-01") is None
+    assert cache.get("key-05") == entry
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored.path == cache.path and restored.max_bytes == 400
+    assert restored.get("key-05") == entry
+    restored.clear()
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_extraction_stats_stages_and_counts():
+    """Instrumented extraction records every stage without changing results."""
+    from yake.data import ExtractionStats
+
+    text = (
+        "Google is acquiring data science community Kaggle. Kaggle hosts data "
+        "science and machine learning competitions. Google declined to comment."
+    )
+    plain = yake.KeywordExtractor(lan="en", top=5)
+    assert plain.last_stats is None
+
+    received = []
+    extractor = yake.KeywordExtractor(lan="en", top=5, stats_callback=received.append)
+    assert extractor.extract_keywords(text) == plain.extract_keywords(text)
+    assert plain.last_stats is None
+
+    stats = extractor.last_stats
+    assert isinstance(stats, ExtractionStats)
+    assert received == [stats]
+    assert list(stats.timings) == [
+        "pre_filter", "segmentation", "build", "term_features",
+        "candidate_features", "ranking", "dedup",
+    ]
+    assert all(seconds >= 0 for seconds in stats.timings.values())
+    assert stats.total == pytest.approx(sum(stats.timings.values()))
+    assert stats.counts["sentences"] == 3
+    assert stats.counts["keywords"] == 5
+    assert stats.counts["candidates"] >= stats.counts["valid_candidates"] >= 5
+    assert stats.counts["dedup_comparisons"] == (
+        stats.counts["similarity_cache_hits"] + stats.counts["similarity_cache_misses"]
+    )
+    assert stats.as_dict()["counts"] == stats.counts
+
+    # Each call gets its own record; streaming charges the reading to "build"
+    streamed = yake.KeywordExtractor(lan="en", top=5, dedup_lim=1.0, collect_stats=True)
+    streamed.extract_keywords_stream([text[:40], text[40:]])
+    assert list(streamed.last_stats.timings) == [
+        "build", "term_features", "candidate_features", "ranking",
+    ]
+
+
+def test_bench_corpora_and_scenarios():
+    """Benchmark corpora are deterministic and scenarios sweep one setting at a time."""
+    from yake.bench import PROFILES, bundled_corpora, generate_document, scenario_grid
+
+    document = generate_document(500, "pt", seed=3)
+    assert document == generate_document(500, "pt", seed=3)
+    assert document != generate_document(500, "pt", seed=4)
+    assert len(document.split()) == 500
+    assert {"en", "pt"} <= set(bundled_corpora())
+
+    values = dict(PROFILES["quick"], length=[100, 1000], dedup_func=["seqm", "levs"])
+    sweep = scenario_grid(values)
+    assert sweep[0] == {
+        "corpus": "generated", "length": 100, "lan": "en", "n": 3,
+        "window_size": 1, "top": 20, "dedup_func": "seqm", "threads": 1,
+    }
+    assert len(sweep) == 4  # baseline, bundled, length 1000, levs
+    assert all(s["length"] is None for s in sweep if s["corpus"] == "bundled")
+    assert len(scenario_grid(values, "product")) == 6
+
+    # The thread-scaling profile varies nothing but the thread count
+    threads = scenario_grid(PROFILES["threads"])
+    assert [s["threads"] for s in threads] == [1, 2, 4, 8, 16]
+    assert all(dict(s, threads=1) == threads[0] for s in threads)
+
+
+def test_bench_run_and_compare(tmp_path):
+    """A benchmark run reports latency percentiles and compares with a baseline."""
+    import json
+    from yake.bench import compare_results, run_suite
+
+    scenarios = [
+        {"corpus": "generated", "length": 50, "lan": "en", "n": 2,
+         "window_size": 1, "top": 5, "dedup_func": "levs"},
+        {"corpus": "bundled", "length": None, "lan": "pt", "n": 3,
+         "window_size": 1, "top": 5, "dedup_func": "seqm"},
+        {"corpus": "generated", "length": 50, "lan": "en", "n": 2,
+         "window_size": 1, "top": 5, "dedup_func": "levs", "threads": 2},
+    ]
+    report = run_suite(scenarios, word_budget=200, isolate=False)
+    assert report["meta"]["word_budget"] == 200
+    assert isinstance(report["meta"]["gil_enabled"], bool)
+    first, second, threaded = report["results"]
+    assert first["documents"] == 4 and first["words"] == 200
+    assert second["documents"] == 2
+    assert first["threads"] == 1 and threaded["threads"] == 2
+    assert threaded["words"] == 200 and threaded["words_per_second"] > 0
+    latency = first["latency_ms"]
+    assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert first["words_per_second"] > 0
+
+    path = tmp_path / "bench.json"
+    path.write_text(json.dumps(report), encoding="utf-8")
+    rows = list(compare_results(json.loads(path.read_text(encoding="utf-8")), report))
+    assert [row["speedup"] for row in rows] == [1.0, 1.0, 1.0]
+
+
+def test_datacore_memory_report_and_lean_mode():
+    """Lean data cores keep no sentences or invalid candidates but score the same."""
+    from yake.data import DataCore
+    from yake.bench import generate_document
+
+    text = generate_document(3000, "en", seed=1)
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+    config = {"windows_size": 1, "n": 3}
+    full = DataCore(text, stopwords, config)
+    lean = DataCore(text, stopwords, dict(config, lean=True))
+
+    for dc in (full, lean):
+        dc.build_single_terms_features()
+        dc.build_mult_terms_features()
+    valid = {k: c.h for k, c in full.candidates.items() if c.is_valid()}
+    assert {k: c.h for k, c in lean.candidates.items()} == valid
+    assert list(lean.candidates) == list(valid)
+    assert (lean.number_of_sentences, lean.number_of_words) == (
+        full.number_of_sentences, full.number_of_words
+    )
+    assert lean.sentences_str == [] and lean.sentences_obj == []
+
+    full_report, lean_report = full.memory_report(), lean.memory_report()
+    assert full_report["total"] == sum(v for k, v in full_report.items() if k != "total")
+    assert full_report["sentences_obj"] > 0 and lean_report["sentences_obj"] < 100
+    assert lean_report["candidates"] < full_report["candidates"]
+    assert lean_report["total"] < full_report["total"]
+
+    extractor = yake.KeywordExtractor(lan="en", lean=True)
+    assert extractor.worker_params()["lean"] is True
+    assert extractor.extract_keywords(text) == yake.KeywordExtractor(lan="en").extract_keywords(text)
+
+
+def test_term_table_backs_single_words():
+    """SingleWord objects are views over the document's TermTable."""
+    from yake.data import DataCore, SingleWord, TermTable
+
+    text = "Data science is fun. data mining and DATA science. Science!"
+    dc = DataCore(text=text, stopword_set={"is", "and"}, config={"windows_size": 1, "n": 2})
+    dc.build_single_terms_features()
+    table = dc.term_table
+    assert isinstance(table, TermTable) and len(table) == len(dc.terms)
+
+    data = dc.terms["data"]
+    assert data.occurs == {0: ((0, 0),), 1: ((0, 4), (3, 7))}
+    assert data.tf == table.columns["tf"][data.id] == 3.0
+    assert data["tf_a"] == 1.0 and data.get("missing", 7) == 7
+    assert table.sentence_counts[data.id] == 2
+    assert table.column("h")[data.id] == data.h == data.data["h"]
+    data.set_metric("custom", 0.5)
+    assert data.get_metric("custom") == 0.5 and data.data["custom"] == 0.5
+
+    # Standalone terms keep working on a private table
+    word = SingleWord("kaggle", 0, dc.g)
+    word.add_occur("n", 2, 1, 9)
+    word.add_occur("p", 0, 3, 1)
+    word.add_occur("p", 2, 4, 12)
+    assert word.occurs == {2: ((1, 9), (4, 12)), 0: ((3, 1),)}
+    assert word.tf == 3.0 and word.table.sentence_counts[0] == 2
+    assert word.table is not table and word.stopword is False
+
+
+def test_single_word_data_writes_back_and_occurs_is_read_only():
+    """SingleWord.data writes through to the table; occurs cannot be mutated."""
+    from yake.data import SingleWord
+
+    word = SingleWord("kaggle", 0, None)
+    word.add_occur("n", 1, 2, 5)
+
+    view = word.data
+    view["wfreq"] = 0.25
+    view["stopword"] = True
+    view["custom"] = 3.0
+    assert word.wfreq == word.table.columns["wfreq"][0] == 0.25
+    assert word.stopword is True and word["custom"] == 3.0
+    assert dict(view)["occurs"] == {1: ((2, 5),)} and len(view) == len(dict(view))
+    with pytest.raises(KeyError):
+        view["occurs"] = {}
+    with pytest.raises(KeyError):
+        del view["tf"]
+    del view["custom"]
+    assert "custom" not in word.data
+
+    # Occurrences are recorded through add_occur() only
+    occurs = word.occurs
+    with pytest.raises(TypeError):
+        occurs[2] = ((0, 9),)
+    with pytest.raises(AttributeError):
+        occurs[1].append((3, 6))
+    word.add_occur("p", 1, 3, 6)
+    assert word.occurs == {1: ((2, 5), (3, 6))} and word.tf == 2.0
+
+
+def test_composed_word_tag_flags():
+    """Tag sequences are tracked as flags and validity is cached until they change."""
+    from yake.data import SingleWord
+    from yake.data.composed_word import (
+        ComposedWord, TAG_CLEAN, TAG_DIGIT, TAG_UNUSUAL, tag_flags
+    )
+
+    assert tag_flags("pnp") == TAG_CLEAN
+    assert tag_flags("pdu") == TAG_DIGIT | TAG_UNUSUAL
+
+    words = [SingleWord(word, i, None) for i, word in enumerate(("model", "2024"))]
+    cand = ComposedWord([("p", "model", words[0]), ("d", "2024", words[1])])
+    assert cand.tag_flags == TAG_DIGIT and not cand.is_valid()
+
+    other = ComposedWord([("p", "model", words[0]), ("u", "2024", words[1])])
+    cand.update_cand(other)
+    assert cand.tag_flags == TAG_DIGIT | TAG_UNUSUAL and not cand.is_valid()
+
+    cand.add_tags("pp")
+    assert cand.tags == {"pd", "pu", "pp"}
+    assert cand.tag_flags & TAG_CLEAN and cand.is_valid()
+
+
+def test_striped_counters_across_threads():
+    """Per-thread counters add up exactly and survive their threads."""
+    import threading
+    from yake.core.concurrency import StripedCounters
+
+    counters = StripedCounters(("hits", "misses"))
+
+    def work():
+        local = counters.local()
+        for _ in range(10000):
+            local["hits"] += 1
+        local["misses"] += 1
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counters.totals() == {"hits": 80000, "misses": 8}
+
+    counters.reset()
+    work()
+    assert counters.totals() == {"hits": 10000, "misses": 1}
+
+
+def test_thread_safe_bounded_cache_across_threads():
+    """Lookups and evictions of a shared cache keep its order and budget consistent."""
+    import threading
+    from yake.core.cache import BoundedCache
+
+    cache = BoundedCache(max_entries=64, thread_safe=True)
+
+    def work(offset):
+        for i in range(5000):
+            key = (offset + i) % 200
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Interleave threads as often as possible
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 8 * 5000
+    assert stats["entries"] == len(cache.keys()) == 64
+    assert all(cache.get(key) == key for key in cache.keys())
+
+
+def test_thread_safe_extractor_stress():
+    """A thread-safe extractor shared by many threads gives sequential results."""
+    import pickle
+    from concurrent.futures import ThreadPoolExecutor
+    from yake.bench import generate_document
+
+    docs = [generate_document(400, "en", seed) for seed in range(16)]
+    expected = [yake.KeywordExtractor().extract_keywords(doc) for doc in docs]
+
+    calls = []
+    extractor = yake.KeywordExtractor(thread_safe=True, stats_callback=calls.append)
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Interleave threads as often as possible
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(3):
+                assert list(pool.map(extractor.extract_keywords, docs)) == expected
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    # Statistics are exact: per-call counts add up to the extractor totals
+    stats = extractor.get_cache_stats()
+    assert stats["docs_processed"] == len(calls) == 3 * len(docs)
+    assert stats["hits"] == sum(call.counts["similarity_cache_hits"] for call in calls)
+    assert stats["misses"] == sum(call.counts["similarity_cache_misses"] for call in calls)
+    assert extractor.last_stats is None  # Only worker threads extracted
+
+    extractor.extract_keywords(docs[0])
+    assert extractor.last_stats.counts["keywords"] == len(expected[0])
+
+    copy = pickle.loads(pickle.dumps(extractor))
+    assert copy.thread_safe and copy.extract_keywords(docs[1]) == expected[1]
+    assert extractor.worker_params()["thread_safe"] is True
+
+
+def test_bounded_cache_eviction_and_stats():
+    """Bounded caches evict least recently used entries within their budgets."""
+    import pickle
+    from yake.core.cache import BoundedCache, approximate_size
+
+    cache = BoundedCache(max_entries=3)
+    for key in "abc":
+        cache.put(key, key.upper())
+    assert cache.get("a") == "A"  # "b" is now the least recently used
+    cache.put("d", "D")
+    assert cache.keys() == ["c", "a", "d"]
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["evictions"]) == (3, 1, 1, 1)
+    assert stats["hit_rate"] == 50.0
+
+    entry = approximate_size(("x", "y"), 0.5)
+    sized = BoundedCache(max_bytes=2 * entry)
+    for index in range(5):
+        sized.put((str(index), "y"), 0.5)
+    assert len(sized) == 2 and sized.stats()["bytes"] <= 2 * entry
+    assert sized.stats()["evictions"] == 3
+
+    copy = pickle.loads(pickle.dumps(cache))
+    assert len(copy) == 0 and copy.max_entries == 3
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()["hits"] == 0
+    assert len(BoundedCache(max_entries=0).keys()) == 0
+    with pytest.raises(ValueError):
+        BoundedCache()
+
+
+def test_extractor_caches_stay_warm():
+    """Caches are bounded by eviction instead of being wiped after large documents."""
+    from yake.bench import generate_document
+
+    extractor = yake.KeywordExtractor()
+    large = generate_document(3000, "en", 0)
+    first = extractor.extract_keywords(large)
+    stats = extractor.get_cache_stats()
+    similarity = stats["caches"]["similarity"]
+    assert similarity["entries"] == similarity["misses"] > 0
+    assert stats["caches"]["tags"]["entries"] > 0  # Not cleared after 3000 words
+    assert set(stats["caches"]) == {
+        "similarity", "lemma", "tags", "levenshtein_ratio", "levenshtein_distance",
+    }
+
+    # The same document again is answered from the warm similarity cache
+    assert extractor.extract_keywords(large) == first
+    again = extractor.get_cache_stats()["caches"]["similarity"]
+    assert again["hits"] == similarity["misses"] and again["misses"] == similarity["misses"]
+    assert extractor.get_cache_stats()["docs_processed"] == 2
+
+    small = yake.KeywordExtractor(similarity_cache_size=50)
+    assert small.extract_keywords(large) == first
+    bounded = small.get_cache_stats()["caches"]["similarity"]
+    assert bounded["entries"] == 50 and bounded["evictions"] == bounded["misses"] - 50
+
+    # Clearing one extractor leaves the others and the shared caches warm
+    small.clear_caches()
+    assert small.get_cache_stats()["caches"]["similarity"]["entries"] == 0
+    assert extractor.get_cache_stats()["caches"]["similarity"]["entries"] == similarity["entries"]
+    assert extractor.get_cache_stats()["caches"]["tags"]["entries"] > 0
+    yake.KeywordExtractor.clear_shared_caches()
+    assert extractor.get_cache_stats()["caches"]["tags"]["entries"] == 0
+
+    budget = yake.KeywordExtractor(similarity_cache_size=None, similarity_cache_bytes=20000)
+    budget.extract_keywords(large)
+    assert 0 < budget.get_cache_stats()["caches"]["similarity"]["bytes"] <= 20000
+    assert budget.worker_params()["similarity_cache_bytes"] == 20000
+
+
+def test_highlight_keyword_matcher():
+    matcher = KeywordMatcher(["Data Science", "data", "machine learning", "data"])
+    assert "data science" in matcher and "science" not in matcher
+    assert matcher.index("data") == 1 and len(matcher) == 4
+    with pytest.raises(ValueError):
+        matcher.index("science")
+
+    # Windows are extended only while they can still lead to a keyword
+    tokens = "big data science and machine learning".split(" ")
+    assert matcher.candidate_lengths(tokens, 0, 3) == []
+    assert matcher.candidate_lengths(tokens, 1, 3) == [1, 2]
+    assert matcher.candidate_lengths(tokens, 4, 3) == [2]
+
+    # The matcher is reused while the keywords stay the same
+    th = TextHighlighter(max_ngram_size=3)
+    keywords = ["data science", "machine learning"]
+    assert th.get_matcher(keywords) is th.get_matcher(list(keywords))
+    assert th.get_matcher(["data"]) is not th.get_matcher(keywords)
+
+    # Same output as the window-by-window search, including punctuation
+    # removed across tokens and characters whose case mapping is contextual
+    text = "Visit İstanbul (Turkey) and ΣΟΦΙΑ ΣΟΦΟΣ, then a (b."
+    keywords = ["istanbul (turkey", "i̇stanbul", "σοφια σοφος", "ab", "turkey"]
+    assert th.highlight(text, keywords) == (
+        "Visit <kw>İstanbul</kw> (<kw>Turkey</kw>) and <kw>ΣΟΦΙΑ ΣΟΦΟΣ</kw>, then <kw>ab</kw> (b."
+    )
+    assert TextHighlighter(max_ngram_size=1).highlight(text, ["i̇stanbul", "σοφοσ", "turkey", "σοφος"]) == (
+        "Visit <kw>İstanbul</kw> (<kw>Turkey</kw>) and ΣΟΦΙΑ <kw>ΣΟΦΟΣ</kw>, then a (b."
+    )
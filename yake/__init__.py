@@ -10,6 +10,7 @@ relevant keywords of a text.
 
 # Import the main KeywordExtractor class
 from .core.yake import KeywordExtractor
+from .core.result_cache import ResultCache
 
 # Import data structures (following reference implementation pattern)
 from .data.core import DataCore
@@ -36,6 +37,7 @@ MAX_NGRAM_SIZE = 3
 # Public API (following reference implementation)
 __all__ = [
     'KeywordExtractor',
+    'ResultCache',
     'DataCore',
     'SingleWord',
     'ComposedWord',
@@ -0,0 +1,32 @@
+"""
+Benchmark suite for YAKE keyword extraction.
+
+Run it with ``python -m yake.bench`` (see ``--help``), or from Python:
+
+    >>> from yake.bench import PROFILES, scenario_grid, run_suite
+    >>> report = run_suite(scenario_grid(PROFILES["quick"]))
+
+Reports are plain dictionaries that can be saved as JSON and compared
+across commits with compare_results().
+"""
+
+from .corpus import bundled_corpora, generate_document
+from .runner import (
+    PROFILES,
+    SCENARIO_KEYS,
+    compare_results,
+    run_scenario,
+    run_suite,
+    scenario_grid,
+)
+
+__all__ = [
+    "PROFILES",
+    "SCENARIO_KEYS",
+    "bundled_corpora",
+    "compare_results",
+    "generate_document",
+    "run_scenario",
+    "run_suite",
+    "scenario_grid",
+]
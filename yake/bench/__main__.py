@@ -0,0 +1,102 @@
+"""Command line entry point of the YAKE benchmark suite (python -m yake.bench)."""
+
+import json
+import sys
+import click
+from tabulate import tabulate
+from .runner import (
+    DEFAULT_WORD_BUDGET,
+    PROFILES,
+    SCENARIO_KEYS,
+    compare_results,
+    run_suite,
+    scenario_grid,
+)
+
+
+def _split(values, convert=str):
+    """Parse a comma-separated option value."""
+    return [convert(value) for value in values.split(",") if value.strip()] if values else None
+
+
+def _summary_row(result):
+    """Format one scenario result as a table row."""
+    latency = result["latency_ms"]
+    return dict(
+        {key: result.get(key) for key in SCENARIO_KEYS},
+        docs=result["documents"],
+        words_s=round(result["words_per_second"] or 0),
+        p50_ms=round(latency["p50"], 2),
+        p95_ms=round(latency["p95"], 2),
+        p99_ms=round(latency["p99"], 2),
+        peak_rss_mb=round(result["peak_rss_mb"], 1) if result["peak_rss_mb"] else None,
+    )
+
+
+@click.command()
+@click.option("--profile", default="quick", type=click.Choice(sorted(PROFILES)),
+              help="Default values of every setting")
+@click.option("--grid", default="sweep", type=click.Choice(["sweep", "product"]),
+              help="Vary one setting at a time, or run every combination")
+@click.option("--corpus", help="Corpora, comma-separated (generated, bundled)")
+@click.option("--lengths", help="Generated document lengths in words, comma-separated")
+@click.option("--languages", help="Languages, comma-separated")
+@click.option("--ngrams", help="Maximum n-gram sizes, comma-separated")
+@click.option("--windows", help="Window sizes, comma-separated")
+@click.option("--tops", help="Numbers of keywords, comma-separated")
+@click.option("--dedup", help="Deduplication functions, comma-separated")
+@click.option("--threads", help="Threads sharing one extractor, comma-separated")
+@click.option("--words", default=DEFAULT_WORD_BUDGET, type=int,
+              help="Words per scenario for generated corpora")
+@click.option("--repeat", default=1, type=int, help="Timed passes over each corpus")
+@click.option("--seed", default=0, type=int, help="Seed of the generated documents")
+@click.option("--isolate/--no-isolate", default=True,
+              help="Run each scenario in a fresh process (default) or in this one")
+@click.option("-o", "--output", help="Write the JSON report to this file ('-' = stdout)")
+@click.option("--compare", "baseline", type=click.File(encoding="utf-8"),
+              help="JSON report of an earlier run to compare with")
+def main(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    profile, grid, corpus, lengths, languages, ngrams, windows, tops, dedup, threads,
+    words, repeat, seed, isolate, output, baseline,
+):
+    """Benchmark YAKE over generated and bundled corpora."""
+    values = dict(PROFILES[profile])
+    overrides = {
+        "corpus": _split(corpus),
+        "length": _split(lengths, int),
+        "lan": _split(languages),
+        "n": _split(ngrams, int),
+        "window_size": _split(windows, int),
+        "top": _split(tops, int),
+        "dedup_func": _split(dedup),
+        "threads": _split(threads, int),
+    }
+    values.update({key: value for key, value in overrides.items() if value})
+    scenarios = scenario_grid(values, grid)
+
+    # Progress goes to stderr so that stdout can carry the JSON report
+    def progress(result):
+        row = _summary_row(result)
+        click.echo(" ".join(f"{key}={value}" for key, value in row.items()), err=True)
+
+    click.echo(f"Running {len(scenarios)} scenarios", err=True)
+    report = run_suite(scenarios, word_budget=words, repeat=repeat, seed=seed,
+                       isolate=isolate, progress=progress)
+
+    if output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        if output:
+            with open(output, "w", encoding="utf-8") as report_file:
+                json.dump(report, report_file, indent=2)
+        click.echo(tabulate([_summary_row(result) for result in report["results"]],
+                            headers="keys"))
+
+    if baseline is not None:
+        rows = list(compare_results(json.load(baseline), report))
+        click.echo(tabulate(rows, headers="keys", floatfmt=".3f"), err=output == "-")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
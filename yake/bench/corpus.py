@@ -0,0 +1,144 @@
+"""
+Benchmark corpora for YAKE.
+
+Two kinds of documents are available:
+
+- bundled: short real texts shipped in the ``corpora`` directory, named
+  ``<language>_<title>.txt``;
+- generated: synthetic documents of any length and language. Sentences mix
+  the language's stopwords with content words drawn from a Zipf
+  distribution. The vocabulary is taken from the bundled texts of the
+  language, completed with pseudo-words. Capitalization and punctuation
+  are included so that every tagging path is exercised.
+
+Generated documents are deterministic: the same length, language and seed
+always give the same text.
+"""
+
+import os
+import random
+from collections import Counter
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Tuple
+
+from yake.core.stopwords import get_stopwords
+
+# Directory holding the bundled texts
+CORPORA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpora")
+
+# Content vocabulary size of generated documents
+VOCABULARY_SIZE = 20000
+
+# Share of stopwords among generated words
+STOPWORD_RATIO = 0.4
+
+# Probability that a generated content word is capitalized mid-sentence
+PROPER_NOUN_RATIO = 0.08
+
+_SYLLABLES = (
+    "ba", "ca", "da", "fe", "ge", "ha", "ki", "lo", "ma", "ne",
+    "no", "pa", "qui", "ra", "ri", "sa", "se", "ta", "to", "tu",
+    "va", "vi", "xa", "zo", "ar", "en", "il", "or", "us", "an",
+)
+
+
+def bundled_corpora() -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Load the bundled texts.
+
+    Returns:
+        Dictionary mapping language codes to lists of (name, text) tuples
+    """
+    corpora: Dict[str, List[Tuple[str, str]]] = {}
+    for filename in sorted(os.listdir(CORPORA_DIR)):
+        if not filename.endswith(".txt"):
+            continue
+        lan = filename.split("_", 1)[0]
+        with open(os.path.join(CORPORA_DIR, filename), encoding="utf-8") as corpus_file:
+            corpora.setdefault(lan, []).append((filename[:-4], corpus_file.read()))
+    return corpora
+
+
+def _pseudo_word(index: int) -> str:
+    """Build the index-th pseudo-word from syllables (bijective base)."""
+    syllables = []
+    index += len(_SYLLABLES)  # At least two syllables
+    while index:
+        index, digit = divmod(index - 1, len(_SYLLABLES))
+        syllables.append(_SYLLABLES[digit])
+    return "".join(reversed(syllables))
+
+
+@lru_cache(maxsize=None)
+def content_vocabulary(lan: str) -> Tuple[str, ...]:
+    """
+    Get the content words used to generate documents in a language.
+
+    Args:
+        lan: Language code
+
+    Returns:
+        VOCABULARY_SIZE words, most frequent first: words of the bundled
+        texts of the language, then pseudo-words
+    """
+    stopwords = get_stopwords(lan)
+    counts: Counter = Counter()
+    for _, text in bundled_corpora().get(lan, []):
+        for token in text.split():
+            word = token.strip(".,;:!?\"'()[]«»“”").lower()
+            if len(word) > 2 and word.isalpha() and word not in stopwords:
+                counts[word] += 1
+
+    vocabulary = [word for word, _ in counts.most_common(VOCABULARY_SIZE)]
+    seen = set(vocabulary)
+    index = 0
+    while len(vocabulary) < VOCABULARY_SIZE:
+        word = _pseudo_word(index)
+        index += 1
+        if word not in seen and word not in stopwords:
+            vocabulary.append(word)
+    return tuple(vocabulary)
+
+
+@lru_cache(maxsize=None)
+def _zipf_weights(size: int) -> Tuple[float, ...]:
+    """Cumulative Zipf weights for ``size`` ranks."""
+    return tuple(accumulate(1.0 / rank for rank in range(1, size + 1)))
+
+
+def generate_document(num_words: int, lan: str = "en", seed: int = 0) -> str:
+    """
+    Generate a synthetic document.
+
+    Args:
+        num_words: Number of words in the document
+        lan: Language whose stopwords and vocabulary are used
+        seed: Variant of the document
+
+    Returns:
+        Text of about ``num_words`` whitespace-separated words, in sentences
+    """
+    rng = random.Random(f"{lan}:{num_words}:{seed}")
+    vocabulary = content_vocabulary(lan)
+    stopwords = sorted(word for word in get_stopwords(lan) if word.isalpha()) or vocabulary[:100]
+    cum_weights = _zipf_weights(len(vocabulary))
+
+    sentences = []
+    remaining = num_words
+    while remaining > 0:
+        length = min(remaining, rng.randint(6, 24))
+        remaining -= length
+        content = rng.choices(vocabulary, cum_weights=cum_weights, k=length)
+        words = []
+        for position, word in enumerate(content):
+            if rng.random() < STOPWORD_RATIO:
+                word = rng.choice(stopwords)
+            elif rng.random() < PROPER_NOUN_RATIO:
+                word = word.capitalize()
+            if position and rng.random() < 0.05:
+                words[-1] += ","
+            words.append(word)
+        words[0] = words[0].capitalize()
+        sentences.append(" ".join(words) + rng.choice(".....?!"))
+    return " ".join(sentences)
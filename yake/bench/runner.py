@@ -0,0 +1,371 @@
+"""
+Benchmark runner for YAKE.
+
+A scenario is a dictionary of extractor settings plus the corpus to run on:
+
+    {"corpus": "generated", "length": 1000, "lan": "en", "n": 3,
+     "window_size": 1, "top": 20, "dedup_func": "seqm", "threads": 1}
+
+run_scenario() extracts keywords from the scenario's documents once to warm
+up, then ``repeat`` more times while timing every document. It reports
+throughput, latency percentiles and the peak resident set size. By default
+run_suite() runs each scenario in a fresh process, so that peak memory and
+warm caches do not carry over from one scenario to the next.
+
+With more than one thread, the documents are shared out between threads
+that all use one thread-safe extractor. The report records whether the
+interpreter ran with the GIL, so runs on free-threaded CPython (3.13t and
+later) can be told apart from regular ones.
+"""
+
+import datetime
+import logging
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np  # pylint: disable=import-error
+
+from yake.core.concurrency import gil_enabled
+from yake.core.yake import KeywordExtractor
+from .corpus import bundled_corpora, generate_document
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Settings that identify a scenario, in report order
+SCENARIO_KEYS = ("corpus", "length", "lan", "n", "window_size", "top", "dedup_func", "threads")
+
+# Value of settings missing from reports of older versions
+SCENARIO_DEFAULTS = {"threads": 1}
+
+# Values of each setting; the first one is the baseline of a sweep
+PROFILES = {
+    "quick": {
+        "corpus": ["generated", "bundled"],
+        "length": [1000, 100, 10000],
+        "lan": ["en"],
+        "n": [3],
+        "window_size": [1],
+        "top": [20],
+        "dedup_func": ["seqm", "levs", "jaro"],
+        "threads": [1],
+    },
+    "full": {
+        "corpus": ["generated", "bundled"],
+        "length": [1000, 100, 10000, 100000, 1000000],
+        "lan": ["en", "pt", "de"],
+        "n": [3, 1, 2],
+        "window_size": [1, 2],
+        "top": [20, 10, 100],
+        "dedup_func": ["seqm", "levs", "jaro"],
+        "threads": [1, 2, 4, 8],
+    },
+    # Throughput of one extractor shared by more and more threads; meant
+    # to be compared between a regular and a free-threaded interpreter
+    "threads": {
+        "corpus": ["generated"],
+        "length": [1000],
+        "lan": ["en"],
+        "n": [3],
+        "window_size": [1],
+        "top": [20],
+        "dedup_func": ["seqm"],
+        "threads": [1, 2, 4, 8, 16],
+    },
+}
+
+# Words processed per scenario and repetition when sizing generated corpora
+DEFAULT_WORD_BUDGET = 100000
+
+# Upper bound on generated documents per scenario
+MAX_DOCUMENTS = 1000
+
+
+def scenario_grid(values: Dict[str, Sequence[Any]], mode: str = "sweep") -> List[Dict[str, Any]]:
+    """
+    Build the scenarios for lists of setting values.
+
+    Args:
+        values: Values of each setting in SCENARIO_KEYS (settings with a
+            default in SCENARIO_DEFAULTS may be left out)
+        mode: "sweep" varies one setting at a time around the baseline (the
+            first value of each list); "product" runs every combination
+
+    Returns:
+        Unique scenarios, baseline first. The length does not apply to
+        bundled texts, so those scenarios use the baseline length.
+
+    Raises:
+        ValueError: If mode is not "sweep" or "product"
+    """
+    values = dict({key: [value] for key, value in SCENARIO_DEFAULTS.items()}, **values)
+    if mode == "product":
+        combinations = (dict(zip(SCENARIO_KEYS, combo))
+                        for combo in product(*(values[key] for key in SCENARIO_KEYS)))
+    elif mode == "sweep":
+        baseline = {key: values[key][0] for key in SCENARIO_KEYS}
+        combinations = (
+            dict(baseline, **{key: value}) for key in SCENARIO_KEYS for value in values[key]
+        )
+    else:
+        raise ValueError(f"Unknown grid mode: {mode!r} (expected 'sweep' or 'product')")
+
+    scenarios, seen = [], set()
+    for scenario in combinations:
+        if scenario["corpus"] == "bundled":
+            scenario["length"] = None
+        key = tuple(scenario[k] for k in SCENARIO_KEYS)
+        if key not in seen:
+            seen.add(key)
+            scenarios.append(scenario)
+    return scenarios
+
+
+def scenario_documents(
+    scenario: Dict[str, Any], word_budget: int = DEFAULT_WORD_BUDGET, seed: int = 0
+) -> List[str]:
+    """
+    Get the documents of a scenario.
+
+    Args:
+        scenario: Scenario settings
+        word_budget: Approximate number of words for generated corpora
+            (at least one document is always generated)
+        seed: Seed of the generated documents
+
+    Returns:
+        List of document texts
+
+    Raises:
+        ValueError: If there is no bundled text for the scenario's language
+    """
+    if scenario["corpus"] == "bundled":
+        texts = [text for _, text in bundled_corpora().get(scenario["lan"], [])]
+        if not texts:
+            raise ValueError(f"No bundled corpus for language {scenario['lan']!r}")
+        return texts
+
+    length = scenario["length"]
+    count = max(1, min(MAX_DOCUMENTS, word_budget // length))
+    return [generate_document(length, scenario["lan"], seed + index) for index in range(count)]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Get the peak resident set size of the current process.
+
+    Returns:
+        Peak RSS in MiB, or None where the resource module is unavailable
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_scenario(
+    scenario: Dict[str, Any],
+    word_budget: int = DEFAULT_WORD_BUDGET,
+    repeat: int = 1,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Benchmark one scenario in the current process.
+
+    Args:
+        scenario: Scenario settings
+        word_budget: Approximate number of words for generated corpora
+        repeat: Timed passes over the documents
+        seed: Seed of the generated documents
+
+    Returns:
+        The scenario settings plus documents, words, seconds (wall time of
+        the timed passes), docs_per_second, words_per_second, latency_ms
+        (p50, p95, p99, mean, max), rss_before_mb and peak_rss_mb
+    """
+    documents = scenario_documents(scenario, word_budget, seed)
+    words = sum(len(document.split()) for document in documents)
+    threads = scenario.get("threads", 1)
+    extractor = KeywordExtractor(
+        lan=scenario["lan"],
+        n=scenario["n"],
+        window_size=scenario["window_size"],
+        top=scenario["top"],
+        dedup_func=scenario["dedup_func"],
+        thread_safe=threads > 1,
+    )
+    rss_before = peak_rss_mb()
+
+    # Warm up the stopword registry and module-level caches
+    extractor.extract_keywords(documents[0])
+
+    def timed(document):
+        start = time.perf_counter()
+        extractor.extract_keywords(document)
+        return time.perf_counter() - start
+
+    passes = [document for _ in range(max(1, repeat)) for document in documents]
+    started = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            latencies = list(pool.map(timed, passes))
+    else:
+        latencies = [timed(document) for document in passes]
+    elapsed = time.perf_counter() - started
+    milliseconds = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99])
+    return dict(
+        {key: scenario.get(key, SCENARIO_DEFAULTS.get(key)) for key in SCENARIO_KEYS},
+        documents=len(documents),
+        words=words,
+        seconds=elapsed,
+        docs_per_second=len(latencies) / elapsed if elapsed else None,
+        words_per_second=words * max(1, repeat) / elapsed if elapsed else None,
+        latency_ms={
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "mean": float(milliseconds.mean()),
+            "max": float(milliseconds.max()),
+        },
+        rss_before_mb=rss_before,
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def _run_isolated(args: tuple) -> Dict[str, Any]:
+    """Run a scenario in a worker process (helper for run_suite)."""
+    return run_scenario(*args)
+
+
+def run_suite(  # pylint: disable=too-many-arguments
+    scenarios: Sequence[Dict[str, Any]],
+    word_budget: int = DEFAULT_WORD_BUDGET,
+    repeat: int = 1,
+    seed: int = 0,
+    isolate: bool = True,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Benchmark several scenarios.
+
+    Args:
+        scenarios: Scenario settings (see scenario_grid)
+        word_budget: Approximate number of words for generated corpora
+        repeat: Timed passes over each scenario's documents
+        seed: Seed of the generated documents
+        isolate: Run every scenario in a fresh process
+        progress: Function called with each scenario result as it finishes
+
+    Returns:
+        Dictionary with "meta" (environment and settings) and "results"
+    """
+    started = datetime.datetime.now(datetime.timezone.utc)
+    results = []
+    for scenario in scenarios:
+        args = (scenario, word_budget, repeat, seed)
+        if isolate:
+            with multiprocessing.get_context("spawn").Pool(1) as pool:
+                result = pool.apply(_run_isolated, (args,))
+        else:
+            result = run_scenario(*args)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    return {
+        "meta": dict(
+            environment(),
+            started=started.isoformat(),
+            word_budget=word_budget,
+            repeat=repeat,
+            seed=seed,
+            isolated=isolate,
+        ),
+        "results": results,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """Commit of the source tree, if it is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Describe the environment of a benchmark run.
+
+    Returns:
+        Dictionary with the yake version, git commit, Python version and
+        implementation, whether the GIL is enabled, platform and CPU count
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from yake import __version__
+
+    return {
+        "yake_version": __version__,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "gil_enabled": gil_enabled(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def scenario_key(result: Dict[str, Any]) -> tuple:
+    """Identify the scenario of a result, for matching across runs."""
+    return tuple(result.get(key, SCENARIO_DEFAULTS.get(key)) for key in SCENARIO_KEYS)
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Match the scenarios of two runs and compare them.
+
+    Args:
+        baseline: Report of the reference run (as written by run_suite)
+        current: Report of the new run
+
+    Yields:
+        For every scenario in both runs: its settings, plus
+        speedup (ratio of words per second, above 1 is faster), p95_ratio
+        and peak_rss_ratio (new / old, below 1 is better)
+    """
+    previous = {scenario_key(result): result for result in baseline["results"]}
+
+    def ratio(new, old):
+        return new / old if new is not None and old else None
+
+    for result in current["results"]:
+        old = previous.get(scenario_key(result))
+        if old is None:
+            continue
+        yield dict(
+            dict(zip(SCENARIO_KEYS, scenario_key(result))),
+            speedup=ratio(result["words_per_second"], old["words_per_second"]),
+            p95_ratio=ratio(result["latency_ms"]["p95"], old["latency_ms"]["p95"]),
+            peak_rss_ratio=ratio(result["peak_rss_mb"], old["peak_rss_mb"]),
+        )
@@ -1,9 +1,130 @@
 """CLI para extração de palavras-chave utilizando YAKE!"""
 
+import csv
+import glob
+import json
+import os
 import sys
 import click
 from tabulate import tabulate
 import yake
+from yake.core.batch import iter_extract_batch
+
+
+class InvalidDocument(ValueError):
+    """A batch input record that cannot be processed; reported in its place."""
+
+
+def _read_file(path):
+    """Read one document, replacing undecodable bytes."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def _iter_files(paths):
+    """Yield (id, text) for each file, using its path as id."""
+    for path in paths:
+        yield path, _read_file(path)
+
+
+def _directory_files(directory):
+    """List the regular files of a directory, sorted by name."""
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if os.path.isfile(os.path.join(directory, name))
+    )
+
+
+def _glob_files(pattern):
+    """List the regular files matching a glob pattern ("**" recurses)."""
+    return sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+
+
+def _iter_lines(stream):
+    """Yield (line number, text) for each non-empty line."""
+    for number, line in enumerate(stream, start=1):
+        line = line.rstrip("\r\n")
+        if line.strip():
+            yield number, line
+
+
+def _iter_jsonl(stream):
+    """
+    Yield (id, text) from JSON lines with "id" and "text" fields.
+
+    A line that is not valid JSON, is not a JSON object or has a text that
+    is not a string is yielded with an InvalidDocument in place of its text
+    (and its line number as id when it has none), so that the rest of the
+    batch still runs.
+    """
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield number, InvalidDocument(f"Invalid JSON on line {number}: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield number, InvalidDocument(f"Line {number} is not a JSON object")
+            continue
+        text = record.get("text")
+        if text is not None and not isinstance(text, str):
+            text = InvalidDocument(
+                f"Line {number}: \"text\" must be a string, not {type(text).__name__}"
+            )
+        yield record.get("id", number), text or ""
+
+
+def _run_batch(extractor, documents, jobs, output_format, keep_order):
+    """
+    Extract keywords from (id, text) pairs and stream one result per document.
+
+    Documents are read lazily and spread over ``jobs`` worker processes, each
+    holding its own extractor; results are written as soon as they arrive.
+    Invalid documents get an error record (JSON) or a message on stderr
+    (CSV) instead of keywords, and the command fails once the batch is done.
+    """
+    ids = {}
+    errors = {}
+
+    def texts():
+        for index, (doc_id, text) in enumerate(documents):
+            ids[index] = doc_id
+            if isinstance(text, InvalidDocument):
+                errors[index] = text
+                text = None  # Keeps the document's place in the output
+            yield text
+
+    writer = csv.writer(sys.stdout) if output_format == "csv" else None
+    if writer:
+        writer.writerow(["id", "rank", "keyword", "score"])
+
+    failures = 0
+    results = iter_extract_batch(extractor, texts(), workers=jobs, ordered=keep_order)
+    for index, keywords in results:
+        doc_id = ids.pop(index)
+        error = errors.pop(index, None)
+        if error is not None:
+            failures += 1
+            click.echo(f"Skipping document {doc_id!r}: {error}", err=True)
+            if not writer:
+                record = {"id": doc_id, "error": str(error)}
+                sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        elif writer:
+            for rank, (kw, score) in enumerate(keywords, start=1):
+                writer.writerow([doc_id, rank, kw, score])
+        else:
+            record = {
+                "id": doc_id,
+                "keywords": [{"keyword": kw, "score": score} for kw, score in keywords],
+            }
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+    if failures:
+        raise click.ClickException(f"{failures} document(s) could not be processed")
 
 
 @click.command()
@@ -19,6 +140,49 @@ import yake
     help="Input file",
     required=False,
 )
+@click.option(
+    "-d",
+    "--input_dir",
+    help="Directory whose files are processed as separate documents",
+    required=False,
+)
+@click.option(
+    "-g",
+    "--glob",
+    "glob_pattern",
+    help="Glob pattern of files to process as separate documents (quote it)",
+    required=False,
+)
+@click.option(
+    "--jsonl",
+    help="Read JSON lines with id and text fields (from --input_file or stdin)",
+    is_flag=True,
+)
+@click.option(
+    "--lines",
+    help="Read one document per line (from --input_file or stdin)",
+    is_flag=True,
+)
+@click.option(
+    "-j",
+    "--jobs",
+    help="Worker processes for batch input (0 = one per CPU)",
+    default=1,
+    type=int,
+)
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    help="Output format for batch input",
+    default="jsonl",
+    type=click.Choice(["jsonl", "csv"]),
+)
+@click.option(
+    "--keep-order",
+    help="Write batch results in input order instead of as they finish",
+    is_flag=True,
+)
 @click.option(
     "-l",
     "--language",
@@ -86,10 +250,17 @@ import yake
     help="Verbose output",
 )
 @click.pass_context
-def keywords(  # pylint: disable=too-many-arguments,too-many-positional-arguments,unused-argument
+def keywords(  # pylint: disable=too-many-arguments,too-many-positional-arguments,unused-argument,too-many-locals,too-many-branches
     ctx,  # noqa: ARG001
     text_input,
     input_file,
+    input_dir,
+    glob_pattern,
+    jsonl,
+    lines,
+    jobs,
+    output_format,
+    keep_order,
     language,
     ngram_size,
     dedup_func,
@@ -101,10 +272,15 @@ def keywords(  # pylint: disable=too-many-arguments,too-many-positional-argument
     lemmatizer,
     verbose,
 ):
-    """Extract keywords using YAKE!"""
+    """Extract keywords using YAKE!
 
-    def run_yake(text_content):
-        extractor = yake.KeywordExtractor(
+    A single text or file is printed as a table. Batch input (--input_dir,
+    --glob, --jsonl or --lines) is processed by --jobs worker processes and
+    written as JSON lines or CSV, one document at a time.
+    """
+
+    def build_extractor():
+        return yake.KeywordExtractor(
             lan=language,
             n=ngram_size,
             dedupLim=dedup_lim,
@@ -115,7 +291,9 @@ def keywords(  # pylint: disable=too-many-arguments,too-many-positional-argument
             lemma_aggregation=lemma_aggregation,
             lemmatizer=lemmatizer,
         )
-        results = extractor.extract_keywords(text_content)
+
+    def run_yake(text_content):
+        results = build_extractor().extract_keywords(text_content)
 
         table = [
             {"keyword": kw[0], "score": kw[1]} if verbose else {"keyword": kw[0]}
@@ -126,7 +304,39 @@ def keywords(  # pylint: disable=too-many-arguments,too-many-positional-argument
     if text_input and input_file:
         print("Specify either an input file or direct text input, not both!")
         sys.exit(1)
-    elif not text_input and not input_file:
+
+    sources = [bool(text_input), bool(input_dir), bool(glob_pattern), jsonl or lines]
+    if jsonl and lines:
+        print("Specify either --jsonl or --lines, not both!")
+        sys.exit(1)
+    if sum(sources) > 1 or (input_file and (input_dir or glob_pattern)):
+        print("Specify only one input: text, file, directory, glob or stdin batch!")
+        sys.exit(1)
+
+    if input_dir or glob_pattern:
+        if input_dir and not os.path.isdir(input_dir):
+            print(f"Directory '{input_dir}' not found.")
+            sys.exit(1)
+        paths = _directory_files(input_dir) if input_dir else _glob_files(glob_pattern)
+        _run_batch(build_extractor(), _iter_files(paths), jobs, output_format, keep_order)
+        return
+
+    if jsonl or lines:
+        reader = _iter_jsonl if jsonl else _iter_lines
+        try:
+            # pylint: disable-next=consider-using-with
+            stream = open(input_file, encoding="utf-8") if input_file else sys.stdin
+        except FileNotFoundError:
+            print(f"File '{input_file}' not found.")
+            sys.exit(1)
+        try:
+            _run_batch(build_extractor(), reader(stream), jobs, output_format, keep_order)
+        finally:
+            if input_file:
+                stream.close()
+        return
+
+    if not text_input and not input_file:
         print("Specify either an input file or direct text input")
         sys.exit(1)
 
@@ -7,13 +7,20 @@ a raw distance calculation and a normalized similarity ratio, which are useful
 for comparing text strings and identifying potential matches with slight variations.
 
 Optimizations include:
-- Memory-efficient two-row approach instead of full matrix
+- Bit-parallel computation (Myers 1999, Hyyrö 2001): one column of the
+  dynamic programming matrix per character, held in Python integer bit
+  vectors, so keyword-length strings need one word-sized operation per step
+- NumPy-batched comparison of one string against many
 - Early termination for highly dissimilar strings
 - LRU caching for repeated calculations
-- Optimized algorithms for short strings
 """
 
 import functools
+from typing import Dict, Sequence
+import numpy as np  # pylint: disable=import-error
+
+# Longest pattern handled by the NumPy batch (one uint64 bit vector per string)
+_BATCH_MAX_LENGTH = 64
 
 
 class Levenshtein:
@@ -70,6 +77,121 @@ class Levenshtein:
         str_length = max(len(seq1), len(seq2))
         return Levenshtein.__ratio(str_distance, str_length)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def max_distance_for_ratio(str_length: int, threshold: float) -> int:
+        """
+        Find the largest distance whose similarity ratio is above a threshold.
+
+        Evaluates the same expression as ratio(), so the answer agrees with
+        ``ratio(a, b) > threshold`` including floating-point rounding.
+
+        Args:
+            str_length (int): The length of the longer string (positive).
+            threshold (float): The similarity ratio to exceed.
+
+        Returns:
+            int: The largest qualifying distance, or -1 if even identical
+                 strings do not exceed the threshold.
+        """
+        allowed = -1
+        for distance in range(str_length + 1):
+            if Levenshtein.__ratio(distance, str_length) <= threshold:
+                break
+            allowed = distance
+        return allowed
+
+    @staticmethod
+    def is_similar(seq1: str, seq2: str, threshold: float) -> bool:
+        """
+        Check whether the similarity ratio of two strings is above a threshold.
+
+        Equivalent to ``Levenshtein.ratio(seq1, seq2) > threshold``, but the
+        threshold bounds the edit distance that matters, so the computation
+        stops as soon as it is exceeded (see distance_at_most).
+
+        Args:
+            seq1 (str): The first string to compare.
+            seq2 (str): The second string to compare.
+            threshold (float): The similarity ratio to exceed.
+
+        Returns:
+            bool: True if the strings are more similar than the threshold.
+        """
+        len1, len2 = len(seq1), len(seq2)
+        str_length = max(len1, len2)
+        if str_length == 0:
+            return 1.0 > threshold
+
+        # distance() reports the full length for very different lengths
+        if abs(len1 - len2) > str_length * 0.7:
+            return Levenshtein.__ratio(str_length, str_length) > threshold
+
+        allowed = Levenshtein.max_distance_for_ratio(str_length, threshold)
+        if allowed < 0:
+            return False
+        return Levenshtein.distance_at_most(seq1, seq2, allowed) <= allowed
+
+    @staticmethod
+    def distance_at_most(seq1: str, seq2: str, max_distance: int) -> int:
+        """
+        Calculate the Levenshtein distance if it does not exceed a bound.
+
+        Uses Ukkonen's banded dynamic program: only cells within
+        ``max_distance`` of the diagonal can lead to a distance within the
+        bound, and the computation stops as soon as a whole row of the band
+        exceeds it. Clearly different strings are rejected after a few rows.
+
+        Args:
+            seq1 (str): The first string to compare.
+            seq2 (str): The second string to compare.
+            max_distance (int): The largest distance of interest.
+
+        Returns:
+            int: The Levenshtein distance when it is at most max_distance,
+                 otherwise max_distance + 1.
+        """
+        # Ensure seq1 is the shorter string
+        if len(seq1) > len(seq2):
+            seq1, seq2 = seq2, seq1
+        len1, len2 = len(seq1), len(seq2)
+
+        limit = max_distance + 1
+        if max_distance < 0 or len2 - len1 > max_distance:
+            return limit
+        if len1 == 0:
+            return len2
+
+        previous_row = list(range(len2 + 1))
+        for i in range(1, len1 + 1):
+            current_row = [limit] * (len2 + 1)
+            current_row[0] = min(i, limit)
+            row_min = current_row[0]
+            char1 = seq1[i - 1]
+
+            # Cells outside the band keep the value limit
+            first = max(1, i - max_distance)
+            if first > 1:
+                row_min = limit
+            for j in range(first, min(len2, i + max_distance) + 1):
+                value = previous_row[j - 1] + (char1 != seq2[j - 1])  # substitution
+                if previous_row[j] + 1 < value:
+                    value = previous_row[j] + 1  # deletion
+                if current_row[j - 1] + 1 < value:
+                    value = current_row[j - 1] + 1  # insertion
+                if value > limit:
+                    value = limit
+                current_row[j] = value
+                if value < row_min:
+                    row_min = value
+
+            # Distances never decrease from one row to the next
+            if row_min >= limit:
+                return limit
+            previous_row = current_row
+
+        return min(previous_row[len2], limit)
+
     @staticmethod
     @functools.lru_cache(maxsize=20000)
     def distance(seq1: str, seq2: str) -> int:
@@ -78,8 +200,7 @@ class Levenshtein:
 
         This method implements an optimized Levenshtein algorithm with:
         - Early termination for very different strings
-        - Memory-efficient two-row approach
-        - Special handling for short strings
+        - Bit-parallel column updates (see _bit_parallel_distance)
         - Result caching
 
         Args:
@@ -102,48 +223,141 @@ class Levenshtein:
         if abs(len1 - len2) > max(len1, len2) * 0.7:
             return max(len1, len2)
 
-        # Ensure seq1 is the shorter string for memory efficiency
+        # Use the shorter string as the bit-parallel pattern
         if len1 > len2:
             seq1, seq2 = seq2, seq1
-            len1, len2 = len2, len1
 
-        # For very short strings, use simple recursive approach
-        if len1 <= 3:
-            return Levenshtein._simple_distance(seq1, seq2)
+        return Levenshtein._bit_parallel_distance(seq1, seq2)
 
-        previous_row = list(range(len2 + 1))
-        current_row = [0] * (len2 + 1)
+    @staticmethod
+    def _pattern_masks(pattern: str) -> Dict[str, int]:
+        """
+        Build the match bit vector of every character of a pattern.
 
-        for i in range(1, len1 + 1):
-            current_row[0] = i
-            for j in range(1, len2 + 1):
-                cost = 0 if seq1[i-1] == seq2[j-1] else 1
-                current_row[j] = min(
-                    current_row[j-1] + 1,      # insertion
-                    previous_row[j] + 1,       # deletion
-                    previous_row[j-1] + cost   # substitution
-                )
-            previous_row, current_row = current_row, previous_row
-
-        return previous_row[len2]
+        Bit i of the vector for character c is set when ``pattern[i] == c``.
+
+        Args:
+            pattern (str): The string whose positions the bits represent.
+
+        Returns:
+            dict: Mapping from character to its match bit vector.
+        """
+        masks: Dict[str, int] = {}
+        bit = 1
+        for char in pattern:
+            masks[char] = masks.get(char, 0) | bit
+            bit <<= 1
+        return masks
+
+    @staticmethod
+    def _bit_parallel_distance(pattern: str, text: str) -> int:
+        """
+        Compute the Levenshtein distance with the Myers/Hyyrö bit-vector algorithm.
+
+        The vertical differences of one column of the dynamic programming
+        matrix (each +1, 0 or -1) are encoded in two bit vectors, ``pv`` and
+        ``mv``, with one bit per pattern character. Each text character
+        updates the whole column with a constant number of integer
+        operations, and the score tracks the last row.
+
+        Args:
+            pattern (str): Non-empty string encoded in the bit vectors
+                (preferably the shorter one).
+            text (str): String scanned one character at a time.
+
+        Returns:
+            int: The Levenshtein distance between pattern and text.
+        """
+        masks = Levenshtein._pattern_masks(pattern)
+        length = len(pattern)
+        full = (1 << length) - 1
+        last = 1 << (length - 1)
+
+        pv, mv, score = full, 0, length
+        for char in text:
+            eq = masks.get(char, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & full)
+            mh = pv & xh
+            if ph & last:
+                score += 1
+            elif mh & last:
+                score -= 1
+            # The first row of the matrix grows by one per text character
+            ph = ((ph << 1) | 1) & full
+            mh = (mh << 1) & full
+            pv = mh | (~(xv | ph) & full)
+            mv = ph & xv
+        return score
 
     @staticmethod
-    def _simple_distance(seq1: str, seq2: str) -> int:
+    def distance_many(seq: str, others: Sequence[str]) -> np.ndarray:
         """
-        Simple recursive distance calculation for very short strings.
+        Calculate the Levenshtein distance from one string to many others.
+
+        The bit-parallel algorithm runs on all strings at once, with one
+        uint64 bit vector per string in NumPy arrays. Results equal
+        ``[Levenshtein.distance(seq, other) for other in others]``, including
+        the early termination for strings of very different lengths. Strings
+        longer than 64 characters fall back to the scalar method.
+
+        Args:
+            seq (str): The string to compare.
+            others (Sequence[str]): The strings to compare it against.
 
-        More efficient than the matrix approach for strings with length <= 3.
+        Returns:
+            numpy.ndarray: Distances as an int64 array, one per string in others.
         """
-        if not seq1:
-            return len(seq2)
-        if not seq2:
-            return len(seq1)
+        count = len(others)
+        lengths = np.fromiter((len(other) for other in others), dtype=np.int64, count=count)
+        len1 = len(seq)
+        if len1 == 0 or len1 > _BATCH_MAX_LENGTH or count == 0:
+            return np.fromiter(
+                (Levenshtein.distance(seq, other) for other in others),
+                dtype=np.int64, count=count,
+            )
 
-        if seq1[0] == seq2[0]:
-            return Levenshtein._simple_distance(seq1[1:], seq2[1:])
+        # Encode the other strings as indices into the pattern's match vectors
+        # (index 0: character absent from seq)
+        masks = Levenshtein._pattern_masks(seq)
+        alphabet = {char: index + 1 for index, char in enumerate(masks)}
+        table = np.zeros(len(alphabet) + 1, dtype=np.uint64)
+        for char, index in alphabet.items():
+            table[index] = masks[char]
 
-        return 1 + min(
-            Levenshtein._simple_distance(seq1[1:], seq2),      # deletion
-            Levenshtein._simple_distance(seq1, seq2[1:]),      # insertion
-            Levenshtein._simple_distance(seq1[1:], seq2[1:])   # substitution
+        width = int(lengths.max())
+        codes = np.zeros((count, width), dtype=np.int64)
+        rows = np.repeat(np.arange(count), lengths)
+        columns = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        codes[rows, columns] = np.fromiter(
+            (alphabet.get(char, 0) for other in others for char in other),
+            dtype=np.int64, count=len(rows),
         )
+
+        full = np.uint64((1 << len1) - 1)
+        last = np.uint64(1 << (len1 - 1))
+        one, zero = np.uint64(1), np.uint64(0)
+        pv = np.full(count, full, dtype=np.uint64)
+        mv = np.zeros(count, dtype=np.uint64)
+        score = np.full(count, len1, dtype=np.int64)
+
+        for column in range(width):
+            active = lengths > column
+            eq = table[codes[:, column]]
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & full)
+            mh = pv & xh
+            up = (ph & last) != zero
+            down = ~up & ((mh & last) != zero)
+            score += (active & up).astype(np.int64) - (active & down).astype(np.int64)
+            ph = ((ph << one) | one) & full
+            mh = (mh << one) & full
+            pv = np.where(active, mh | (~(xv | ph) & full), pv)
+            mv = np.where(active, ph & xv, mv)
+
+        # Same special cases as distance()
+        longest = np.maximum(lengths, len1)
+        score = np.where(np.abs(lengths - len1) > longest * 0.7, longest, score)
+        return np.where(lengths == 0, len1, score)
@@ -0,0 +1,318 @@
+"""
+Asyncio keyword extraction module for YAKE.
+
+Keyword extraction is CPU-bound, so running it inside a coroutine would block
+the event loop. This module runs it in an executor instead:
+
+- extract_keywords_async() awaits one document, with an optional timeout.
+- iter_extract_async() is an async generator over many documents. It keeps
+  at most ``max_concurrency`` documents submitted but not yet consumed, so
+  a slow consumer holds back a fast producer, and it cancels outstanding
+  work when the consumer stops early.
+
+Thread executors (including the loop's default executor) call the
+extractor directly, so several documents can run in it at once: create it
+with ``thread_safe=True`` unless the executor has a single thread. Timeouts
+and cancellation only stop waiting for work that has already started; it
+runs to completion in its thread or worker process. Process workers keep one
+extractor per configuration, built from the extractor's constructor
+arguments (see KeywordExtractor.worker_params), which are pickled once per
+call or batch. Executors made by create_executor() for an extractor build it
+in their initializer, so each task only carries a short digest; any other
+ProcessPoolExecutor works too, and receives the pickled arguments with each
+document.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import pickle
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Default limit on documents in flight: enough to keep every CPU busy while
+# the next results are being consumed
+DEFAULT_CONCURRENCY = 2 * (os.cpu_count() or 1)
+
+# Extractors owned by the current worker process, by configuration digest
+_WORKER_EXTRACTORS: Dict[str, Any] = {}
+
+# Configuration digest whose extractor each executor's workers build at start
+_PRELOADED: "weakref.WeakKeyDictionary[Executor, str]" = weakref.WeakKeyDictionary()
+
+# Marks the end of the input in the result queue
+_DONE = object()
+
+
+def _pickle_params(extractor: Any) -> Tuple[str, bytes]:
+    """
+    Pickle an extractor's constructor arguments for worker processes.
+
+    Returns:
+        Tuple of (digest identifying the configuration, pickled arguments)
+    """
+    params = pickle.dumps(extractor.worker_params(), protocol=pickle.HIGHEST_PROTOCOL)
+    return hashlib.sha256(params).hexdigest(), params
+
+
+def _init_worker(digest: str, params: bytes) -> None:
+    """Executor initializer: build the extractor of a configuration in this worker."""
+    # Imported here to avoid a circular import with yake.core.yake
+    from .yake import KeywordExtractor  # pylint: disable=import-outside-toplevel
+
+    _WORKER_EXTRACTORS[digest] = KeywordExtractor(**pickle.loads(params))
+
+
+def _extract_with_params(
+    digest: str, params: Optional[bytes], text: Optional[str]
+) -> List[Tuple[str, float]]:
+    """
+    Extract keywords inside a worker process.
+
+    Args:
+        digest: Digest of the extractor configuration
+        params: Pickled KeywordExtractor constructor arguments, or None if
+            the executor's initializer already built the extractor
+        text: Document text
+
+    Returns:
+        List of (keyword, score) tuples
+    """
+    if digest not in _WORKER_EXTRACTORS:
+        if params is None:
+            raise RuntimeError("Worker process has no extractor for this configuration")
+        _init_worker(digest, params)
+    return _WORKER_EXTRACTORS[digest].extract_keywords(text)
+
+
+def create_executor(
+    kind: str = "process", workers: Optional[int] = None, extractor: Any = None
+) -> Executor:
+    """
+    Create an executor suitable for asynchronous extraction.
+
+    Args:
+        kind: "process" (parallel extraction) or "thread" (keeps the event
+            loop responsive, but runs extractions one at a time under the GIL)
+        workers: Number of workers (None = one per CPU)
+        extractor: KeywordExtractor that process workers build when they
+            start, so tasks for it do not carry its configuration
+
+    Returns:
+        A ProcessPoolExecutor or ThreadPoolExecutor
+
+    Raises:
+        ValueError: If kind is not "process" or "thread"
+    """
+    if kind == "process":
+        if extractor is None:
+            return ProcessPoolExecutor(max_workers=workers)
+        digest, params = _pickle_params(extractor)
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(digest, params)
+        )
+        _PRELOADED[executor] = digest
+        return executor
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yake")
+    raise ValueError(f"Unknown executor kind: {kind!r} (expected 'process' or 'thread')")
+
+
+def _extraction_caller(extractor: Any, executor: Optional[Executor]) -> Callable:
+    """
+    Prepare the extraction of many documents in ``executor``.
+
+    The extractor's configuration is pickled once here, not per document.
+
+    Returns:
+        Function mapping a document text to the callable to submit
+    """
+    if not isinstance(executor, ProcessPoolExecutor):
+        return partial(partial, extractor.extract_keywords)
+    digest, params = _pickle_params(extractor)
+    if _PRELOADED.get(executor) == digest:
+        params = None  # Workers built the extractor in the initializer
+    return partial(partial, _extract_with_params, digest, params)
+
+
+async def _run_call(call: Callable, executor: Optional[Executor], timeout: Optional[float]):
+    """Run a prepared extraction in ``executor``, with an optional timeout."""
+    future = asyncio.get_running_loop().run_in_executor(executor, call)
+    if timeout is None:
+        return await future
+    return await asyncio.wait_for(future, timeout)
+
+
+async def extract_keywords_async(
+    extractor: Any,
+    text: Optional[str],
+    executor: Optional[Executor] = None,
+    timeout: Optional[float] = None,
+) -> List[Tuple[str, float]]:
+    """
+    Extract keywords from one document without blocking the event loop.
+
+    Args:
+        extractor: KeywordExtractor to run (or whose configuration to use in
+            a process executor)
+        text: Document text
+        executor: Executor to run in (default: the loop's default executor)
+        timeout: Seconds to wait for the result (default: None = no limit)
+
+    Returns:
+        List of (keyword, score) tuples
+
+    Raises:
+        asyncio.TimeoutError: If the result is not ready within ``timeout``.
+            Work that has already started cannot be interrupted: it
+            finishes in the background, occupying its thread or its
+            process pool worker until then.
+
+    Note:
+        Thread executors, including the default one, call ``extractor``
+        itself. If several documents can run at once, the extractor must
+        be created with ``thread_safe=True``.
+    """
+    return await _run_call(_extraction_caller(extractor, executor)(text), executor, timeout)
+
+
+async def _aiter_texts(texts: Union[Iterable, AsyncIterable]) -> AsyncIterator:
+    """Iterate over a synchronous or asynchronous iterable of documents."""
+    if hasattr(texts, "__aiter__"):
+        async for text in texts:
+            yield text
+    else:
+        for text in texts:
+            yield text
+
+
+async def iter_extract_async(  # pylint: disable=too-many-arguments,too-many-locals
+    extractor: Any,
+    texts: Union[Iterable[Optional[str]], AsyncIterable[Optional[str]]],
+    executor: Union[Executor, str, None] = None,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Extract keywords from many documents as an async generator.
+
+    Documents are read from ``texts`` only while fewer than
+    ``max_concurrency`` results are pending (submitted but not yet
+    consumed), which bounds memory and applies backpressure to the input.
+    Leaving the ``async for`` loop early, or cancelling the consuming task,
+    cancels the documents still waiting in the executor.
+
+    Args:
+        extractor: KeywordExtractor to run (or whose configuration to use in
+            a process executor)
+        texts: Iterable or async iterable of documents
+        executor: Executor to run in, "process" or "thread" to create one
+            for this batch, or None for the loop's default executor
+        max_concurrency: Maximum pending documents
+            (default: None = DEFAULT_CONCURRENCY)
+        timeout: Seconds allowed per document (default: None = no limit)
+        ordered: Yield results in input order (True) or as they finish (False)
+        return_exceptions: Yield a document's exception (e.g. a timeout) in
+            place of its keywords instead of raising it
+
+    Yields:
+        Tuples of (input index, list of (keyword, score) tuples)
+
+    Note:
+        Only documents that have not started are cancelled. Documents that
+        timed out or were cancelled while running keep their thread or
+        process pool worker busy until they finish. With a thread
+        executor, documents run concurrently on ``extractor`` itself, which
+        must then be created with ``thread_safe=True``.
+    """
+    owned = isinstance(executor, str)
+    if owned:
+        executor = create_executor(executor, extractor=extractor)
+    caller = _extraction_caller(extractor, executor)
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency or DEFAULT_CONCURRENCY)
+    results: asyncio.Queue = asyncio.Queue()
+    tasks = set()
+
+    async def run(index: int, text: Optional[str]) -> None:
+        try:
+            value = await _run_call(caller(text), executor, timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            value = exc
+        results.put_nowait((index, value))
+
+    async def produce() -> None:
+        count = 0
+        try:
+            async for text in _aiter_texts(texts):
+                await semaphore.acquire()
+                task = loop.create_task(run(count, text))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                count += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Reading the input failed: report it to the consumer
+            results.put_nowait((None, exc))
+            return
+        results.put_nowait((_DONE, count))
+
+    producer = loop.create_task(produce())
+    try:
+        total = None
+        consumed = 0
+        next_index = 0
+        waiting: Dict[int, Any] = {}
+        while total is None or consumed < total:
+            index, value = await results.get()
+            if index is _DONE:
+                total = value
+                continue
+            if index is None:
+                raise value
+
+            if ordered:
+                waiting[index] = value
+                ready = []
+                while next_index in waiting:
+                    ready.append((next_index, waiting.pop(next_index)))
+                    next_index += 1
+            else:
+                ready = [(index, value)]
+
+            for ready_index, ready_value in ready:
+                consumed += 1
+                semaphore.release()
+                if isinstance(ready_value, BaseException) and not return_exceptions:
+                    raise ready_value
+                yield ready_index, ready_value
+    finally:
+        producer.cancel()
+        for task in list(tasks):
+            task.cancel()
+        await asyncio.gather(producer, *tasks, return_exceptions=True)
+        if owned:
+            executor.shutdown(wait=False, cancel_futures=True)
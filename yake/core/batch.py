@@ -0,0 +1,156 @@
+"""
+Batch keyword extraction module for YAKE.
+
+This module spreads many documents across a pool of worker processes. Each
+worker builds its own KeywordExtractor once, in the pool initializer, so the
+stopword list and configuration are loaded once per worker instead of being
+pickled and rebuilt for every document.
+"""
+
+import logging
+import multiprocessing
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Extractor owned by the current worker process (set by _init_worker)
+_WORKER_EXTRACTOR = None
+
+# Default number of documents sent to a worker per task when the input
+# length is unknown (e.g. generators)
+DEFAULT_CHUNKSIZE = 16
+
+
+def _init_worker(params: Dict[str, Any]) -> None:
+    """
+    Pool initializer: build the extractor held by this worker process.
+
+    Args:
+        params: Constructor keyword arguments for KeywordExtractor
+    """
+    global _WORKER_EXTRACTOR  # pylint: disable=global-statement
+    # Imported here to avoid a circular import with yake.core.yake
+    from .yake import KeywordExtractor  # pylint: disable=import-outside-toplevel
+
+    _WORKER_EXTRACTOR = KeywordExtractor(**params)
+
+
+def _extract_in_worker(item: Tuple[int, Optional[str]]) -> Tuple[int, List[Tuple[str, float]]]:
+    """
+    Extract keywords for one document inside a worker process.
+
+    Args:
+        item: Tuple of (input index, document text)
+
+    Returns:
+        Tuple of (input index, list of (keyword, score) tuples)
+    """
+    index, text = item
+    return index, _WORKER_EXTRACTOR.extract_keywords(text)
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Resolve the requested number of worker processes.
+
+    Args:
+        workers: Requested number of workers, None or 0 for one per CPU
+
+    Returns:
+        Number of worker processes to start (at least 1)
+    """
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def _resolve_chunksize(texts: Iterable, workers: int, chunksize: Optional[int]) -> int:
+    """Pick a chunk size that gives each worker a few tasks to balance load."""
+    if chunksize:
+        return max(1, int(chunksize))
+    try:
+        total = len(texts)  # type: ignore[arg-type]
+    except TypeError:
+        return DEFAULT_CHUNKSIZE
+    return max(1, total // (workers * 4))
+
+
+def create_pool(params: Dict[str, Any], workers: int):
+    """
+    Create a process pool whose workers each hold a ready KeywordExtractor.
+
+    Args:
+        params: Constructor keyword arguments for KeywordExtractor
+        workers: Number of worker processes
+
+    Returns:
+        A multiprocessing.Pool instance
+    """
+    return multiprocessing.Pool(
+        processes=workers, initializer=_init_worker, initargs=(params,)
+    )
+
+
+def iter_extract_batch(
+    extractor: Any,
+    texts: Iterable[Optional[str]],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[Tuple[int, List[Tuple[str, float]]]]:
+    """
+    Lazily extract keywords from many documents.
+
+    With a single worker the documents are processed in the current process by
+    ``extractor`` itself; otherwise they are distributed over a process pool of
+    extractors configured like ``extractor``.
+
+    Args:
+        extractor: KeywordExtractor whose configuration the workers copy
+        texts: Iterable of documents
+        workers: Number of worker processes (None or 0 = one per CPU)
+        chunksize: Documents sent to a worker per task (None = automatic)
+        ordered: Yield results in input order (True) or as they finish (False)
+
+    Yields:
+        Tuples of (input index, list of (keyword, score) tuples)
+    """
+    workers = resolve_workers(workers)
+
+    if workers == 1:
+        for index, text in enumerate(texts):
+            yield index, extractor.extract_keywords(text)
+        return
+
+    chunksize = _resolve_chunksize(texts, workers, chunksize)
+    logger.debug("Starting batch extraction: workers=%d, chunksize=%d", workers, chunksize)
+
+    with create_pool(extractor.worker_params(), workers) as pool:
+        mapper = pool.imap if ordered else pool.imap_unordered
+        yield from mapper(_extract_in_worker, enumerate(texts), chunksize)
+
+
+def extract_batch(
+    extractor: Any,
+    texts: Iterable[Optional[str]],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[List[Tuple[str, float]]]:
+    """
+    Extract keywords from many documents, keeping input order.
+
+    Args:
+        extractor: KeywordExtractor whose configuration the workers copy
+        texts: Iterable of documents
+        workers: Number of worker processes (None or 0 = one per CPU)
+        chunksize: Documents sent to a worker per task (None = automatic)
+
+    Returns:
+        One list of (keyword, score) tuples per input document
+    """
+    return [
+        keywords
+        for _, keywords in iter_extract_batch(extractor, texts, workers, chunksize)
+    ]
@@ -0,0 +1,284 @@
+"""
+Bounded in-memory caches for YAKE.
+
+BoundedCache is a least recently used cache whose budget is a number of
+entries, an approximate number of bytes, or both. When an insertion goes
+over budget, the least recently used entries are evicted one at a time, so
+a cache that has filled up keeps its most useful entries instead of being
+wiped. Every cache counts its hits, misses and evictions.
+
+KeywordExtractor keeps the scores of compared keyword pairs and the lemmas
+of keywords in BoundedCache instances. The module-level functools caches
+(tags, Levenshtein) are already bounded LRU caches; lru_cache_stats()
+reports them in the same form.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from .concurrency import new_counters
+
+# Approximate bytes used by the cache itself for every entry (ordered
+# dictionary node and per-entry size record)
+ENTRY_OVERHEAD = 100
+
+
+def approximate_size(key: Any, value: Any) -> int:
+    """
+    Estimate the memory held by a cache entry.
+
+    Args:
+        key: Entry key (tuples are measured with their items)
+        value: Entry value (tuples are measured with their items)
+
+    Returns:
+        Approximate size in bytes, including ENTRY_OVERHEAD
+    """
+    size = ENTRY_OVERHEAD
+    for obj in (key, value):
+        size += sys.getsizeof(obj)
+        if isinstance(obj, tuple):
+            size += sum(sys.getsizeof(item) for item in obj)
+    return size
+
+
+class BoundedCache:
+    """
+    Least recently used cache with a budget in entries and/or bytes.
+
+    Insertions and evictions take the cache's lock. With
+    ``thread_safe=True`` lookups take it too, since marking an entry as
+    recently used relinks the underlying ordered dictionary, which must not
+    race with an insertion or eviction (on free-threaded builds there is no
+    GIL to serialise them). The statistics are then kept per thread (see
+    StripedCounters), so one cache can be shared between threads. Without
+    it, lookups are lock-free and the cache is meant for one thread at a
+    time.
+
+    Instances can be pickled; only the budget is kept and the copy starts
+    empty.
+    """
+
+    __slots__ = (
+        "_data", "_sizes", "_bytes", "_max_entries", "_max_bytes",
+        "_sizeof", "_thread_safe", "_counters", "_evictions", "_lock",
+    )
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        thread_safe: bool = False,
+        sizeof: Callable[[Any, Any], int] = approximate_size,
+    ):
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries (None = no entry limit,
+                0 = store nothing)
+            max_bytes: Maximum approximate size of the entries in bytes
+                (None = no size limit)
+            thread_safe: Whether several threads use the cache at once
+            sizeof: Function estimating the bytes of a (key, value) entry
+
+        Raises:
+            ValueError: If neither budget is given, or a budget is negative
+        """
+        if max_entries is None and max_bytes is None:
+            raise ValueError("BoundedCache needs max_entries, max_bytes or both")
+        if (max_entries is not None and max_entries < 0) or (max_bytes is not None and max_bytes < 0):
+            raise ValueError("Cache budgets must not be negative")
+
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}  # Entry sizes, with a byte budget
+        self._bytes = 0
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._thread_safe = thread_safe
+        self._counters = new_counters(("hits", "misses"), thread_safe)
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Keep only the settings when pickled."""
+        return {
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "thread_safe": self._thread_safe,
+            "sizeof": self._sizeof,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild an empty cache from pickled settings."""
+        self.__init__(**state)  # pylint: disable=unnecessary-dunder-call
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check for an entry without counting a lookup or refreshing it."""
+        return key in self._data
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        """Get the entry budget (None if unlimited)."""
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """Get the byte budget (None if unlimited)."""
+        return self._max_bytes
+
+    def counters(self) -> Dict[str, int]:
+        """
+        Get the live hit and miss counters of the calling thread.
+
+        Used to measure the lookups of one extraction: the difference of the
+        counters before and after it. In thread-safe mode other threads do
+        not update them.
+
+        Returns:
+            Dictionary with "hits" and "misses"
+        """
+        return self._counters.local()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up an entry and mark it as recently used.
+
+        Args:
+            key: Entry key
+            default: Value returned when the key is not cached
+
+        Returns:
+            Cached value, or ``default``
+        """
+        if self._thread_safe:
+            with self._lock:
+                return self._lookup(key, default)
+        return self._lookup(key, default)
+
+    def _lookup(self, key: Hashable, default: Any) -> Any:
+        """Look up an entry, refresh it and count the lookup."""
+        data = self._data
+        try:
+            value = data[key]
+        except KeyError:
+            self._counters.local()["misses"] += 1
+            return default
+        data.move_to_end(key)
+        self._counters.local()["hits"] += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting least recently used ones to stay in budget.
+
+        Args:
+            key: Entry key
+            value: Value to cache
+        """
+        if self._max_entries == 0:
+            return
+        size = self._sizeof(key, value) if self._max_bytes is not None else 0
+        if self._max_bytes is not None and size > self._max_bytes:
+            return  # Would evict everything and still not fit
+
+        with self._lock:
+            data = self._data
+            if key in data:
+                self._bytes -= self._sizes.pop(key, 0)
+            data[key] = value
+            data.move_to_end(key)
+            if self._max_bytes is not None:
+                self._sizes[key] = size
+                self._bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within budget (lock held)."""
+        data = self._data
+        max_entries = self._max_entries
+        max_bytes = self._max_bytes
+        while data and (
+            (max_entries is not None and len(data) > max_entries)
+            or (max_bytes is not None and self._bytes > max_bytes)
+        ):
+            key, _ = data.popitem(last=False)
+            self._bytes -= self._sizes.pop(key, 0)
+            self._evictions += 1
+
+    def keys(self) -> List[Hashable]:
+        """
+        Get the cached keys, least recently used first.
+
+        Returns:
+            Snapshot of the keys (for inspection; not safe against
+            concurrent lookups)
+        """
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._bytes = 0
+            self._evictions = 0
+        self._counters.reset()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache statistics.
+
+        Returns:
+            Dictionary with entries, bytes (None without a byte budget),
+            max_entries, max_bytes, hits, misses, hit_rate (percentage) and
+            evictions
+        """
+        totals = self._counters.totals()
+        lookups = totals["hits"] + totals["misses"]
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes if self._max_bytes is not None else None,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "hit_rate": totals["hits"] / lookups * 100 if lookups else 0.0,
+            "evictions": self._evictions,
+        }
+
+
+def lru_cache_stats(function: Any) -> Optional[Dict[str, Any]]:
+    """
+    Report a functools.lru_cache in the form of BoundedCache.stats().
+
+    Args:
+        function: Function wrapped by functools.lru_cache
+
+    Returns:
+        Statistics dictionary (bytes and evictions are not tracked and are
+        None), or None if the function has no cache
+    """
+    try:
+        info = function.cache_info()
+    except AttributeError:
+        return None
+    lookups = info.hits + info.misses
+    return {
+        "entries": info.currsize,
+        "bytes": None,
+        "max_entries": info.maxsize,
+        "max_bytes": None,
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups * 100 if lookups else 0.0,
+        "evictions": None,
+    }
@@ -0,0 +1,156 @@
+"""
+Thread-safety helpers for YAKE.
+
+A KeywordExtractor created with ``thread_safe=True`` can be shared between
+threads, including on free-threaded (no-GIL) CPython builds. Its hot-path
+statistics must then not be read-modify-written on a shared dictionary,
+which loses updates when threads interleave. StripedCounters gives every
+thread its own counters, written by that thread only and without locks, and
+sums them when they are read. Counters has the same interface for objects
+used by one thread at a time, and new_counters() picks one of the two.
+"""
+
+import sys
+import threading
+import weakref
+from typing import Dict, Iterable, List, Tuple, Union
+
+
+def gil_enabled() -> bool:
+    """
+    Tell whether the interpreter runs with the global interpreter lock.
+
+    Returns:
+        False on free-threaded CPython builds (3.13t and later) running with
+        the GIL disabled, True otherwise
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+class StripedCounters:
+    """
+    Integer counters updated concurrently without locks.
+
+    Each thread increments the dictionary returned by local(), which no other
+    thread writes. totals() adds up the stripes of all threads; the counters
+    of threads that have exited are folded into a retired stripe, so memory
+    does not grow with the number of threads ever started. reset() does not
+    touch the stripes (their owners may be writing them) but records the
+    current totals as the new zero.
+    """
+
+    __slots__ = ("_names", "_local", "_stripes", "_retired", "_baseline", "_lock")
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Create counters that all start at zero.
+
+        Args:
+            names: Names of the counters
+        """
+        self._names = tuple(names)
+        self._local = threading.local()
+        self._stripes: List[Tuple[weakref.ref, Dict[str, int]]] = []
+        self._retired = dict.fromkeys(self._names, 0)
+        self._baseline = dict.fromkeys(self._names, 0)
+        self._lock = threading.Lock()
+
+    def local(self) -> Dict[str, int]:
+        """
+        Get the counters of the calling thread.
+
+        Returns:
+            Dictionary of counters that only the calling thread may update
+        """
+        counters = getattr(self._local, "counters", None)
+        if counters is None:
+            counters = dict.fromkeys(self._names, 0)
+            with self._lock:
+                self._retire_finished()
+                self._stripes.append((weakref.ref(threading.current_thread()), counters))
+            self._local.counters = counters
+        return counters
+
+    def _retire_finished(self) -> None:
+        """Fold the stripes of finished threads into the retired one (lock held)."""
+        alive = []
+        for thread_ref, counters in self._stripes:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                alive.append((thread_ref, counters))
+            else:
+                for name in self._names:
+                    self._retired[name] += counters[name]
+        self._stripes = alive
+
+    def _raw_totals(self) -> Dict[str, int]:
+        """Add up the stripes of all threads, ignoring resets (lock held)."""
+        self._retire_finished()
+        totals = dict(self._retired)
+        for _, counters in self._stripes:
+            for name in self._names:
+                totals[name] += counters[name]
+        return totals
+
+    def totals(self) -> Dict[str, int]:
+        """
+        Add up the counters of all threads since the last reset.
+
+        Returns:
+            Dictionary mapping counter names to totals
+        """
+        with self._lock:
+            totals = self._raw_totals()
+            return {name: totals[name] - self._baseline[name] for name in self._names}
+
+    def reset(self) -> None:
+        """Restart all counters from zero."""
+        with self._lock:
+            self._baseline = self._raw_totals()
+
+
+class Counters:
+    """
+    Integer counters for use by one thread at a time.
+
+    Same interface as StripedCounters, without its per-thread bookkeeping.
+    """
+
+    __slots__ = ("_counters",)
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Create counters that all start at zero.
+
+        Args:
+            names: Names of the counters
+        """
+        self._counters = dict.fromkeys(names, 0)
+
+    def local(self) -> Dict[str, int]:
+        """Get the counters to update."""
+        return self._counters
+
+    def totals(self) -> Dict[str, int]:
+        """Get a copy of the counters."""
+        return dict(self._counters)
+
+    def reset(self) -> None:
+        """Restart all counters from zero."""
+        for name in self._counters:
+            self._counters[name] = 0
+
+
+def new_counters(names: Iterable[str], thread_safe: bool = False) -> Union[Counters, StripedCounters]:
+    """
+    Create counters for one thread or for concurrent use.
+
+    Args:
+        names: Names of the counters
+        thread_safe: Whether several threads update the counters at once
+
+    Returns:
+        StripedCounters if thread_safe, else Counters
+    """
+    return StripedCounters(names) if thread_safe else Counters(names)
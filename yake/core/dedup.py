@@ -0,0 +1,200 @@
+"""
+Candidate blocking index for YAKE keyword deduplication.
+
+Deduplication compares every new candidate with the keywords accepted so far
+and rejects it if any of them is too similar. This module contains the
+DedupIndex class, which narrows those comparisons down to the accepted
+keywords that can possibly exceed the similarity threshold:
+
+- "levs": length buckets plus a character trigram count filter. Both are
+  necessary conditions for the edit distance allowed by the threshold, so no
+  near-duplicate is ever missed.
+- "jaro": length buckets, using the upper bound that the length ratio places
+  on the Jaro similarity. Also exact.
+- "seqm": first/last character buckets and the length filter applied by the
+  heuristic pre-filter of the "seqm" similarity. The accepted keywords are
+  the same, but skipped comparisons no longer reach the similarity cache, so
+  its statistics change; this mode is therefore opt-in.
+
+The similarity function itself still decides; the index only proposes.
+"""
+
+from collections import Counter
+from typing import Dict, List, Tuple
+from .Levenshtein import Levenshtein
+
+# Q-gram size used by the Levenshtein count filter
+QGRAM_SIZE = 3
+
+# Index methods by deduplication function name (see
+# KeywordExtractor._get_dedup_function); other names use Levenshtein
+DEDUP_METHODS = {
+    "jaro_winkler": "jaro",
+    "jaro": "jaro",
+    "sequencematcher": "seqm",
+    "seqm": "seqm",
+}
+
+# Methods for which the index is enabled when not explicitly requested
+EXACT_METHODS = frozenset(["levs", "jaro"])
+
+# Tolerance on the Jaro upper bound, guarding against rounding differences in
+# the similarity implementation
+_JARO_EPSILON = 1e-9
+
+
+def dedup_method(func_name: str) -> str:
+    """
+    Get the index method for a deduplication function name.
+
+    Args:
+        func_name: Deduplication function name as given to KeywordExtractor
+
+    Returns:
+        One of "levs", "jaro" or "seqm"
+    """
+    return DEDUP_METHODS.get(func_name.lower(), "levs")
+
+
+def _qgrams(keyword: str) -> Counter:
+    """Count the character q-grams of a keyword."""
+    return Counter(keyword[i:i + QGRAM_SIZE] for i in range(len(keyword) - QGRAM_SIZE + 1))
+
+
+class DedupIndex:
+    """
+    Blocking index over the keywords accepted during deduplication.
+
+    Keywords are added in acceptance order with add(); candidates() returns,
+    in the same order, the accepted keywords that may be more similar to a
+    new candidate than the threshold.
+
+    Attributes:
+        See method accessors below for available information.
+    """
+
+    def __init__(self, method: str, threshold: float):
+        """
+        Initialize an empty index.
+
+        Args:
+            method: Similarity being indexed: "levs", "jaro" or "seqm"
+            threshold: Similarity above which a candidate is a duplicate
+        """
+        self._method = method
+        self._threshold = threshold
+        self._keywords: List[str] = []  # Accepted keywords, in order
+        self._by_length: Dict[int, List[int]] = {}  # Keyword length -> positions
+        self._by_ends: Dict[Tuple[str, str], List[int]] = {}  # (first, last) -> positions
+        self._short: List[int] = []  # Positions of keywords of 3 characters or fewer
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}  # Q-gram -> (position, count)
+
+    def __len__(self) -> int:
+        """Get the number of accepted keywords."""
+        return len(self._keywords)
+
+    def add(self, keyword: str) -> None:
+        """
+        Add an accepted keyword to the index.
+
+        Args:
+            keyword: Normalized (lowercase) keyword
+        """
+        position = len(self._keywords)
+        self._keywords.append(keyword)
+        self._by_length.setdefault(len(keyword), []).append(position)
+
+        if self._method == "levs":
+            for gram, count in _qgrams(keyword).items():
+                self._postings.setdefault(gram, []).append((position, count))
+        elif self._method == "seqm" and keyword:
+            self._by_ends.setdefault((keyword[0], keyword[-1]), []).append(position)
+            if len(keyword) <= 3:
+                self._short.append(position)
+
+    def candidates(self, keyword: str) -> List[str]:
+        """
+        Get the accepted keywords that may be near-duplicates of ``keyword``.
+
+        Args:
+            keyword: Normalized (lowercase) candidate keyword
+
+        Returns:
+            Accepted keywords that pass the blocking filters, in acceptance order
+        """
+        if self._threshold < 0:
+            # Every comparison can exceed a negative threshold
+            return list(self._keywords)
+
+        if self._method == "levs":
+            positions = self._levenshtein_candidates(keyword)
+        elif self._method == "jaro":
+            positions = self._jaro_candidates(keyword)
+        else:
+            positions = self._seqm_candidates(keyword)
+        return [self._keywords[position] for position in sorted(positions)]
+
+    def _levenshtein_candidates(self, keyword: str) -> List[int]:
+        """Positions passing the length and q-gram count filters."""
+        size = len(keyword)
+        common = None
+        positions = []
+
+        for length, bucket in self._by_length.items():
+            longest = max(size, length)
+            if longest == 0:
+                positions.extend(bucket)
+                continue
+            allowed = Levenshtein.max_distance_for_ratio(longest, self._threshold)
+            # The edit distance is at least the difference in length
+            if allowed < abs(size - length):
+                continue
+
+            # Strings within distance k share at least this many q-grams
+            needed = longest - QGRAM_SIZE + 1 - QGRAM_SIZE * allowed
+            if needed <= 0:
+                positions.extend(bucket)
+                continue
+
+            if common is None:
+                common = self._shared_qgrams(keyword)
+            positions.extend(p for p in bucket if common.get(p, 0) >= needed)
+
+        return positions
+
+    def _shared_qgrams(self, keyword: str) -> Dict[int, int]:
+        """Count the q-grams each accepted keyword shares with ``keyword``."""
+        common: Dict[int, int] = {}
+        for gram, count in _qgrams(keyword).items():
+            for position, other_count in self._postings.get(gram, ()):
+                common[position] = common.get(position, 0) + min(count, other_count)
+        return common
+
+    def _jaro_candidates(self, keyword: str) -> List[int]:
+        """Positions whose length ratio allows a Jaro similarity above the threshold."""
+        size = len(keyword)
+        positions = []
+        for length, bucket in self._by_length.items():
+            longest = max(size, length)
+            # Jaro similarity is at most (2 + shorter / longer) / 3
+            bound = (2 + min(size, length) / longest) / 3 if longest else 1.0
+            if bound + _JARO_EPSILON > self._threshold:
+                positions.extend(bucket)
+        return positions
+
+    def _seqm_candidates(self, keyword: str) -> List[int]:
+        """Positions that the "seqm" pre-filter would let through."""
+        if not keyword:
+            return list(range(len(self._keywords)))
+
+        size = len(keyword)
+        positions = set(self._by_ends.get((keyword[0], keyword[-1]), ()))
+        if size <= 3:
+            # Pairs of short keywords are compared whatever their characters
+            positions.update(self._short)
+
+        return [
+            p for p in positions
+            if self._keywords[p] == keyword
+            or abs(size - len(self._keywords[p])) <= max(size, len(self._keywords[p])) * 0.6
+        ]
@@ -4,14 +4,158 @@ Module for highlighting text based on keywords.
 This module provides functionality to highlight specific keywords within text documents.
 It handles both single word (one-gram) and multi-word (n-gram) keyword highlighting,
 allowing for flexible text markup based on keyword extraction results.
+
+Keywords are looked up through a KeywordMatcher built once per keyword list:
+a dictionary of keyword ranks and a trie of the keywords' word characters,
+which discards almost every window of the text after a single lookup.
 """
 
 import re
 import logging
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional
 
 DEFAULT_HIGHLIGHT_PRE = "<kw>"
 DEFAULT_HIGHLIGHT_POST = "</kw>"
 
+# Punctuation removed from a window of tokens before it is compared with the keywords
+CLEAN_PATTERN = re.compile(r'[!",:.;?()]$|^[!",:.;?()]|\W[!",:.;?()]')
+
+# Characters that are not part of a keyword signature
+NON_WORD_PATTERN = re.compile(r"\W")
+
+# Maximum number of distinct tokens whose signature is remembered
+TOKEN_SIGNATURE_CACHE_SIZE = 65536
+
+
+def _lowercases_alone(char: str) -> bool:
+    """Check that lowercasing a character gives one character of the same kind."""
+    lowered = char.lower()
+    return (
+        len(lowered) == 1
+        and char != "\u03a3"  # Capital sigma lowercases depending on its neighbours
+        and bool(NON_WORD_PATTERN.match(char)) == bool(NON_WORD_PATTERN.match(lowered))
+    )
+
+
+@lru_cache(maxsize=TOKEN_SIGNATURE_CACHE_SIZE)
+def token_signature(token: str) -> Optional[str]:
+    """
+    Get the lowercased word characters of a token.
+
+    Cleaning a window with CLEAN_PATTERN only removes non-word characters,
+    so the signature of a window (the concatenated signatures of its
+    tokens) equals the signature of the keyword it matches.
+
+    Args:
+        token: A token of the text
+
+    Returns:
+        The signature, or None if the token has characters whose lowercase
+        form is not a single character of the same kind (such windows are
+        always checked in full)
+    """
+    if not token.isascii() and not all(_lowercases_alone(char) for char in token):
+        return None
+    return NON_WORD_PATTERN.sub("", token).lower()
+
+
+class KeywordMatcher:
+    """
+    Lookup structure for one list of keywords.
+
+    Behaves like the lowercased keyword list for ``in`` and ``index()``,
+    with dictionary lookups instead of list scans. It also holds a trie of
+    the keyword signatures (stored as the set of all their prefixes), so
+    candidate_lengths() can stop extending a window as soon as its tokens
+    cannot lead to any keyword.
+
+    Attributes:
+        keywords: Lowercased keywords, in ranking order
+    """
+
+    __slots__ = ("keywords", "_ranks", "_signatures", "_prefixes")
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the lookup tables.
+
+        Args:
+            keywords: Keywords to highlight, most relevant first
+        """
+        self.keywords = tuple(kw.lower() for kw in keywords)
+        self._ranks = {}
+        for rank, kw in enumerate(self.keywords):
+            self._ranks.setdefault(kw, rank)
+        self._signatures = {NON_WORD_PATTERN.sub("", kw) for kw in self._ranks}
+        self._prefixes = {
+            signature[:end]
+            for signature in self._signatures
+            for end in range(len(signature) + 1)
+        }
+
+    def __contains__(self, keyword: str) -> bool:
+        """Check whether a lowercased string is one of the keywords."""
+        return keyword in self._ranks
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the lowercased keywords in ranking order."""
+        return iter(self.keywords)
+
+    def __len__(self) -> int:
+        """Get the number of keywords."""
+        return len(self.keywords)
+
+    def index(self, keyword: str) -> int:
+        """
+        Get the rank of a keyword, like list.index().
+
+        Args:
+            keyword: Lowercased keyword
+
+        Returns:
+            Position of the first occurrence in the keyword list
+
+        Raises:
+            ValueError: If the string is not a keyword
+        """
+        try:
+            return self._ranks[keyword]
+        except KeyError:
+            raise ValueError(f"{keyword!r} is not a keyword") from None
+
+    def candidate_lengths(self, text_tokens: List[str], position: int, max_length: int) -> List[int]:
+        """
+        Get the lengths of the windows starting at a position that may be keywords.
+
+        A window can only match if its signature is a keyword signature, and
+        it can only be extended into a match while its signature is a prefix
+        of one. Windows with tokens that have no signature are kept.
+
+        Args:
+            text_tokens: List of tokens from the text
+            position: First token of the windows
+            max_length: Maximum number of tokens in a window
+
+        Returns:
+            Window lengths worth checking, in increasing order
+        """
+        lengths = []
+        signature = ""
+        unchecked = False
+        for length in range(1, min(max_length, len(text_tokens) - position) + 1):
+            if not unchecked:
+                part = token_signature(text_tokens[position + length - 1])
+                if part is None:
+                    unchecked = True
+                else:
+                    signature += part
+                    if signature not in self._prefixes:
+                        break
+                    if signature not in self._signatures:
+                        continue
+            lengths.append(length)
+        return lengths
 
 
 class TextHighlighter:
@@ -44,6 +188,29 @@ class TextHighlighter:
         self.highlight_pre = highlight_pre
         self.highlight_post = highlight_post
         self.max_ngram_size = max_ngram_size
+        self._matcher = (None, None)  # (keyword tuple, KeywordMatcher)
+
+    def get_matcher(self, keywords):
+        """
+        Get the KeywordMatcher of a keyword list.
+
+        The last matcher built is kept and reused while the highlighter is
+        given the same keywords, e.g. for every document of a corpus.
+
+        Args:
+            keywords: Keywords to highlight, or a KeywordMatcher
+
+        Returns:
+            KeywordMatcher for the keywords
+        """
+        if isinstance(keywords, KeywordMatcher):
+            return keywords
+        key = tuple(keywords)
+        cached_key, matcher = self._matcher
+        if matcher is None or cached_key != key:
+            matcher = KeywordMatcher(key)
+            self._matcher = (key, matcher)
+        return matcher
 
     def highlight(self, text, keywords):
         """
@@ -88,10 +255,12 @@ class TextHighlighter:
             Formatted text with highlighted keywords
         """
         text_tokens = text.replace("\n", " ").split(" ")
-        relevant_words_array = [kw.lower() for kw in relevant_words_array]
+        relevant_words_array = self.get_matcher(relevant_words_array)
         try:
             for tk, token in enumerate(text_tokens):
-                kw = re.sub(r'[!",:.;?()]$|^[!",:.;?()]|\W[!",:.;?()]', "", token)
+                if not relevant_words_array.candidate_lengths(text_tokens, tk, 1):
+                    continue
+                kw = CLEAN_PATTERN.sub("", token)
                 if kw.lower() in relevant_words_array:
                     text_tokens[tk] = token.replace(
                         kw, f"{self.highlight_pre}{kw}{self.highlight_post}"
@@ -115,7 +284,7 @@ class TextHighlighter:
             Formatted text with highlighted keywords
         """
         text_tokens = text.replace("\n", " ").split(" ")
-        relevant_words_array = [kw.lower() for kw in relevant_words_array]
+        relevant_words_array = self.get_matcher(relevant_words_array)
 
         y = 0
         final_splited_text = []
@@ -169,8 +338,9 @@ class TextHighlighter:
         """
         Helper method for finding relevant n-gram words.
 
-        Checks all possible n-grams starting at the current position and
-        identifies matches with the provided keywords.
+        Checks the n-grams starting at the current position that the keyword
+        matcher cannot rule out and identifies matches with the provided
+        keywords.
 
         Args:
             position: Current position in text tokens
@@ -180,27 +350,23 @@ class TextHighlighter:
         Returns:
             NgramData containing keyword list and split n-gram word list
         """
-        temporary_list = []
+        relevant_words_array = self.get_matcher(relevant_words_array)
         temporary_list_two = []
         kw_list = []
         splited_n_gram_word_list = []
 
-        for i in range(self.max_ngram_size):
-            if position + i < len(text_tokens):
-                temporary_list.append(text_tokens[position : position + i + 1])
-                k = re.sub(
-                    r'[!",:.;?()]$|^[!",:.;?()]|\W[!",:.;?()]',
-                    "",
-                    " ".join(temporary_list[i]),
-                )
-                if k.lower() in relevant_words_array:
-                    temporary_list_two.append(k)
+        for length in relevant_words_array.candidate_lengths(
+            text_tokens, position, self.max_ngram_size
+        ):
+            k = CLEAN_PATTERN.sub("", " ".join(text_tokens[position : position + length]))
+            if k.lower() in relevant_words_array:
+                temporary_list_two.append(k)
 
         if temporary_list_two:
-            sorted_temp = sorted(
-                temporary_list_two, key=lambda x: relevant_words_array.index(x.lower())
+            # The first of the most relevant matches, like a stable sort
+            kw_list.append(
+                min(temporary_list_two, key=lambda x: relevant_words_array.index(x.lower()))
             )
-            kw_list.append(sorted_temp[0])
             splited_n_gram_word_list.append(kw_list[0].split())
 
         return kw_list, splited_n_gram_word_list
@@ -503,7 +669,7 @@ class TextHighlighter:
             num_tokens = len(text_tokens) - position
 
         txt = " ".join(text_tokens[position : position + num_tokens])
-        kw_cleaned = re.sub(r'[!",:.;?()]$|^[!",:.;?()]|\W[!",:.;?()]', "", txt)
+        kw_cleaned = CLEAN_PATTERN.sub("", txt)
         new_expression = txt.replace(
             kw_cleaned,
             f"{self.highlight_pre}{n_gram_word_list[0]}{self.highlight_post}",
@@ -0,0 +1,351 @@
+"""
+Persistent keyword result cache for YAKE.
+
+This module contains the ResultCache class, an opt-in SQLite store of
+extraction results shared by every process that opens the same file. Entries
+are keyed by a hash of the document text combined with a fingerprint of
+everything that influences the result (configuration, stopword set,
+lemmatization settings, package version and a hash of the package's source
+code), so a changed document, setting or scoring code never returns a stale
+result.
+
+The total size of the stored results is bounded: when a write pushes it over
+``max_bytes``, the least recently used entries are evicted until it drops to
+``EVICTION_TARGET`` of the limit. Recency is approximate: a hit only
+records its access time when the stored one is older than
+``ACCESS_RESOLUTION``, so read-heavy workloads mostly run read-only
+transactions. The database runs in WAL mode and writes take the lock up
+front, so worker processes can read and write concurrently.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from importlib import metadata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Default bound on the stored results (bytes of serialized keywords)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Fraction of max_bytes kept after an eviction, so that evictions are batched
+EVICTION_TARGET = 0.9
+
+# Seconds within which repeated hits on an entry do not update its access time
+ACCESS_RESOLUTION = 60.0
+
+# Bump when the stored value format changes
+SCHEMA_VERSION = 1
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results ("
+    " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+    " size INTEGER NOT NULL, accessed INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)",
+    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO meta (name, value) VALUES ('total_size', 0)",
+)
+
+
+# Root of the yake package, whose source code is part of every fingerprint
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@functools.lru_cache(maxsize=None)
+def _package_version() -> str:
+    """Installed yake version, part of every fingerprint."""
+    try:
+        return metadata.version("yake")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=None)
+def code_digest() -> str:
+    """
+    Hash the source code of the yake package (computed once per process).
+
+    The version does not change between edits of a source checkout or an
+    editable install, so it alone would let results of older scoring code
+    be served.
+
+    Returns:
+        Hex SHA-256 digest of the paths and contents of the package's
+        Python files, or "unknown" if they cannot be read
+    """
+    digest = hashlib.sha256()
+    try:
+        for directory, subdirectories, files in os.walk(PACKAGE_DIR):
+            subdirectories[:] = sorted(d for d in subdirectories if d != "__pycache__")
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    path = os.path.join(directory, name)
+                    digest.update(os.path.relpath(path, PACKAGE_DIR).encode("utf-8"))
+                    with open(path, "rb") as source:
+                        digest.update(source.read())
+    except OSError as e:
+        logger.warning("Cannot hash the yake source code: %s", e)
+        return "unknown"
+    return digest.hexdigest()
+
+
+def text_digest(text: str) -> str:
+    """
+    Hash a document's text.
+
+    Args:
+        text: Document text
+
+    Returns:
+        Hex SHA-256 digest of the UTF-8 encoded text
+    """
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def stopwords_digest(stopwords: Iterable[str]) -> str:
+    """
+    Hash a stopword set independently of its iteration order.
+
+    Args:
+        stopwords: Stopword set
+
+    Returns:
+        Hex SHA-256 digest of the sorted words
+    """
+    return hashlib.sha256("\n".join(sorted(stopwords)).encode("utf-8")).hexdigest()
+
+
+def config_fingerprint(settings: Dict[str, Any], stopwords_hash: str) -> str:
+    """
+    Hash the settings that determine an extraction result.
+
+    Extractors compute their fingerprint once and reuse it for every
+    document.
+
+    Args:
+        settings: JSON-serializable settings (configuration and
+            lemmatization options); dictionary order does not matter
+        stopwords_hash: Digest of the stopword set (see stopwords_digest)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(
+        {
+            "settings": settings,
+            "stopwords": stopwords_hash,
+            "version": _package_version(),
+            "code": code_digest(),
+            "schema": SCHEMA_VERSION,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Size-bounded LRU cache of keyword results in a SQLite file.
+
+    Instances can be pickled (only the path and limits are kept) and each
+    process opens its own connection on first use, so an extractor holding a
+    cache can be sent to worker processes.
+
+    Attributes:
+        See method accessors below for available information.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES, timeout: float = 30.0):
+        """
+        Open (or create) a result cache.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Bound on the size of the stored results
+                (default: DEFAULT_MAX_BYTES)
+            timeout: Seconds to wait for another process's lock
+        """
+        self._path = os.fspath(path)
+        self._max_bytes = max_bytes
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "errors": 0}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Keep only the settings when pickled."""
+        return {"path": self._path, "max_bytes": self._max_bytes, "timeout": self._timeout}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild an unconnected cache from pickled settings."""
+        self.__init__(state["path"], state["max_bytes"], state["timeout"])
+
+    @property
+    def path(self) -> str:
+        """Get the database file path."""
+        return self._path
+
+    @property
+    def max_bytes(self) -> int:
+        """Get the bound on the stored result size."""
+        return self._max_bytes
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this process's connection, opening it if needed."""
+        if self._connection is None or self._pid != os.getpid():
+            # A connection inherited through fork must not be used
+            connection = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, key: str) -> Optional[List[Tuple[str, float]]]:
+        """
+        Look up a result and mark it as recently used.
+
+        The access time is only written when the stored one is older than
+        ACCESS_RESOLUTION, so most hits do not take the database's write
+        lock.
+
+        Args:
+            key: Cache key (see KeywordExtractor)
+
+        Returns:
+            List of (keyword, score) tuples, or None if not cached
+        """
+        with self._lock:
+            try:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT value, accessed FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                now = time.time_ns()
+                if row is not None and now - row[1] > ACCESS_RESOLUTION * 1e9:
+                    connection.execute(
+                        "UPDATE results SET accessed = ? WHERE key = ?", (now, key)
+                    )
+            except sqlite3.Error as e:
+                self._stats["errors"] += 1
+                logger.warning("Result cache lookup failed: %s", e)
+                return None
+
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+        return [(kw, score) for kw, score in json.loads(row[0])]
+
+    def put(self, key: str, keywords: List[Tuple[str, float]]) -> None:
+        """
+        Store a result, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key (see KeywordExtractor)
+            keywords: List of (keyword, score) tuples
+        """
+        value = json.dumps(keywords, ensure_ascii=False)
+        size = len(key) + len(value.encode("utf-8"))
+        with self._lock:
+            try:
+                connection = self._connect()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self._stats["evictions"] += self._write(connection, key, value, size)
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+                self._stats["writes"] += 1
+            except sqlite3.Error as e:
+                self._stats["errors"] += 1
+                logger.warning("Result cache write failed: %s", e)
+
+    def _write(self, connection: sqlite3.Connection, key: str, value: str, size: int) -> int:
+        """Insert an entry and evict inside the current transaction; return evictions."""
+        row = connection.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+        connection.execute(
+            "INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+            (key, value, size, time.time_ns()),
+        )
+        connection.execute(
+            "UPDATE meta SET value = value + ? WHERE name = 'total_size'",
+            (size - (row[0] if row else 0),),
+        )
+        (total,) = connection.execute(
+            "SELECT value FROM meta WHERE name = 'total_size'"
+        ).fetchone()
+        if total <= self._max_bytes:
+            return 0
+
+        target = self._max_bytes * EVICTION_TARGET
+        evicted = []
+        for old_key, old_size in connection.execute(
+            "SELECT key, size FROM results WHERE key != ? ORDER BY accessed", (key,)
+        ).fetchall():
+            if total <= target:
+                break
+            evicted.append((old_key,))
+            total -= old_size
+        connection.executemany("DELETE FROM results WHERE key = ?", evicted)
+        connection.execute("UPDATE meta SET value = ? WHERE name = 'total_size'", (total,))
+        return len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counts of this process and the size of the database.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, writes, evictions, errors,
+            entries, size_bytes and max_bytes
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            try:
+                connection = self._connect()
+                (stats["entries"],) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+                (stats["size_bytes"],) = connection.execute(
+                    "SELECT value FROM meta WHERE name = 'total_size'"
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Result cache statistics unavailable: %s", e)
+                stats["entries"] = stats["size_bytes"] = None
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / total * 100 if total > 0 else 0
+        stats["max_bytes"] = self._max_bytes
+        return stats
+
+    def __len__(self) -> int:
+        """Get the number of stored results."""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every stored result (for all configurations)."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM results")
+            connection.execute("UPDATE meta SET value = 0 WHERE name = 'total_size'")
+            connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close this process's connection (it is reopened on next use)."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
@@ -0,0 +1,273 @@
+"""
+Process-wide stopword registry for YAKE keyword extraction.
+
+Stopword lists are loaded at most once per process and language, as
+frozensets shared by every KeywordExtractor. Lists come from a precompiled
+binary pack of all languages when one is available (built when the wheel is
+built, see hatch_build.py), and from the text files in StopwordsList
+otherwise.
+
+The pack layout is::
+
+    MAGIC | header length (uint32, little endian) | header | words
+
+where the header is UTF-8 JSON mapping each language code to the
+(offset, size, count) of its newline-separated, UTF-8 encoded words.
+
+This module only depends on the standard library so that the build hook can
+load it without the package's runtime dependencies.
+"""
+
+import json
+import logging
+import os
+import struct
+import sys
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Directory holding the stopwords_<code>.txt lists
+STOPWORDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "StopwordsList")
+
+# Default location of the precompiled pack
+PACK_PATH = os.path.join(STOPWORDS_DIR, "stopwords.pack")
+
+# Language-agnostic list used for languages without their own list
+FALLBACK_LANGUAGE = "noLang"
+
+_PACK_MAGIC = b"YAKESW\x00\x01"
+_HEADER_SIZE = struct.Struct("<I")
+
+# Loaded lists by language code
+_REGISTRY: Dict[str, FrozenSet[str]] = {}
+# Resolved language codes by requested language (see resolve_language)
+_RESOLVED: Dict[str, str] = {}
+# Pack contents: (path, header, raw words) once read, None if unavailable
+_PACK: Optional[Tuple[str, Dict[str, List[int]], bytes]] = None
+_PACK_LOADED = False
+_LOCK = threading.Lock()
+
+
+def _text_path(code: str) -> str:
+    """Path of the text list for a language code."""
+    return os.path.join(STOPWORDS_DIR, f"stopwords_{code}.txt")
+
+
+def _read_text_list(path: str) -> FrozenSet[str]:
+    """
+    Read a stopword text file.
+
+    Lines are lowercased and kept as they are otherwise (an empty string is
+    part of the set when the file ends with a newline, as before).
+
+    Args:
+        path: Path of a stopwords_<code>.txt file
+
+    Returns:
+        Frozenset of stopwords
+    """
+    try:
+        with open(path, encoding="utf-8") as stop_file:
+            return frozenset(stop_file.read().lower().split("\n"))
+    except UnicodeDecodeError:
+        # Fall back to ISO-8859-1 encoding if UTF-8 fails
+        logger.warning("Reading stopword list %s as ISO-8859-1", path)
+        with open(path, encoding="ISO-8859-1") as stop_file:
+            return frozenset(stop_file.read().lower().split("\n"))
+
+
+def text_languages() -> List[str]:
+    """
+    List the language codes that have a stopword text file.
+
+    Returns:
+        Sorted language codes, including the language-agnostic list
+    """
+    prefix, suffix = "stopwords_", ".txt"
+    return sorted(
+        name[len(prefix):-len(suffix)]
+        for name in os.listdir(STOPWORDS_DIR)
+        if name.startswith(prefix) and name.endswith(suffix)
+    )
+
+
+def build_pack(path: str = PACK_PATH, languages: Optional[Iterable[str]] = None) -> str:
+    """
+    Compile the stopword text files into a binary pack.
+
+    Args:
+        path: Where to write the pack
+        languages: Language codes to include (default: all text files)
+
+    Returns:
+        The path of the written pack
+    """
+    header: Dict[str, List[int]] = {}
+    chunks = []
+    offset = 0
+    for code in languages if languages is not None else text_languages():
+        words = sorted(_read_text_list(_text_path(code)))
+        data = "\n".join(words).encode("utf-8")
+        header[code] = [offset, len(data), len(words)]
+        chunks.append(data)
+        offset += len(data)
+
+    encoded = json.dumps(header, sort_keys=True).encode("utf-8")
+    with open(path, "wb") as pack_file:
+        pack_file.write(_PACK_MAGIC)
+        pack_file.write(_HEADER_SIZE.pack(len(encoded)))
+        pack_file.write(encoded)
+        pack_file.write(b"".join(chunks))
+    return path
+
+
+def load_pack(path: str = PACK_PATH) -> bool:
+    """
+    Use a binary pack as the source of stopword lists.
+
+    Lists already in the registry are kept; other languages are read from
+    the pack from now on.
+
+    Args:
+        path: Path of a pack written by build_pack()
+
+    Returns:
+        True if the pack was loaded, False if it is missing or invalid
+    """
+    global _PACK, _PACK_LOADED  # pylint: disable=global-statement
+    with _LOCK:
+        _PACK_LOADED = True
+        _PACK = None
+        _RESOLVED.clear()
+        try:
+            with open(path, "rb") as pack_file:
+                content = pack_file.read()
+        except OSError:
+            return False
+
+        start = len(_PACK_MAGIC) + _HEADER_SIZE.size
+        if not content.startswith(_PACK_MAGIC) or len(content) < start:
+            logger.warning("Ignoring invalid stopword pack %s", path)
+            return False
+        (header_size,) = _HEADER_SIZE.unpack_from(content, len(_PACK_MAGIC))
+        header = json.loads(content[start:start + header_size].decode("utf-8"))
+        _PACK = (path, header, content[start + header_size:])
+        return True
+
+
+def _pack() -> Optional[Tuple[str, Dict[str, List[int]], bytes]]:
+    """Get the pack contents, loading the default pack on first use."""
+    if not _PACK_LOADED:
+        load_pack()
+    return _PACK
+
+
+def _pack_list(code: str) -> Optional[FrozenSet[str]]:
+    """Read one language from the pack, or None if it is not there."""
+    pack = _pack()
+    if pack is None or code not in pack[1]:
+        return None
+    offset, size, count = pack[1][code]
+    if not count:
+        return frozenset()
+    return frozenset(pack[2][offset:offset + size].decode("utf-8").split("\n"))
+
+
+def resolve_language(lan: str) -> str:
+    """
+    Map a language name to the code of the list used for it.
+
+    Only the first two letters count, case-insensitively; languages without
+    a list use the language-agnostic one. Results are remembered until the
+    pack or the registry changes, so the file system is only checked once
+    per language.
+
+    Args:
+        lan: Language, e.g. "en", "pt" or "english"
+
+    Returns:
+        Language code of an available stopword list
+    """
+    resolved = _RESOLVED.get(lan)
+    if resolved is None:
+        code = lan[:2].lower()
+        pack = _pack()
+        if (pack is not None and code in pack[1]) or os.path.exists(_text_path(code)):
+            resolved = code
+        else:
+            resolved = FALLBACK_LANGUAGE
+        _RESOLVED[lan] = resolved
+    return resolved
+
+
+def get_stopwords(lan: str) -> FrozenSet[str]:
+    """
+    Get the shared stopword set of a language.
+
+    The list is read once per process, from the pack if it has the language
+    and from the text file otherwise; later calls return the same object.
+
+    Args:
+        lan: Language, e.g. "en" or "pt"
+
+    Returns:
+        Frozenset of stopwords
+    """
+    code = resolve_language(lan)
+    stopwords = _REGISTRY.get(code)
+    if stopwords is None:
+        with _LOCK:
+            stopwords = _REGISTRY.get(code)
+            if stopwords is None:
+                stopwords = _pack_list(code)
+                if stopwords is None:
+                    stopwords = _read_text_list(_text_path(code))
+                # Share identical strings across languages and instances
+                stopwords = frozenset(sys.intern(word) for word in stopwords)
+                _REGISTRY[code] = stopwords
+    return stopwords
+
+
+def merge_stopwords(base: FrozenSet[str], extra: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """
+    Add custom stopwords to a shared set, copying only when needed.
+
+    Args:
+        base: Shared stopword set (left unchanged)
+        extra: Additional stopwords, compared in lowercase
+
+    Returns:
+        ``base`` itself if it already contains every extra word, otherwise a
+        new frozenset with the union
+    """
+    if not extra:
+        return base
+    missing = {word.lower() for word in extra} - base
+    return base | missing if missing else base
+
+
+def loaded_languages() -> List[str]:
+    """
+    List the language codes currently held by the registry.
+
+    Returns:
+        Sorted language codes
+    """
+    return sorted(_REGISTRY)
+
+
+def clear_registry() -> None:
+    """Drop all loaded lists and forget the pack (mainly for tests)."""
+    global _PACK, _PACK_LOADED  # pylint: disable=global-statement
+    with _LOCK:
+        _REGISTRY.clear()
+        _RESOLVED.clear()
+        _PACK = None
+        _PACK_LOADED = False
+
+
+if __name__ == "__main__":
+    print(build_pack(sys.argv[1] if len(sys.argv) > 1 else PACK_PATH))
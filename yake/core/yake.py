@@ -7,17 +7,55 @@ deduplication of similar keywords, and the entire extraction pipeline from raw t
 to ranked keywords.
 """
 
-import os
+import heapq
 import logging
-import functools
-from typing import List, Tuple, Optional, Set, Callable
+import os
+import threading
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 import jellyfish  # pylint: disable=import-error
-from yake.data import DataCore
+from yake.data import DataCore, ExtractionStats, Tokenizer, get_tokenizer
 from .Levenshtein import Levenshtein
+from .aio import extract_keywords_async, iter_extract_async
+from .batch import extract_batch
+from .cache import BoundedCache, lru_cache_stats
+from .concurrency import new_counters
+from .dedup import DedupIndex, EXACT_METHODS, dedup_method
+from .result_cache import ResultCache, config_fingerprint, stopwords_digest, text_digest
+from .stopwords import get_stopwords, merge_stopwords
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Keywords whose lemma an extractor remembers across documents
+LEMMA_CACHE_SIZE = 10000
+
+# Keyword pairs whose similarity an extractor remembers across documents
+SIMILARITY_CACHE_SIZE = 30000
+
+# spaCy pipeline components that lemmatization needs; the others (parser,
+# named entities, ...) are disabled when lemmatizing keywords
+SPACY_LEMMA_COMPONENTS = frozenset(
+    {"tok2vec", "tagger", "morphologizer", "attribute_ruler", "lemmatizer", "trainable_lemmatizer"}
+)
+
+# Keywords per spaCy nlp.pipe batch
+SPACY_BATCH_SIZE = 256
+
 
 class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
     """
@@ -46,6 +84,18 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
         lemmatize: bool = False,
         lemma_aggregation: str = "min",
         lemmatizer: str = "spacy",
+        vectorized: bool = False,
+        dedup_index: Optional[bool] = None,
+        extra_stopwords: Optional[Iterable[str]] = None,
+        result_cache: Union[ResultCache, str, None] = None,
+        collect_stats: bool = False,
+        stats_callback: Optional[Callable[[ExtractionStats], None]] = None,
+        lean: bool = False,
+        tokenizer: Union[str, Tokenizer] = "segtok",
+        lemma_cache_size: int = LEMMA_CACHE_SIZE,
+        thread_safe: bool = False,
+        similarity_cache_size: Optional[int] = SIMILARITY_CACHE_SIZE,
+        similarity_cache_bytes: Optional[int] = None,
         **kwargs
     ):
         """
@@ -70,6 +120,44 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
                 "harmonic" (harmonic mean). Default: "min"
             lemmatizer: Lemmatization library to use: "spacy" or "nltk"
                 (default: "spacy")
+            vectorized: Score terms and candidates with the NumPy feature
+                engine instead of per-object Python code (default: False).
+                Produces the same keywords; faster on long documents.
+            dedup_index: Compare candidates only with the accepted keywords
+                that a blocking index proposes as possible near-duplicates
+                (default: None = enabled for "levs" and "jaro", where it is
+                exact, and disabled for "seqm", where it keeps the same
+                keywords but changes the similarity cache statistics)
+            extra_stopwords: Words to treat as stopwords in addition to the
+                language list (default: None). The shared language set is
+                only copied if some of these words are not already in it.
+            result_cache: Persistent result cache, as a ResultCache or the
+                path of its SQLite file (default: None = disabled). Results
+                are keyed by the text and every setting that affects them.
+            collect_stats: Record per-stage timings and counts of each
+                extraction in ``last_stats`` (default: False)
+            stats_callback: Function called with the ExtractionStats of each
+                extraction; implies collect_stats (default: None). Neither
+                option is passed on to worker processes.
+            lean: Build documents with the DataCore lean mode, which keeps
+                no sentence structures and skips candidates that can never be
+                valid (default: False). Same keywords, less memory.
+            tokenizer: Sentence splitter and word tokenizer backend: "segtok"
+                or "regex", or a Tokenizer instance (default: "segtok"). The
+                regex backend reproduces segtok with the standard ``re``
+                module and is faster on long documents.
+            lemma_cache_size: Number of keyword lemmas kept across documents
+                when lemmatizing, least recently used first out (default:
+                10000, 0 disables the cache)
+            thread_safe: Allow one extractor to be used by several threads at
+                once, including on free-threaded Python (default: False).
+                Cache statistics are kept per thread and summed on read,
+                and ``last_stats`` is per thread.
+            similarity_cache_size: Number of keyword pair similarities kept
+                across documents, least recently used first out (default:
+                30000, None = limited by similarity_cache_bytes only)
+            similarity_cache_bytes: Approximate memory budget of the
+                similarity cache in bytes (default: None = no byte limit)
             **kwargs: Additional configuration parameters (for backwards
                 compatibility)
         """
@@ -82,6 +170,10 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
             "window_size": window_size,
             "top": top,
             "features": features,
+            "vectorized": vectorized,
+            "dedup_index": dedup_index,
+            "lean": lean,
+            "tokenizer": tokenizer,
         }
 
         # Override with any kwargs for backwards compatibility
@@ -89,67 +181,201 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
             if key in kwargs:
                 self.config[key] = kwargs[key]
 
+        get_tokenizer(self.config["tokenizer"])  # Fail early on unknown backends
+
         # Lemmatization configuration
         self.lemmatize = lemmatize
         self.lemma_aggregation = lemma_aggregation
         self.lemmatizer = lemmatizer
         self._lemmatizer_instance = None  # Lazy loaded when needed
         self._lemmatizer_load_failed = False  # Track if loading failed to avoid repeated warnings
+        self._lemma_cache = BoundedCache(max_entries=lemma_cache_size, thread_safe=thread_safe)
+        self._lemma_lock = threading.RLock()  # Guards the lemmatizer and its cache
 
         # Load appropriate stopwords and deduplication function
-        self.stopword_set = self._load_stopwords(stopwords or kwargs.get("stopwords"))
+        self._custom_stopwords = (stopwords or kwargs.get("stopwords")) is not None
+        self._extra_stopwords = extra_stopwords
+        self.stopword_set = merge_stopwords(
+            self._load_stopwords(stopwords or kwargs.get("stopwords")), extra_stopwords
+        )
         self.dedup_function = self._get_dedup_function(self.config["dedup_func"])
 
         # Initialize optimization components
-        self._similarity_cache = {}
-
-        # Cache management stats (combined to reduce instance attributes)
-        self._cache_stats = {
-            'hits': 0,
-            'misses': 0,
-            'docs_processed': 0,
-            'last_text_size': 0
+        self._similarity_cache = BoundedCache(
+            max_entries=similarity_cache_size,
+            max_bytes=similarity_cache_bytes,
+            thread_safe=thread_safe,
+        )
+        if isinstance(result_cache, (str, os.PathLike)):
+            result_cache = ResultCache(result_cache)
+        self._result_cache = result_cache
+        self._fingerprint = (None, "")  # (stopword set, fingerprint) for cache keys
+        if result_cache is not None:
+            self._result_fingerprint()
+
+        # Instrumentation (off unless requested)
+        self._collect_stats = collect_stats or stats_callback is not None
+        self._stats_callback = stats_callback
+        self._last_stats = None
+
+        # Thread-safe mode: per-thread scratch state and counters
+        self._thread_safe = thread_safe
+        self._thread_state = threading.local() if thread_safe else None
+        self._doc_counters = new_counters(("docs_processed",), thread_safe)
+
+    def worker_params(self) -> Dict[str, Any]:
+        """
+        Constructor arguments that rebuild an equivalent extractor.
+
+        Used by the batch API to initialise one extractor per worker process.
+        Language stopwords are reloaded by each worker; only custom stopword
+        sets are shipped along.
+
+        Returns:
+            Keyword arguments for KeywordExtractor
+        """
+        return {
+            "lan": self.config["lan"],
+            "n": self.config["n"],
+            "dedup_lim": self.config["dedup_lim"],
+            "dedup_func": self.config["dedup_func"],
+            "window_size": self.config["window_size"],
+            "top": self.config["top"],
+            "features": self.config["features"],
+            "stopwords": self.stopword_set if self._custom_stopwords else None,
+            "extra_stopwords": None if self._custom_stopwords else self._extra_stopwords,
+            "lemmatize": self.lemmatize,
+            "lemma_aggregation": self.lemma_aggregation,
+            "lemmatizer": self.lemmatizer,
+            "lemma_cache_size": self._lemma_cache.max_entries,
+            "thread_safe": self._thread_safe,
+            "similarity_cache_size": self._similarity_cache.max_entries,
+            "similarity_cache_bytes": self._similarity_cache.max_bytes,
+            "vectorized": self.config["vectorized"],
+            "dedup_index": self.config["dedup_index"],
+            "lean": self.config["lean"],
+            "tokenizer": self.config["tokenizer"],
+            "result_cache": self._result_cache,
         }
 
-    def _load_stopwords(self, stopwords: Optional[Set[str]]) -> Set[str]:
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the locks and thread-local state when pickled."""
+        state = self.__dict__.copy()
+        state["_lemma_lock"] = None
+        state["_thread_state"] = None
+        state["_doc_counters"] = None
+        state["_last_stats"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Recreate the locks and thread-local state of an unpickled extractor."""
+        self.__dict__.update(state)
+        self._lemma_lock = threading.RLock()
+        self._doc_counters = new_counters(("docs_processed",), self._thread_safe)
+        if self._thread_safe:
+            self._thread_state = threading.local()
+
+    @property
+    def thread_safe(self) -> bool:
+        """Get whether the extractor may be shared between threads."""
+        return self._thread_safe
+
+    @property
+    def last_stats(self) -> Optional[ExtractionStats]:
         """
-        Load stopwords from file or use provided set.
+        Get the statistics of the latest extraction, if collected.
 
-        This method handles the loading of language-specific stopwords from
-        the appropriate resource file, falling back to a language-agnostic
-        list if the specific language is not available.
+        In thread-safe mode, this is the latest extraction of the calling
+        thread.
+        """
+        if self._thread_state is not None:
+            return getattr(self._thread_state, "last_stats", None)
+        return self._last_stats
+
+    def _call_counters(self) -> Dict[str, int]:
+        """
+        Get the similarity cache counters that the current call updates.
+
+        Returns:
+            The calling thread's own counters in thread-safe mode, else the
+            extractor's shared counters
+        """
+        return self._similarity_cache.counters()
+
+    def _new_stats(self) -> Optional[ExtractionStats]:
+        """Start recording an extraction, or return None when not instrumented."""
+        return ExtractionStats() if self._collect_stats else None
+
+    def _finish_stats(self, stats: ExtractionStats, keywords: List[Tuple[str, float]]) -> None:
+        """Publish the statistics of a finished extraction."""
+        stats.counts["keywords"] = len(keywords)
+        if self._thread_state is not None:
+            self._thread_state.last_stats = stats
+        else:
+            self._last_stats = stats
+        if self._stats_callback is not None:
+            self._stats_callback(stats)
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """Get the persistent result cache, or None if disabled."""
+        return self._result_cache
+
+    def _result_cache_key(self, text: str) -> str:
+        """
+        Build the persistent cache key of a document for this extractor.
 
         Args:
-            stopwords: Custom set of stopwords to use
+            text: Document text as given to extract_keywords
 
         Returns:
-            A set of stopwords for filtering non-content words
+            Fingerprint of the settings and stopwords, followed by the text hash
         """
-        # Use provided stopwords if available
-        if stopwords is not None:
-            return set(stopwords)
+        return f"{self._result_fingerprint()}:{text_digest(text)}"
 
-        # Determine the path to the appropriate stopword list
-        dir_path = os.path.dirname(os.path.realpath(__file__))
-        local_path = os.path.join(
-            "StopwordsList", f"stopwords_{self.config['lan'][:2].lower()}.txt"
-        )
+    def _result_fingerprint(self) -> str:
+        """
+        Get the fingerprint of this extractor's settings for cache keys.
 
-        # Fall back to language-agnostic list if specific language not available
-        if not os.path.exists(os.path.join(dir_path, local_path)):
-            local_path = os.path.join("StopwordsList", "stopwords_noLang.txt")
+        Computed once (when the extractor is created with a result cache)
+        and reused for every document; it is only recomputed if the
+        stopword set is replaced.
 
-        resource_path = os.path.join(dir_path, local_path)
+        Returns:
+            Fingerprint of the settings and stopwords (see config_fingerprint)
+        """
+        if self._fingerprint[0] is not self.stopword_set:
+            settings = dict(
+                self.config,
+                lemmatize=self.lemmatize,
+                lemma_aggregation=self.lemma_aggregation,
+                lemmatizer=self.lemmatizer,
+            )
+            fingerprint = config_fingerprint(settings, stopwords_digest(self.stopword_set))
+            self._fingerprint = (self.stopword_set, fingerprint)
+        return self._fingerprint[1]
 
-        # Attempt to read the stopword file with UTF-8 encoding
-        try:
-            with open(resource_path, encoding="utf-8") as stop_file:
-                return set(stop_file.read().lower().split("\n"))
-        except UnicodeDecodeError:
-            # Fall back to ISO-8859-1 encoding if UTF-8 fails
-            print("Warning: reading stopword list as ISO-8859-1")
-            with open(resource_path, encoding="ISO-8859-1") as stop_file:
-                return set(stop_file.read().lower().split("\n"))
+    def _load_stopwords(self, stopwords: Optional[Set[str]]) -> FrozenSet[str]:
+        """
+        Load stopwords from the shared registry or use provided set.
+
+        Language-specific stopwords come from the process-wide registry in
+        yake.core.stopwords, which reads each language once (from the
+        precompiled pack or the resource file) and shares the resulting
+        frozenset between all extractors. Languages without a list fall back
+        to the language-agnostic one.
+
+        Args:
+            stopwords: Custom set of stopwords to use
+
+        Returns:
+            A frozenset of stopwords for filtering non-content words
+        """
+        # Use provided stopwords if available
+        if stopwords is not None:
+            return frozenset(stopwords)
+
+        return get_stopwords(self.config["lan"])
 
     def _get_dedup_function(self, func_name: str) -> Callable[[str, str], float]:
         """
@@ -165,12 +391,20 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
             Reference to the selected string similarity function
         """
         # Map function names to their implementations
-        return {
-            "jaro_winkler": self.jaro,
-            "jaro": self.jaro,
-            "sequencematcher": self.seqm,
-            "seqm": self.seqm,
-        }.get(func_name.lower(), self.levs)
+        return getattr(self, dedup_method(func_name))
+
+    def _new_dedup_index(self) -> Optional[DedupIndex]:
+        """
+        Create the blocking index used by one deduplication pass.
+
+        Returns:
+            A DedupIndex, or None when every accepted keyword is compared
+        """
+        method = dedup_method(self.config["dedup_func"])
+        enabled = self.config["dedup_index"]
+        if enabled is None:
+            enabled = method in EXACT_METHODS
+        return DedupIndex(method, self.config["dedup_lim"]) if enabled else None
 
     def jaro(self, cand1: str, cand2: str) -> float:
         """
@@ -204,6 +438,26 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
         """
         return 1 - Levenshtein.distance(cand1, cand2) / max(len(cand1), len(cand2))
 
+    def is_similar(self, cand1: str, cand2: str) -> bool:
+        """
+        Check whether two candidates are near-duplicates.
+
+        Equivalent to ``self.dedup_function(cand1, cand2) > dedup_lim``. For
+        "levs" the threshold bounds the edit distance that has to be
+        computed, so clearly different candidates are rejected early (see
+        Levenshtein.is_similar); other functions compute the full similarity.
+
+        Args:
+            cand1: First string to compare
+            cand2: Second string to compare
+
+        Returns:
+            True if the similarity is above the deduplication threshold
+        """
+        if self.dedup_function == self.levs:  # pylint: disable=comparison-with-callable
+            return Levenshtein.is_similar(cand1, cand2, self.config["dedup_lim"])
+        return self.dedup_function(cand1, cand2) > self.config["dedup_lim"]
+
     def seqm(self, cand1: str, cand2: str) -> float:
         """
         Calculate sequence matcher ratio between two strings.
@@ -222,7 +476,6 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
         return self._optimized_similarity(cand1, cand2)
 
     @staticmethod
-    @functools.lru_cache(maxsize=50000)
     # pylint: disable=too-many-locals,too-many-return-statements
     def _ultra_fast_similarity(s1: str, s2: str) -> float:
         """
@@ -231,9 +484,8 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
         Combines multiple heuristics for maximum speed while maintaining
         accuracy.
 
-        Note: Static method to enable proper LRU caching across all instances.
-        Cache is shared between all KeywordExtractor objects for maximum
-        efficiency.
+        Note: Not cached itself; _optimized_similarity keeps the scores in
+        the extractor's own similarity cache.
 
         Args:
             s1: First string to compare
@@ -331,11 +583,9 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
         # Cache lookup FIRST (consistent ordering for maximum hits)
         cache_key = (cand1, cand2) if cand1 <= cand2 else (cand2, cand1)
 
-        if cache_key in self._similarity_cache:
-            self._cache_stats['hits'] += 1
-            return self._similarity_cache[cache_key]
-
-        self._cache_stats['misses'] += 1
+        cached = self._similarity_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Pre-filter for quick rejection (after cache miss)
         if not self._aggressive_pre_filter(cand1, cand2):
@@ -344,17 +594,17 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
             result = self._ultra_fast_similarity(cand1, cand2)
 
         # Cache ALL results including zeros (prevents recalculation)
-        if len(self._similarity_cache) < 30000:
-            self._similarity_cache[cache_key] = result
+        self._similarity_cache.put(cache_key, result)
 
         return result
 
-    def _get_lemmatizer_instance(self):  # pylint: disable=too-many-return-statements
+    def _get_lemmatizer_instance(self):
         """
         Lazy load lemmatizer instance.
 
         Returns the lemmatizer instance, loading it on first use to avoid
-        unnecessary overhead when lemmatization is disabled.
+        unnecessary overhead when lemmatization is disabled. Concurrent first
+        calls load it once.
 
         Returns:
             Lemmatizer instance (spacy.Language or nltk lemmatizer)
@@ -363,9 +613,19 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
         if self._lemmatizer_instance is not None:
             return self._lemmatizer_instance
 
-        # If we already tried and failed, don't try again
-        if self._lemmatizer_load_failed:
-            return None
+        with self._lemma_lock:
+            # If we already tried and failed, don't try again
+            if self._lemmatizer_instance is not None or self._lemmatizer_load_failed:
+                return self._lemmatizer_instance
+            return self._load_lemmatizer_instance()
+
+    def _load_lemmatizer_instance(self):  # pylint: disable=too-many-return-statements
+        """
+        Load the configured lemmatizer (helper for _get_lemmatizer_instance).
+
+        Returns:
+            Lemmatizer instance, or None if it cannot be loaded
+        """
 
         if self.lemmatizer == "spacy":
             try:
@@ -472,6 +732,57 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
 
         return text
 
+    def _lemmatize_texts(self, texts: List[str]) -> List[str]:
+        """
+        Lemmatize several texts at once, reusing lemmas of earlier documents.
+
+        Lemmas are looked up in the extractor's LRU cache first. With spaCy,
+        the remaining texts go through a single ``nlp.pipe`` call with the
+        components that lemmatization does not need (parser, NER, ...)
+        disabled. Threads sharing the extractor lemmatize one at a time.
+
+        Args:
+            texts: Texts to lemmatize
+
+        Returns:
+            Lemmatized texts, in the order of ``texts``
+        """
+        lemmatizer = self._get_lemmatizer_instance()
+        if lemmatizer is None:
+            return list(texts)
+
+        with self._lemma_lock:
+            return self._lemmatize_texts_locked(lemmatizer, texts)
+
+    def _lemmatize_texts_locked(self, lemmatizer: Any, texts: List[str]) -> List[str]:
+        """Lemmatize texts with the lemma lock held (helper for _lemmatize_texts)."""
+        cache = self._lemma_cache
+        lemmas = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            lemma = cache.get(text)
+            if lemma is None:
+                missing.append(text)
+            else:
+                lemmas[text] = lemma
+
+        if missing:
+            if self.lemmatizer == "spacy":
+                disabled = [
+                    name for name in lemmatizer.pipe_names if name not in SPACY_LEMMA_COMPONENTS
+                ]
+                docs = lemmatizer.pipe(missing, disable=disabled, batch_size=SPACY_BATCH_SIZE)
+                for text, doc in zip(missing, docs):
+                    lemmas[text] = " ".join([token.lemma_ for token in doc])
+            else:
+                for text in missing:
+                    lemmas[text] = self._lemmatize_text(text)
+
+            for text in missing:
+                cache.put(text, lemmas[text])
+
+        return [lemmas[text] for text in texts]
+
     def _lemmatize_keywords(  # pylint: disable=too-many-locals
         self,
         keywords: List[Tuple[str, float]]
@@ -503,9 +814,9 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
 
         lemma_groups = defaultdict(list)
 
-        # Group keywords by their lemma
-        for kw, score in keywords:
-            lemma = self._lemmatize_text(kw)
+        # Group keywords by their lemma (all keywords lemmatized in one batch)
+        lemmas = self._lemmatize_texts([kw for kw, _ in keywords])
+        for (kw, score), lemma in zip(keywords, lemmas):
             # Store original keyword and score
             lemma_groups[lemma].append((kw, score))
 
@@ -591,72 +902,36 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
             logger.debug("Empty text provided, returning empty result")
             return []
 
+        stats = self._new_stats()
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = self._result_cache_key(text)
+            cached = self._result_cache.get(cache_key)
+            if stats is not None:
+                stats.lap("result_cache")
+            if cached is not None:
+                if stats is not None:
+                    stats.count("result_cache_hits")
+                    self._finish_stats(stats, cached)
+                return cached
+
         try:
             # Normalize text by replacing newlines with spaces
             text = text.replace("\n", " ")
 
-            # Create a configuration dictionary for DataCore
-            core_config = {
-                "windows_size": self.config["window_size"],
-                "n": self.config["n"],
-            }
-
             # Initialize the data core with the text
-            dc = DataCore(text=text, stopword_set=self.stopword_set, config=core_config)
-
-            # Build features for single terms and multi-word terms
-            dc.build_single_terms_features(features=self.config["features"])
-            dc.build_mult_terms_features(features=self.config["features"])
-
-            # Get valid candidates
-            candidates_sorted = sorted(
-                [cc for cc in dc.candidates.values() if cc.is_valid()],
-                key=lambda c: c.h
+            dc = DataCore(
+                text=text, stopword_set=self.stopword_set, config=self._core_config(stats)
             )
 
-            # No deduplication case
-            if self.config["dedup_lim"] >= 1.0:
-                return [(cand.unique_kw, cand.h) for cand in candidates_sorted][
-                    : self.config["top"]
-                ]
-
-            # ALGORITMO ORIGINAL (YAKE 1.0.0 / 0.6.0) - SEM OTIMIZAÇÕES
-            # Usar algoritmo clássico para garantir resultados idênticos às versões anteriores
-            result_set = []
-            for cand in candidates_sorted:
-                should_add = True
-                # Check if this candidate is too similar to any already selected
-                for h, cand_result in result_set:
-                    if (
-                        self.dedup_function(cand.unique_kw, cand_result.unique_kw)
-                        > self.config["dedup_lim"]
-                    ):
-                        should_add = False
-                        break
-
-                # Add candidate if it passes deduplication
-                if should_add:
-                    result_set.append((cand.h, cand))
-
-                # Stop once we have enough candidates
-                if len(result_set) == self.config["top"]:
-                    break
-
-            # Format results as (keyword, score) tuples - EXATAMENTE como YAKE 0.6.0
-            results = [(cand.kw, h) for (h, cand) in result_set]
-
-            # Apply lemmatization if enabled
-            if self.lemmatize:
-                logger.debug(
-                    "Applying lemmatization with aggregation method: %s", 
-                    self.lemma_aggregation
-                )
-                results = self._lemmatize_keywords(results)
-
-            # Intelligent cache management after extraction
-            self._manage_cache_lifecycle(text)
-
-            return results
+            keywords = self._select_keywords(dc, stats=stats)
+            if cache_key is not None:
+                self._result_cache.put(cache_key, keywords)
+                if stats is not None:
+                    stats.lap("result_cache")
+            if stats is not None:
+                self._finish_stats(stats, keywords)
+            return keywords
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             # Python 3.11+ enhanced error messages with exception notes
@@ -674,6 +949,308 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
 
             return []
 
+    def extract_keywords_stream(self, chunks: Iterable[str]) -> List[Tuple[str, float]]:
+        """
+        Extract keywords from a document that arrives in pieces.
+
+        The chunks are fed to an incremental DataCore as they are read, so the
+        whole document never needs to be held in memory; only its vocabulary,
+        candidates and co-occurrence counts are. The result is the same as
+        ``extract_keywords("".join(chunks))``.
+
+        Args:
+            chunks: Iterable of consecutive pieces of one document (for
+                example lines of a file or blocks read from a socket)
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+
+        Example:
+            >>> with open("book.txt", encoding="utf-8") as handle:
+            ...     keywords = extractor.extract_keywords_stream(handle)
+        """
+        stats = self._new_stats()
+        try:
+            dc = DataCore(
+                text=None, stopword_set=self.stopword_set, config=self._core_config(stats)
+            )
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                # Normalize text by replacing newlines with spaces
+                dc.feed(chunk.replace("\n", " "))
+            dc.finalize()
+
+            if not dc.number_of_sentences:
+                logger.debug("Empty text provided, returning empty result")
+                return []
+
+            keywords = self._select_keywords(dc, stats=stats)
+            if stats is not None:
+                self._finish_stats(stats, keywords)
+            return keywords
+
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Exception during streaming keyword extraction: %s", e)
+            return []
+
+    def extract_keywords_batch(
+        self,
+        texts: Iterable[Optional[str]],
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Extract keywords from many documents using a process pool.
+
+        Each worker process builds one extractor with this extractor's
+        configuration when it starts, so stopwords are loaded once per worker
+        and nothing but the documents and results crosses process boundaries.
+        Results are returned in input order.
+
+        Args:
+            texts: Iterable of documents
+            workers: Number of worker processes (default: None = one per CPU).
+                With 1 worker, documents are processed in the current process.
+            chunksize: Documents sent to a worker per task
+                (default: None = chosen from the input size)
+
+        Returns:
+            One list of (keyword, score) tuples per input document
+
+        Example:
+            >>> extractor = KeywordExtractor(lan="en", top=10)
+            >>> results = extractor.extract_keywords_batch(docs, workers=4)
+        """
+        return extract_batch(self, texts, workers=workers, chunksize=chunksize)
+
+    async def extract_keywords_async(
+        self,
+        text: Optional[str],
+        executor: Optional[Executor] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Extract keywords in an executor without blocking the event loop.
+
+        Args:
+            text: Input text to extract keywords from
+            executor: Thread or process pool to run in (default: None = the
+                loop's default executor). Process pools need no initializer;
+                each worker builds an extractor with this configuration.
+            timeout: Seconds to wait for the result (default: None = no limit)
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+
+        Raises:
+            asyncio.TimeoutError: If the result is not ready within ``timeout``.
+                Work that has already started is not interrupted and keeps
+                its thread or process pool worker busy until it finishes.
+
+        Note:
+            Thread executors (the default) run this extractor itself; create
+            it with ``thread_safe=True`` if documents may run concurrently.
+
+        Example:
+            >>> keywords = await extractor.extract_keywords_async(text, timeout=5)
+        """
+        return await extract_keywords_async(self, text, executor=executor, timeout=timeout)
+
+    def extract_keywords_batch_async(  # pylint: disable=too-many-arguments
+        self,
+        texts: Union[Iterable[Optional[str]], AsyncIterable[Optional[str]]],
+        executor: Union[Executor, str, None] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Extract keywords from many documents with ``async for``.
+
+        At most ``max_concurrency`` documents are pending at a time; the input
+        is only read further as results are consumed. Breaking out of the loop
+        or cancelling the consuming task cancels the documents that have not
+        started; running ones (like those past their timeout) finish in the
+        background. With a thread executor, documents run concurrently on
+        this extractor, which must then be created with ``thread_safe=True``.
+
+        Args:
+            texts: Iterable or async iterable of documents
+            executor: Thread or process pool, "process" or "thread" to create
+                one for this batch, or None for the loop's default executor
+            max_concurrency: Maximum pending documents
+                (default: None = twice the number of CPUs)
+            timeout: Seconds allowed per document (default: None = no limit)
+            ordered: Yield in input order (True) or as documents finish (False)
+            return_exceptions: Yield a failed document's exception (e.g.
+                asyncio.TimeoutError) instead of raising it
+
+        Returns:
+            Async iterator of (input index, keywords) tuples
+
+        Example:
+            >>> async for index, keywords in extractor.extract_keywords_batch_async(
+            ...         docs, executor=pool, timeout=10):
+            ...     store(index, keywords)
+        """
+        return iter_extract_async(
+            self,
+            texts,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            ordered=ordered,
+            return_exceptions=return_exceptions,
+        )
+
+    def _core_config(self, stats: Optional[ExtractionStats] = None) -> Dict[str, Any]:
+        """Build the DataCore configuration for this extractor."""
+        return {
+            "windows_size": self.config["window_size"],
+            "n": self.config["n"],
+            "vectorized": self.config["vectorized"],
+            "dedup_index": self.config["dedup_index"],
+            "lean": self.config["lean"],
+            "tokenizer": self.config["tokenizer"],
+            "stats": stats,
+        }
+
+    # pylint: disable-next=too-many-branches
+    def _select_keywords(
+        self, dc: DataCore, stats: Optional[ExtractionStats] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Score, rank and deduplicate the candidates of a built data core.
+
+        Args:
+            dc: Data core holding the terms and candidates of one document
+            stats: Recorder for stage timings and counts (default: None)
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+        """
+        if stats is not None:
+            # Candidates are materialized lazily; charge that to the build
+            stats.counts.update(
+                sentences=dc.number_of_sentences,
+                words=dc.number_of_words,
+                terms=len(dc.terms),
+                candidates=len(dc.candidates),
+            )
+            stats.lap("build")
+
+        # Build features for single terms and multi-word terms
+        dc.build_single_terms_features(features=self.config["features"])
+        if stats is not None:
+            stats.lap("term_features")
+        dc.build_mult_terms_features(features=self.config["features"])
+        if stats is not None:
+            stats.lap("candidate_features")
+
+        # Get valid candidates
+        candidates = [cc for cc in dc.candidates.values() if cc.is_valid()]
+        if stats is not None:
+            stats.counts["valid_candidates"] = len(candidates)
+
+        # No deduplication case: only the best `top` candidates are needed
+        if self.config["dedup_lim"] >= 1.0:
+            top = self.config["top"]
+            if top > 0:
+                best = heapq.nsmallest(top, candidates, key=lambda c: c.h)
+            else:
+                best = sorted(candidates, key=lambda c: c.h)[:top]
+            if stats is not None:
+                stats.lap("ranking")
+            return [(cand.unique_kw, cand.h) for cand in best]
+
+        # Candidates are drawn from a heap in score order as deduplication
+        # asks for them, so only the inspected ones are ever ordered
+        ranked_candidates = self._iter_by_score(candidates)
+
+        # ALGORITMO ORIGINAL (YAKE 1.0.0 / 0.6.0) - SEM OTIMIZAÇÕES
+        # Usar algoritmo clássico para garantir resultados idênticos às versões anteriores
+        result_set = []
+        dedup_index = self._new_dedup_index()
+        comparisons = 0
+        if stats is not None:
+            stats.lap("ranking")
+            counters = self._call_counters()
+            cache_hits = counters['hits']
+            cache_misses = counters['misses']
+        for cand in ranked_candidates:
+            should_add = True
+            # Keywords already selected that the candidate may duplicate
+            if dedup_index is None:
+                selected = (cand_result.unique_kw for _, cand_result in result_set)
+            else:
+                selected = dedup_index.candidates(cand.unique_kw)
+
+            # Check if this candidate is too similar to any already selected
+            for selected_kw in selected:
+                comparisons += 1
+                if self.is_similar(cand.unique_kw, selected_kw):
+                    should_add = False
+                    break
+
+            # Add candidate if it passes deduplication
+            if should_add:
+                result_set.append((cand.h, cand))
+                if dedup_index is not None:
+                    dedup_index.add(cand.unique_kw)
+
+            # Stop once we have enough candidates
+            if len(result_set) == self.config["top"]:
+                break
+
+        # Format results as (keyword, score) tuples - EXATAMENTE como YAKE 0.6.0
+        results = [(cand.kw, h) for (h, cand) in result_set]
+        if stats is not None:
+            stats.counts.update(
+                dedup_comparisons=comparisons,
+                similarity_cache_hits=counters['hits'] - cache_hits,
+                similarity_cache_misses=counters['misses'] - cache_misses,
+            )
+            stats.lap("dedup")
+
+        # Apply lemmatization if enabled
+        if self.lemmatize:
+            logger.debug(
+                "Applying lemmatization with aggregation method: %s", 
+                self.lemma_aggregation
+            )
+            results = self._lemmatize_keywords(results)
+            if stats is not None:
+                stats.lap("lemmatization")
+
+        # Caches evict their own least recently used entries; just count
+        self._doc_counters.local()['docs_processed'] += 1
+
+        return results
+
+    @staticmethod
+    def _iter_by_score(candidates: List[Any]) -> Iterator[Any]:
+        """
+        Iterate over candidates by increasing score without sorting them all.
+
+        Yields the same sequence as ``sorted(candidates, key=lambda c: c.h)``:
+        ties keep their original order because the heap entries carry the
+        candidate's position. Building the heap is linear and each candidate
+        drawn costs O(log k), so stopping after ``top`` results avoids most
+        of the work of a full sort.
+
+        Args:
+            candidates: ComposedWord candidates with their scores computed
+
+        Yields:
+            Candidates in order of increasing score (lower is better)
+        """
+        heap = [(cand.h, index, cand) for index, cand in enumerate(candidates)]
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap)[2]
+
     def _optimized_small_dedup(self, candidates_sorted):
         """Optimized deduplication for small datasets (<50 candidates)."""
         result_set = []
@@ -781,129 +1358,100 @@ class KeywordExtractor:  # pylint: disable=too-many-instance-attributes
             if len(result_set) == self.config["top"]:
                 break
 
-        # Clear cache periodically to avoid memory issues
-        if len(self._similarity_cache) > 50000:
-            self._similarity_cache.clear()
-
         return [(cand.kw, float(h)) for (h, cand) in result_set]
 
     def get_cache_stats(self):
-        """Return cache performance statistics."""
-        total = self._cache_stats['hits'] + self._cache_stats['misses']
-        hit_rate = self._cache_stats['hits'] / total * 100 if total > 0 else 0
-        return {
-            'hits': self._cache_stats['hits'],
-            'misses': self._cache_stats['misses'],
-            'hit_rate': hit_rate,
-            'docs_processed': self._cache_stats['docs_processed'],
-            'cache_size': self._get_cache_usage()
-        }
-
-    def _manage_cache_lifecycle(self, text):
         """
-        Intelligently manage cache lifecycle to prevent memory leaks.
-
-        This method implements smart cache clearing based on:
-        1. Text size (large documents)
-        2. Cache saturation (>80% full)
-        3. Document count (failsafe every 50 docs)
-
-        Args:
-            text: The text that was just processed
+        Return cache performance statistics.
+
+        ``hits``, ``misses`` and ``hit_rate`` describe the similarity cache.
+        ``caches`` holds the statistics of every in-memory cache (entries,
+        budget, hits, misses, hit rate and evictions; see
+        BoundedCache.stats): this extractor's "similarity" and "lemma"
+        caches, and the process-wide "tags", "levenshtein_ratio" and
+        "levenshtein_distance" caches. The
+        ``result_cache`` entry holds the persistent result cache's
+        statistics (see ResultCache.stats), or None when it is disabled.
         """
-        self._cache_stats['docs_processed'] += 1
-        text_size = len(text.split())
-        self._cache_stats['last_text_size'] = text_size
-
-        # Get current cache usage
-        cache_usage = self._get_cache_usage()
-
-        # HEURISTIC: Clear cache if any condition is met
-        should_clear = (
-            text_size > 2000 or                    # Large document (>2000 words)
-            cache_usage > 0.8 or                   # Cache >80% full
-            self._cache_stats['docs_processed'] % 50 == 0  # Failsafe: every 50 docs
-        )
+        # pylint: disable=import-outside-toplevel
+        from yake.data.utils import get_tag
 
-        if should_clear:
-            self.clear_caches()
+        similarity = self._similarity_cache.stats()
+        return {
+            'hits': similarity['hits'],
+            'misses': similarity['misses'],
+            'hit_rate': similarity['hit_rate'],
+            'docs_processed': self._doc_counters.totals()['docs_processed'],
+            'cache_size': self._get_cache_usage(),
+            'caches': {
+                'similarity': similarity,
+                'lemma': self._lemma_cache.stats(),
+                'tags': lru_cache_stats(get_tag),
+                'levenshtein_ratio': lru_cache_stats(Levenshtein.ratio),
+                'levenshtein_distance': lru_cache_stats(Levenshtein.distance),
+            },
+            'result_cache': (
+                self._result_cache.stats() if self._result_cache is not None else None
+            ),
+        }
 
     def _get_cache_usage(self):
         """
-        Calculate current cache usage as a ratio (0.0 to 1.0).
+        Calculate the similarity cache usage as a ratio (0.0 to 1.0).
 
         Returns:
-            float: Cache usage ratio where 1.0 means completely full
+            float: Share of the entry budget in use (of the byte budget
+            without an entry budget), where 1.0 means completely full
         """
-        try:
-            # pylint: disable=no-value-for-parameter
-            info = KeywordExtractor._ultra_fast_similarity.cache_info()
-            return info.currsize / info.maxsize if info.maxsize > 0 else 0.0
-        except AttributeError:
-            # Fallback if cache_info not available
-            return 0.0
+        stats = self._similarity_cache.stats()
+        if stats["max_entries"] is not None:
+            return stats["entries"] / stats["max_entries"] if stats["max_entries"] > 0 else 0.0
+        return stats["bytes"] / stats["max_bytes"] if stats["max_bytes"] > 0 else 0.0
 
     def clear_caches(self):
         """
-        Clear all internal caches to free memory.
+        Clear the caches of this extractor to free memory.
+
+        This method clears the extractor's similarity and lemma caches and
+        resets its statistics. Other extractors, in this thread or others,
+        are not affected; the process-wide caches are cleared by
+        clear_shared_caches().
+
+        The persistent result cache is left untouched; use
+        ``result_cache.clear()`` to empty it.
+
+        Every cache is bounded and evicts its least recently used entries
+        as it fills, so memory stays bounded without calling this method.
+        It is only useful to release that memory, for example before an
+        idle period in a memory-constrained environment.
 
-        This method clears:
-        - LRU cache for similarity calculations (50,000 entries max)
-        - LRU cache for text tagging (10,000 entries max)
-        - LRU cache for Levenshtein distance (40,000 entries max)
-        - Instance-level similarity cache
-        
-        When to call manually:
-        - Processing batches of documents in a loop
-        - Running in memory-constrained environments (e.g., AWS Lambda)
-        - After processing large documents (>5000 words)
-        - Before critical operations that need maximum available memory
-        
-        Performance impact:
-        - Next 5-10 extractions will be ~10-20% slower while caches warm up
-        - After warm-up, performance returns to optimized levels
-        - Trade-off is worthwhile for preventing memory leaks in production
-        
         Example usage:
             >>> extractor = KeywordExtractor(lan="en")
-            >>> for doc in large_document_batch:
-            ...     keywords = extractor.extract_keywords(doc)
-            ...     process_keywords(keywords)
-            ...     if doc.size > 10000:  # Manual clear for huge docs
-            ...         extractor.clear_caches()
-        
-        Note:
-            This is called automatically by the intelligent cache manager
-            based on heuristics (text size, cache saturation, document count).
-            Manual calls are only needed for special cases.
+            >>> keywords = [extractor.extract_keywords(doc) for doc in batch]
+            >>> extractor.clear_caches()  # Release memory until the next batch
         """
-        # Clear static method cache (shared across all instances)
-        try:
-            self._ultra_fast_similarity.cache_clear()
-        except AttributeError:
-            pass
+        # Clear instance caches (statistics included)
+        self._similarity_cache.clear()
+        self._lemma_cache.clear()
 
-        # Clear module-level caches
-        try:
-            # pylint: disable=import-outside-toplevel
-            from yake.data.utils import get_tag
-            get_tag.cache_clear()
-        except (ImportError, AttributeError):
-            pass
+        # Reset tracking
+        self._doc_counters.reset()
 
-        try:
-            # pylint: disable=import-outside-toplevel
-            from yake.core.Levenshtein import Levenshtein as LevenshteinModule
-            LevenshteinModule.ratio.cache_clear()
-            LevenshteinModule.distance.cache_clear()
-        except (ImportError, AttributeError):
-            pass
+    @staticmethod
+    def clear_shared_caches():
+        """
+        Clear the caches shared by every extractor of the process.
 
-        # Clear instance cache
-        if hasattr(self, '_similarity_cache'):
-            self._similarity_cache.clear()
+        This method clears:
+        - LRU cache for text tagging (10,000 entries max)
+        - LRU caches for Levenshtein ratio and distance (20,000 entries max)
 
-        # Reset tracking
-        self._cache_stats['docs_processed'] = 0
-        self._cache_stats['hits'] = 0
-        self._cache_stats['misses'] = 0
+        These caches hold pure function results, so clearing them while
+        other threads extract is safe but leaves them cold.
+        """
+        # pylint: disable=import-outside-toplevel
+        from yake.data.utils import get_tag
+
+        get_tag.cache_clear()
+        Levenshtein.ratio.cache_clear()
+        Levenshtein.distance.cache_clear()
@@ -2,6 +2,21 @@
 
 from .core import DataCore
 from .single_word import SingleWord
+from .term_table import TermTable
 from .composed_word import ComposedWord
+from .cooccurrence import CooccurrenceGraph
+from .instrumentation import ExtractionStats
+from .tokenizers import Tokenizer, SegtokTokenizer, RegexTokenizer, get_tokenizer
 
-__all__ = ["DataCore", "SingleWord", "ComposedWord"]
+__all__ = [
+    "DataCore",
+    "SingleWord",
+    "TermTable",
+    "ComposedWord",
+    "CooccurrenceGraph",
+    "ExtractionStats",
+    "Tokenizer",
+    "SegtokTokenizer",
+    "RegexTokenizer",
+    "get_tokenizer",
+]
@@ -8,6 +8,7 @@ which phrases make good keyword candidates.
 """
 
 import logging
+from functools import lru_cache
 from typing import List, Tuple, Optional, Any
 import numpy as np  # pylint: disable=import-error
 import jellyfish  # pylint: disable=import-error
@@ -16,9 +17,33 @@ from .utils import STOPWORD_WEIGHT
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Bits of ComposedWord.tag_flags, accumulated over all tag sequences of a candidate
+TAG_UNUSUAL = 1  # Some sequence has an unusual ("u") word
+TAG_DIGIT = 2  # Some sequence has a digit ("d") word
+TAG_CLEAN = 4  # Some sequence has neither
+
 # pylint: disable=too-many-instance-attributes
 
 
+@lru_cache(maxsize=4096)
+def tag_flags(tags: str) -> int:
+    """
+    Get the flags of one tag sequence.
+
+    Args:
+        tags: Tag sequence of a candidate occurrence (e.g. "pnp")
+
+    Returns:
+        TAG_UNUSUAL and/or TAG_DIGIT, or TAG_CLEAN if the sequence has neither
+    """
+    flags = 0
+    if "u" in tags:
+        flags |= TAG_UNUSUAL
+    if "d" in tags:
+        flags |= TAG_DIGIT
+    return flags or TAG_CLEAN
+
+
 class ComposedWord:
     """
     Representation of a multi-word term in the document.
@@ -34,8 +59,8 @@ class ComposedWord:
 
     # Use __slots__ to reduce memory overhead per instance
     # (optimized to use direct attributes)
-    __slots__ = ('_tags', '_kw', '_unique_kw', '_size', '_terms', '_tf',
-                 '_integrity', '_h', '_start_or_end_stopwords')
+    __slots__ = ('_tags', '_tag_flags', '_valid', '_kw', '_unique_kw', '_size', '_terms',
+                 '_tf', '_integrity', '_h', '_start_or_end_stopwords')
 
     def __init__(self, terms: Optional[List[Tuple[str, str, Any]]]):
         """
@@ -50,6 +75,8 @@ class ComposedWord:
         if terms is None:
             self._start_or_end_stopwords = True
             self._tags = set()
+            self._tag_flags = 0
+            self._valid = False
             self._h = 0.0
             self._tf = 0.0
             self._kw = ""
@@ -60,7 +87,10 @@ class ComposedWord:
             return
 
         # Calculate derived properties
-        self._tags = set(["".join([w[0] for w in terms])])
+        tags = "".join([w[0] for w in terms])
+        self._tags = {tags}
+        self._tag_flags = tag_flags(tags)
+        self._valid = None  # Computed by is_valid() on first use
         self._kw = " ".join([w[1] for w in terms])
         self._unique_kw = self._kw.lower()
         self._size = len(terms)
@@ -80,9 +110,19 @@ class ComposedWord:
     # Property accessors for backward compatibility
     @property
     def tags(self):
-        """Get the set of part-of-speech tag sequences for this phrase."""
+        """
+        Get the set of part-of-speech tag sequences for this phrase.
+
+        Use add_tags() or update_cand() to add sequences, so that the tag
+        flags stay in sync.
+        """
         return self._tags
 
+    @property
+    def tag_flags(self):
+        """Get the TAG_UNUSUAL, TAG_DIGIT and TAG_CLEAN bits of all tag sequences."""
+        return self._tag_flags
+
     @property
     def kw(self):
         """Get the original form of the keyword phrase."""
@@ -143,6 +183,21 @@ class ComposedWord:
         """Get whether this phrase starts or ends with stopwords."""
         return self._start_or_end_stopwords
 
+    def add_tags(self, tags, flags=None):
+        """
+        Record another tag sequence of this phrase.
+
+        Args:
+            tags (str): Tag sequence of an occurrence (e.g. "pnp")
+            flags (int): The tag_flags() of ``tags``, if already known
+        """
+        self._tags.add(tags)
+        if flags is None:
+            flags = tag_flags(tags)
+        if flags & ~self._tag_flags:
+            self._tag_flags |= flags
+            self._valid = None
+
     def update_cand(self, cand):
         """
         Update candidate with new tags.
@@ -151,26 +206,27 @@ class ComposedWord:
             cand: Another instance of the same keyword to merge with
         """
         # Add all tags from the other candidate to this one's tags
-        for tag in cand.tags:
-            self.tags.add(tag)
+        self._tags |= cand.tags
+        if cand.tag_flags & ~self._tag_flags:
+            self._tag_flags |= cand.tag_flags
+            self._valid = None
 
     def is_valid(self):
         """
         Check if candidate is valid.
 
         A valid keyword phrase doesn't contain unusual characters or digits,
-        and doesn't start or end with stopwords.
+        and doesn't start or end with stopwords. The answer is kept until
+        new tag sequences are added.
 
         Returns:
             bool: True if this is a valid keyword candidate, False otherwise
         """
-        is_valid = False
-        # Check that at least one tag sequence has no unusual characters or digits
-        for tag in self.tags:
-            is_valid = is_valid or ("u" not in tag and "d" not in tag)
-
-        # A valid keyword cannot start or end with a stopword
-        return is_valid and not self.start_or_end_stopwords
+        if self._valid is None:
+            # At least one tag sequence must have no unusual characters or
+            # digits, and a valid keyword cannot start or end with a stopword
+            self._valid = bool(self._tag_flags & TAG_CLEAN) and not self._start_or_end_stopwords
+        return self._valid
 
     def get_composed_feature(self, feature_name, discart_stopword=True):
         """
@@ -0,0 +1,254 @@
+"""
+Term co-occurrence store for YAKE keyword extraction.
+
+This module contains the CooccurrenceGraph class, a compact directed graph
+specialised for the co-occurrence counts collected by DataCore. Nodes are the
+integer term ids assigned by DataCore, edges carry a single ``tf`` weight, and
+per-node degree and weight totals are accumulated as edges are added so that
+graph metrics can be read in constant time.
+
+The class implements the small subset of the networkx DiGraph interface used by
+the scoring code (``has_edge``, ``g[u][v]["tf"]``, ``add_node``, ``add_edge``,
+``out_edges``), so existing code that reads the graph keeps working.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+import numpy as np  # pylint: disable=import-error
+
+
+class _AdjacencyView:
+    """
+    Read-only view over the successors of one node.
+
+    Supports ``v in g[u]``, ``g[u][v]["tf"]``, ``len(g[u])`` and iteration
+    over successor ids, mirroring networkx adjacency views.
+    """
+
+    __slots__ = ("_succ",)
+
+    def __init__(self, succ: Dict[int, float]):
+        self._succ = succ
+
+    def __contains__(self, node: int) -> bool:
+        return node in self._succ
+
+    def __getitem__(self, node: int) -> Dict[str, float]:
+        return {"tf": self._succ[node]}
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._succ)
+
+    def __len__(self) -> int:
+        return len(self._succ)
+
+
+class CooccurrenceGraph:
+    """
+    Compact directed co-occurrence graph indexed by integer term ids.
+
+    Each node keeps a dictionary of successor weights plus running totals of
+    its in-degree and in/out weights. Out-degree is the size of the successor
+    dictionary. Node ids are expected to be small consecutive integers, as
+    assigned by DataCore.
+
+    Attributes:
+        See method accessors below for available information.
+    """
+
+    __slots__ = ("_succ", "_in_degree", "_in_weight", "_out_weight", "_edge_index")
+
+    def __init__(self):
+        """Initialize an empty co-occurrence graph."""
+        self._succ: List[Dict[int, float]] = []  # Successor weights per node
+        self._in_degree: List[int] = []  # Number of distinct predecessors
+        self._in_weight: List[float] = []  # Sum of incoming edge weights
+        self._out_weight: List[float] = []  # Sum of outgoing edge weights
+        self._edge_index = None  # Sorted (keys, weights) arrays for edge_weights
+
+    def _ensure_node(self, node: int) -> None:
+        """Grow the per-node arrays so that ``node`` is a valid index."""
+        missing = node + 1 - len(self._succ)
+        if missing > 0:
+            self._succ.extend({} for _ in range(missing))
+            self._in_degree.extend([0] * missing)
+            self._in_weight.extend([0.0] * missing)
+            self._out_weight.extend([0.0] * missing)
+
+    # --- Mutation ---
+
+    def add_node(self, node: int) -> None:
+        """
+        Add a node to the graph.
+
+        Args:
+            node: Integer term id
+        """
+        self._ensure_node(node)
+
+    def add_cooccurrence(self, left: int, right: int, weight: float = 1.0) -> None:
+        """
+        Increment the co-occurrence weight of the edge ``left -> right``.
+
+        Creates the edge (and nodes) if needed and updates the degree and
+        weight totals of both endpoints.
+
+        Args:
+            left: Id of the term appearing first
+            right: Id of the term appearing second
+            weight: Amount to add to the edge weight
+        """
+        self._ensure_node(max(left, right))
+        self._edge_index = None
+        succ = self._succ[left]
+        if right in succ:
+            succ[right] += weight
+        else:
+            succ[right] = weight
+            self._in_degree[right] += 1
+        self._out_weight[left] += weight
+        self._in_weight[right] += weight
+
+    def add_edge(self, left: int, right: int, tf: float = 0.0) -> None:
+        """
+        Add an edge with an initial weight (networkx-compatible).
+
+        If the edge already exists its weight is replaced by ``tf``.
+
+        Args:
+            left: Source node id
+            right: Target node id
+            tf: Edge weight
+        """
+        current = self.edge_weight(left, right)
+        self.add_cooccurrence(left, right, tf - current)
+
+    # --- Queries ---
+
+    def has_edge(self, left: int, right: int) -> bool:
+        """Check whether the edge ``left -> right`` exists."""
+        return 0 <= left < len(self._succ) and right in self._succ[left]
+
+    def edge_weight(self, left: int, right: int) -> float:
+        """Get the weight of ``left -> right``, or 0.0 if the edge is absent."""
+        if 0 <= left < len(self._succ):
+            return self._succ[left].get(right, 0.0)
+        return 0.0
+
+    def node_metrics(self, node: int) -> Tuple[int, float, int, float]:
+        """
+        Get the degree and weight totals of a node.
+
+        Args:
+            node: Integer term id
+
+        Returns:
+            Tuple of (out_degree, out_weight, in_degree, in_weight); all zero
+            for nodes that are not in the graph
+        """
+        if not 0 <= node < len(self._succ):
+            return 0, 0.0, 0, 0.0
+        return (
+            len(self._succ[node]),
+            self._out_weight[node],
+            self._in_degree[node],
+            self._in_weight[node],
+        )
+
+    def metric_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the degree and weight totals of every node as arrays.
+
+        Returns:
+            Tuple of (out_degree, out_weight, in_degree, in_weight) arrays
+            indexed by node id
+        """
+        return (
+            np.fromiter((len(succ) for succ in self._succ), dtype=np.float64,
+                        count=len(self._succ)),
+            np.array(self._out_weight, dtype=np.float64),
+            np.array(self._in_degree, dtype=np.float64),
+            np.array(self._in_weight, dtype=np.float64),
+        )
+
+    def edge_weights(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """
+        Look up the weights of many edges at once.
+
+        Edges are encoded as ``left * number_of_nodes + right`` keys, sorted
+        once (until the graph changes) and queried with a binary search.
+
+        Args:
+            left: Array of source node ids
+            right: Array of target node ids (same shape as ``left``)
+
+        Returns:
+            Array of edge weights, 0.0 where the edge does not exist
+        """
+        left = np.asarray(left, dtype=np.int64)
+        right = np.asarray(right, dtype=np.int64)
+        size = len(self._succ)
+        if self._edge_index is None:
+            keys, weights = [], []
+            for source, succ in enumerate(self._succ):
+                base = source * size
+                keys.extend([base + target for target in succ])
+                weights.extend(succ.values())
+            keys = np.array(keys, dtype=np.int64)
+            weights = np.array(weights, dtype=np.float64)
+            order = np.argsort(keys, kind="stable")
+            self._edge_index = (keys[order], weights[order])
+        keys, weights = self._edge_index
+        count = len(keys)
+        if not count or not left.size:
+            return np.zeros(left.shape, dtype=np.float64)
+
+        in_range = (left >= 0) & (left < size) & (right >= 0) & (right < size)
+        query = np.where(in_range, left * size + right, -1)
+        position = np.minimum(np.searchsorted(keys, query), count - 1)
+        found = in_range & (keys[position] == query)
+        return np.where(found, weights[position], 0.0)
+
+    def out_edges(self, node: int, data: bool = False) -> List[tuple]:
+        """
+        List the outgoing edges of a node (networkx-compatible).
+
+        Args:
+            node: Integer term id
+            data: Whether to include the edge data dictionary
+
+        Returns:
+            List of (node, target) or (node, target, {"tf": weight}) tuples
+        """
+        if not 0 <= node < len(self._succ):
+            return []
+        if data:
+            return [(node, v, {"tf": w}) for v, w in self._succ[node].items()]
+        return [(node, v) for v in self._succ[node]]
+
+    def edges(self) -> Iterator[Tuple[int, int, float]]:
+        """Iterate over all edges as (source, target, weight) tuples."""
+        for left, succ in enumerate(self._succ):
+            for right, weight in succ.items():
+                yield left, right, weight
+
+    def number_of_nodes(self) -> int:
+        """Get the number of nodes in the graph."""
+        return len(self._succ)
+
+    def number_of_edges(self) -> int:
+        """Get the number of distinct edges in the graph."""
+        return sum(len(succ) for succ in self._succ)
+
+    def __getitem__(self, node: int) -> _AdjacencyView:
+        """Access the successors of ``node`` as ``g[node]``."""
+        if not 0 <= node < len(self._succ):
+            raise KeyError(node)
+        return _AdjacencyView(self._succ[node])
+
+    def __contains__(self, node: int) -> bool:
+        """Check whether ``node`` is in the graph."""
+        return 0 <= node < len(self._succ)
+
+    def __len__(self) -> int:
+        """Get the number of nodes in the graph."""
+        return len(self._succ)
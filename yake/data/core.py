@@ -9,18 +9,87 @@ keyword generation.
 
 import logging
 import string
+import sys
+from functools import lru_cache
 from typing import Dict, List, Set, Optional, Any
-import networkx as nx  # pylint: disable=import-error
 import numpy as np  # pylint: disable=import-error
 
-from segtok.tokenizer import web_tokenizer, split_contractions  # pylint: disable=import-error
-from .utils import pre_filter, tokenize_sentences, get_tag
+from .utils import (
+    pre_filter,
+    PreFilterStream,
+    get_tag,
+    STOPWORD_WEIGHT,
+)
+from .tokenizers import get_tokenizer
+from .features import calculate_term_features_batch, calculate_composed_features_batch
+from .cooccurrence import CooccurrenceGraph
 from .single_word import SingleWord
-from .composed_word import ComposedWord
+from .term_table import TermTable
+from .composed_word import ComposedWord, TAG_CLEAN, tag_flags
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Integer codes of the word tags returned by get_tag(). A candidate's tag
+# sequence is packed into one integer, _TAG_BITS bits per word with the last
+# word in the lowest bits; codes are non-zero so the packing is unambiguous.
+_TAG_CODES = {"d": 1, "u": 2, "a": 3, "n": 4, "p": 5}
+_TAG_NAMES = {code: tag for tag, code in _TAG_CODES.items()}
+_TAG_BITS = 3
+_TAG_MASK = (1 << _TAG_BITS) - 1
+
+
+def _deep_sizeof(root: Any, seen: Set[int]) -> int:
+    """
+    Measure the memory held by an object graph.
+
+    Containers, NumPy arrays and objects of yake classes are followed; other
+    objects count for their own size only. Objects whose id is in ``seen``
+    are skipped and every object visited is added to it, so that memory
+    shared between structures is counted once.
+    """
+    total = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, np.ndarray):
+            if obj.base is None:
+                total += obj.nbytes
+        elif type(obj).__module__.startswith("yake."):
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            for cls in type(obj).__mro__:
+                for name in getattr(cls, "__slots__", ()):
+                    if hasattr(obj, name):
+                        stack.append(getattr(obj, name))
+    return total
+
+
+@lru_cache(maxsize=4096)
+def _decode_tags(code: int) -> str:
+    """Unpack a tag sequence code into its string form (e.g. "pnp")."""
+    tags = []
+    while code:
+        tags.append(_TAG_NAMES[code & _TAG_MASK])
+        code >>= _TAG_BITS
+    return "".join(reversed(tags))
+
+
+@lru_cache(maxsize=4096)
+def _tag_code_flags(code: int) -> int:
+    """Get the ComposedWord tag flags (TAG_CLEAN, ...) of a tag sequence code."""
+    return tag_flags(_decode_tags(code))
+
+
 class DataCore:
     """
     Core data representation for document analysis and keyword extraction.
@@ -36,7 +105,7 @@ class DataCore:
 
     def __init__(
         self,
-        text: str,
+        text: Optional[str],
         stopword_set: Set[str],
         config: Optional[Dict[str, Any]] = None
     ):
@@ -44,13 +113,24 @@ class DataCore:
         Initialize the data core for keyword extraction.
 
         Args:
-            text: Input text to process
+            text: Input text to process, or None to build the data core
+                incrementally with feed() and finalize()
             stopword_set: Set of stopwords to ignore
             config: Configuration options including:
                 - windows_size (int): Size of window for co-occurrence matrix (default: 2)
                 - n (int): Maximum n-gram size (default: 3)
                 - tags_to_discard (set): Tags to discard during processing (default: {"u", "d"})
                 - exclude (set): Set of characters to exclude (default: string.punctuation)
+                - vectorized (bool): Compute features with NumPy arrays instead
+                  of per-object Python code (default: False)
+                - stats (ExtractionStats): Record the time of the pre-filter,
+                  segmentation and build stages (default: None)
+                - lean (bool): Keep memory low: sentences are tokenized one at
+                  a time and neither sentences_str nor sentences_obj is kept,
+                  and candidates that can never be valid are not built
+                  (default: False)
+                - tokenizer (str or Tokenizer): Sentence splitter and word
+                  tokenizer backend, "segtok" or "regex" (default: "segtok")
         """
         # Initialize default configuration if none provided
         if config is None:
@@ -61,6 +141,7 @@ class DataCore:
         n = config.get("n", 3)
         tags_to_discard = config.get("tags_to_discard", set(["u", "d"]))
         exclude = config.get("exclude", set(string.punctuation))
+        vectorized = config.get("vectorized", False)
 
         # Convert exclude to frozenset once for efficient caching in get_tag()
         exclude = frozenset(exclude)
@@ -72,6 +153,10 @@ class DataCore:
                 "exclude": exclude,  # Punctuation and other characters to exclude (as frozenset)
                 "tags_to_discard": tags_to_discard,  # POS tags to ignore during analysis
                 "stopword_set": stopword_set,  # Set of stopwords for filtering
+                "vectorized": vectorized,  # Use the NumPy feature engine
+                "stats": config.get("stats"),  # Stage timing recorder, if any
+                "lean": config.get("lean", False),  # Drop structures once used
+                "tokenizer": get_tokenizer(config.get("tokenizer")),  # Tokenizer backend
             },
             # Text corpus statistics
             "text_stats": {
@@ -81,15 +166,24 @@ class DataCore:
             # Core data collections for analysis
             "collections": {
                 "terms": {},  # Dictionary mapping terms to SingleWord objects
+                "term_table": TermTable(),  # Term statistics in columns, by term id
                 "candidates": {},  # Dictionary mapping unique keywords to ComposedWord objects
+                # Candidate occurrences not yet turned into ComposedWord objects,
+                # keyed by the tuple of word ids; values are
+                # [tf, first tag code, block of words, start in block]
+                "candidate_table": {},
+                "candidate_tags": {},  # Further tag codes of candidates in the table
+                "word_ids": {},  # Dictionary mapping lowercased words to integer ids
                 "sentences_obj": [],  # Nested list of processed sentence objects
                 "sentences_str": [],  # List of raw sentence strings
                 "freq_ns": {},  # Frequency distribution of n-grams by length
             },
             # Graph for term co-occurrence analysis
-            # Directed graph where nodes are terms and edges represent
+            # Directed graph where nodes are term ids and edges represent
             # co-occurrences
-            "g": nx.DiGraph(),
+            "g": CooccurrenceGraph(),
+            # Incremental processing state (None once the text is complete)
+            "stream": None,
         }
 
         # Initialize n-gram frequencies with zero counts for each length 1 to n
@@ -97,7 +191,10 @@ class DataCore:
             self._state["collections"]["freq_ns"][i + 1] = 0.0
 
         # Process the text and build all data structures
-        self._build(text, windows_size, n)
+        if text is None:
+            self._start_stream(windows_size, n)
+        else:
+            self._build(text, windows_size, n)
 
     # --- Property accessors for backward compatibility ---
 
@@ -117,6 +214,21 @@ class DataCore:
         """Get the set of stopwords used for filtering."""
         return self._state["config"]["stopword_set"]
 
+    @property
+    def vectorized(self):
+        """Get whether features are computed with the NumPy feature engine."""
+        return self._state["config"]["vectorized"]
+
+    @property
+    def lean(self):
+        """Get whether sentence structures and invalid candidates are dropped."""
+        return self._state["config"]["lean"]
+
+    @property
+    def tokenizer(self):
+        """Get the backend that splits sentences and tokenizes words."""
+        return self._state["config"]["tokenizer"]
+
     @property
     def g(self):
         """Get the directed graph representing term co-occurrences."""
@@ -149,9 +261,16 @@ class DataCore:
         """Get the dictionary of SingleWord objects representing individual terms."""
         return self._state["collections"]["terms"]
 
+    @property
+    def term_table(self):
+        """Get the TermTable holding the statistics of the terms, by term id."""
+        return self._state["collections"]["term_table"]
+
     @property
     def candidates(self):
         """Get the dictionary of ComposedWord objects representing keyword candidates."""
+        if self._state["collections"]["candidate_table"]:
+            self._materialize_candidates()
         return self._state["collections"]["candidates"]
 
     @property
@@ -192,18 +311,40 @@ class DataCore:
             windows_size: Size of window for co-occurrence matrix calculation
             n: Maximum n-gram size to consider for candidate keyphrases
         """
+        stats = self._state["config"]["stats"]
+
         # Pre-process text for normalization
         text = pre_filter(text)
-
-        # Split text into sentences and tokenize
-        self.sentences_str = tokenize_sentences(text)
-        self.number_of_sentences = len(self.sentences_str)
+        if stats is not None:
+            stats.lap("pre_filter")
 
         # Initialize position counter for global word positions
         pos_text = 0
 
         # Create a processing context dictionary to pass fewer arguments
         context = {"windows_size": windows_size, "n": n}
+        tokenizer = self.tokenizer
+
+        if self.lean:
+            # Tokenize and process one sentence at a time, keeping none of them
+            sentence_id = 0
+            for sentence in tokenizer.split_sentences(text):
+                if sentence.strip():
+                    pos_text = self._process_sentence(
+                        tokenizer.tokenize(sentence), sentence_id, pos_text, context
+                    )
+                    sentence_id += 1
+            self.number_of_sentences = sentence_id
+            self.number_of_words = pos_text
+            if stats is not None:
+                stats.lap("build")
+            return
+
+        # Split text into sentences and tokenize
+        self.sentences_str = tokenizer.tokenize_sentences(text)
+        self.number_of_sentences = len(self.sentences_str)
+        if stats is not None:
+            stats.lap("segmentation")
 
         # Process each sentence individually
         for sentence_id, sentence in enumerate(self.sentences_str):
@@ -211,6 +352,95 @@ class DataCore:
 
         # Store the total number of processed words
         self.number_of_words = pos_text
+        if stats is not None:
+            stats.lap("build")
+
+    def _start_stream(self, windows_size: int, n: int) -> None:
+        """
+        Prepare the data core to receive text incrementally.
+
+        Args:
+            windows_size: Size of window for co-occurrence matrix calculation
+            n: Maximum n-gram size to consider for candidate keyphrases
+        """
+        self._state["stream"] = {
+            "context": {"windows_size": windows_size, "n": n},
+            "pre_filter": PreFilterStream(),  # Incremental text normalization
+            "pending": "",  # Pre-filtered text whose sentences are not final yet
+            "sentence_id": 0,  # Id of the next sentence to process
+            "pos_text": 0,  # Global position of the next word
+        }
+
+    def _process_stream_sentences(self, sentences: List[str]) -> None:
+        """
+        Tokenize and process sentences completed during incremental building.
+
+        Args:
+            sentences: Sentence strings in document order
+        """
+        stream = self._state["stream"]
+        tokenize = self.tokenizer.tokenize
+        for sentence in sentences:
+            if not sentence.strip():
+                continue
+            stream["pos_text"] = self._process_sentence(
+                tokenize(sentence),
+                stream["sentence_id"],
+                stream["pos_text"],
+                stream["context"],
+            )
+            stream["sentence_id"] += 1
+
+        self.number_of_sentences = stream["sentence_id"]
+        self.number_of_words = stream["pos_text"]
+
+    def feed(self, chunk: str) -> None:
+        """
+        Add the next piece of text to a data core built incrementally.
+
+        Only sentences that later text cannot change are processed; the last
+        few sentences are kept as raw text until more text arrives or
+        finalize() is called. Memory use therefore depends on the vocabulary
+        and candidate set rather than on the length of the text: sentence
+        strings and sentence objects are not retained in this mode.
+
+        Args:
+            chunk: Next piece of the document (may split words or sentences)
+
+        Raises:
+            RuntimeError: If the data core was not created with ``text=None``
+                or finalize() has already been called
+        """
+        stream = self._state["stream"]
+        if stream is None:
+            raise RuntimeError("DataCore is not accepting text; create it with text=None")
+        if not chunk:
+            return
+
+        text = stream["pending"] + stream["pre_filter"].feed(chunk)
+        sentences, offset = self.tokenizer.split_complete_sentences(text)
+        stream["pending"] = text[offset:]
+        self._process_stream_sentences(sentences)
+
+    def finalize(self) -> None:
+        """
+        Process the remaining text of a data core built incrementally.
+
+        After this call the data core holds the same terms, candidates,
+        co-occurrences and counts as one built from the whole text at once,
+        and no more text can be fed.
+
+        Raises:
+            RuntimeError: If the data core is not being built incrementally
+        """
+        stream = self._state["stream"]
+        if stream is None:
+            raise RuntimeError("DataCore is not accepting text; create it with text=None")
+
+        text = stream["pending"] + stream["pre_filter"].flush()
+        stream["pending"] = ""
+        self._process_stream_sentences(list(self.tokenizer.split_sentences(text)))
+        self._state["stream"] = None
 
     def _process_sentence(
         self,
@@ -239,6 +469,7 @@ class DataCore:
         block_of_word_obj = (
             []
         )  # Current block of continuous words (separated by punctuation)
+        block_of_word_keys = []  # (word id, tag code) of each word in the block
 
         # Extend the context with sentence information for word processing
         processing_context = context.copy()
@@ -252,11 +483,13 @@ class DataCore:
                 if block_of_word_obj:
                     sentence_obj_aux.append(block_of_word_obj)
                     block_of_word_obj = []
+                    block_of_word_keys = []
             else:
                 # Process meaningful words
                 word_context = {
                     "pos_sent": pos_sent,  # Position within the sentence
                     "block_of_word_obj": block_of_word_obj,  # Current word block
+                    "block_of_word_keys": block_of_word_keys,  # Candidate keys of the block
                 }
                 # Process this word and update position counter
                 pos_text = self._process_word(
@@ -267,8 +500,9 @@ class DataCore:
         if block_of_word_obj:
             sentence_obj_aux.append(block_of_word_obj)
 
-        # Add processed sentence to collection if not empty
-        if sentence_obj_aux:
+        # Add processed sentence to collection if not empty (sentences are
+        # not retained when the data core is built incrementally or is lean)
+        if sentence_obj_aux and self._state["stream"] is None and not self.lean:
             self.sentences_obj.append(sentence_obj_aux)
 
         return pos_text
@@ -313,10 +547,16 @@ class DataCore:
             self._update_cooccurrence(block_of_word_obj, term_obj, windows_size)
 
         # Generate keyword candidates involving this term
-        self._generate_candidates((tag, word), term_obj, block_of_word_obj, n)
+        word_ids = self._state["collections"]["word_ids"]
+        word_key = (word_ids.setdefault(word.lower(), len(word_ids)), _TAG_CODES[tag])
+        block_of_word_keys = word_context["block_of_word_keys"]
+        self._generate_candidates(
+            (tag, word, term_obj), word_key, block_of_word_obj, block_of_word_keys, n
+        )
 
         # Add this word to the current block
         block_of_word_obj.append((tag, word, term_obj))
+        block_of_word_keys.append(word_key)
 
         return pos_text
 
@@ -343,46 +583,149 @@ class DataCore:
                 # Add co-occurrence edge from previous term to current term
                 self.add_cooccur(block_of_word_obj[w][2], term_obj)
 
-    def _generate_candidates(self, term, term_obj, block_of_word_obj, n):
+    def _generate_candidates(self, term, word_key, block_of_word_obj, block_of_word_keys, n):
         """
         Generate keyword candidates from terms.
 
-        Creates single-term candidates and multi-term candidates up to length n,
-        combining the current term with previous terms.
+        Counts the single-term candidate and the multi-term candidates up to
+        length n that end with the current term. Occurrences are recorded in
+        the candidate table under the tuple of their word ids, together with
+        the code of their tag sequence; ComposedWord objects are only built
+        once per distinct candidate, when the candidates are first read.
 
         Args:
-            term (tuple): Current term as (tag, word) tuple
-            term_obj (SingleWord): Term object for the current word
+            term (tuple): Current term as (tag, word, term_obj) tuple
+            word_key (tuple): Current term as (word id, tag code) tuple
             block_of_word_obj (list): Current block of words
+            block_of_word_keys (list): (word id, tag code) of each word in the block
             n (int): Maximum candidate length to generate
         """
-        # Create single-term candidate
-        candidate = [term + (term_obj,)]
-        cand = ComposedWord(candidate)
-        self.add_or_update_composedword(cand)
-
-        # Calculate window of previous words to consider for multi-term candidates
-        word_windows = list(
-            range(max(0, len(block_of_word_obj) - (n - 1)), len(block_of_word_obj))
-        )[
-            ::-1
-        ]  # Reverse to build phrases from right to left
-
-        # Generate multi-term candidates with increasing length
-        for w in word_windows:
-            # Add previous term to candidate
-            candidate.append(block_of_word_obj[w])
+        table = self._state["collections"]["candidate_table"]
+        freq_ns = self.freq_ns
+
+        # Single-term candidate (the term is appended to the block afterwards,
+        # so it starts at the current end of the block)
+        key = (word_key[0],)
+        tag_code = word_key[1]
+        entry = table.get(key)
+        if entry is None:
+            table[key] = [1.0, tag_code, block_of_word_obj, len(block_of_word_obj)]
+        else:
+            entry[0] += 1.0
+            if entry[1] != tag_code:
+                self._add_candidate_tag(key, tag_code)
+
+        # Multi-term candidates, extended with previous words from right to left
+        first = max(0, len(block_of_word_keys) - (n - 1))
+        shift = _TAG_BITS
+        for w in range(len(block_of_word_keys) - 1, first - 1, -1):
+            word_id, word_tag = block_of_word_keys[w]
+            key = (word_id,) + key
+            tag_code |= word_tag << shift
+            shift += _TAG_BITS
 
             # Update frequency count for this n-gram length
-            self.freq_ns[len(candidate)] += 1.0
+            freq_ns[len(key)] += 1.0
 
-            # Create and register the composed word candidate
-            # (reverse to maintain correct word order)
-            cand = ComposedWord(candidate[::-1])
-            self.add_or_update_composedword(cand)
+            entry = table.get(key)
+            if entry is None:
+                table[key] = [1.0, tag_code, block_of_word_obj, w]
+            else:
+                entry[0] += 1.0
+                if entry[1] != tag_code:
+                    self._add_candidate_tag(key, tag_code)
+
+    def _add_candidate_tag(self, key: tuple, tag_code: int) -> None:
+        """Record a tag sequence other than the first one seen for a candidate."""
+        tags = self._state["collections"]["candidate_tags"]
+        if key in tags:
+            tags[key].add(tag_code)
+        else:
+            tags[key] = {tag_code}
+
+    def _materialize_candidates(self) -> None:
+        """
+        Turn the pending candidate table into ComposedWord objects.
+
+        Candidates are added in order of first occurrence, keyed by their
+        lowercased text, so the candidates dictionary is the same as if one
+        ComposedWord had been built and merged per occurrence. In lean mode,
+        candidates that is_valid() would reject (starting or ending with a
+        stopword, or with unusual or digit words in every occurrence) are
+        skipped instead.
+        """
+        collections = self._state["collections"]
+        candidates = collections["candidates"]
+        table = collections["candidate_table"]
+        extra_tags = collections["candidate_tags"]
+        collections["candidate_table"] = {}
+        collections["candidate_tags"] = {}
+        lean = self.lean
+
+        for key, (tf, tag_code, block, start) in table.items():
+            codes = extra_tags.get(key, ())
+            if lean:
+                flags = _tag_code_flags(tag_code)
+                for code in codes:
+                    flags |= _tag_code_flags(code)
+                if (
+                    not flags & TAG_CLEAN
+                    or block[start][2].stopword
+                    or block[start + len(key) - 1][2].stopword
+                ):
+                    continue
+            cand = ComposedWord(block[start:start + len(key)])
+            existing = candidates.get(cand.unique_kw)
+            if existing is None:
+                candidates[cand.unique_kw] = cand
+            else:
+                cand = existing
+                cand.add_tags(_decode_tags(tag_code), _tag_code_flags(tag_code))
+            for code in codes:
+                cand.add_tags(_decode_tags(code), _tag_code_flags(code))
+            cand.tf += tf
 
     # --- Public API methods ---
 
+    def memory_report(self) -> Dict[str, int]:
+        """
+        Break down the memory held by this data core.
+
+        Each structure is measured deeply, in the order below, and objects
+        shared between structures are charged to the first one that holds
+        them: the words of a sentence, for example, count with the terms.
+        The stopword set and other configuration shared with the extractor
+        are not counted.
+
+        Returns:
+            Bytes per structure (graph, terms, word_ids, sentences_str,
+            sentences_obj, candidate_table, candidates, other) and their total
+        """
+        config = self._state["config"]
+        collections = self._state["collections"]
+        seen: Set[int] = set()
+        for shared in (config["stopword_set"], config["exclude"], config["tags_to_discard"]):
+            _deep_sizeof(shared, seen)
+
+        report = {
+            "graph": _deep_sizeof(self._state["g"], seen),
+            "terms": (
+                _deep_sizeof(collections["terms"], seen)
+                + _deep_sizeof(collections["term_table"], seen)
+            ),
+            "word_ids": _deep_sizeof(collections["word_ids"], seen),
+            "sentences_str": _deep_sizeof(collections["sentences_str"], seen),
+            "sentences_obj": _deep_sizeof(collections["sentences_obj"], seen),
+            "candidate_table": (
+                _deep_sizeof(collections["candidate_table"], seen)
+                + _deep_sizeof(collections["candidate_tags"], seen)
+            ),
+            "candidates": _deep_sizeof(collections["candidates"], seen),
+        }
+        report["other"] = _deep_sizeof(self._state, seen)
+        report["total"] = sum(report.values())
+        return report
+
     def get_tag(self, word, i):
         """
         Get tag for a word.
@@ -420,11 +763,7 @@ class DataCore:
         """
 
         # Tokenize the candidate string
-        tokenized_words = [
-            w
-            for w in split_contractions(web_tokenizer(candidate_string.lower()))
-            if not (w.startswith("'") and len(w) > 1) and len(w) > 0
-        ]
+        tokenized_words = self.tokenizer.tokenize(candidate_string.lower())
 
         # Process each word in the candidate
         candidate_terms = []
@@ -447,7 +786,39 @@ class DataCore:
         # Create and return the composed word
         return ComposedWord(candidate_terms)
 
-    def build_single_terms_features(self, features: Optional[List[str]] = None) -> None:
+    def _term_stats(self) -> Optional[Dict[str, float]]:
+        """
+        Compute the document statistics used to score single terms.
+
+        Only non-stopword terms are considered for the mean and standard
+        deviation of the term frequency.
+
+        Returns:
+            Dictionary with max_tf, avg_tf, std_tf and number_of_sentences,
+            or None if the document has no valid terms
+        """
+        table = self.term_table
+        tfs = table.column("tf")
+
+        # Filter to valid terms (non-stopwords)
+        valid_tfs = tfs[~np.array(table.stopwords, dtype=bool)]
+
+        # Skip if no valid terms
+        if not valid_tfs.size:
+            return None
+
+        return {
+            "max_tf": max(table.columns["tf"]),
+            "avg_tf": valid_tfs.mean(),
+            "std_tf": valid_tfs.std(),
+            "number_of_sentences": self.number_of_sentences,
+        }
+
+    def build_single_terms_features(
+        self,
+        features: Optional[List[str]] = None,
+        vectorized: Optional[bool] = None
+    ) -> None:
         """
         Calculates and updates statistical features for all single terms in the text.
         This includes term frequency statistics and other features specified in the
@@ -456,33 +827,79 @@ class DataCore:
 
         Args:
             features: Specific features to calculate. If None, all available features will be built.
+            vectorized: Compute all terms in one NumPy pass (see
+                term_feature_arrays) and write the results back to the terms.
+                If None, the DataCore "vectorized" setting is used.
         """
-        # Filter to valid terms (non-stopwords)
-        valid_terms = [term for term in self.terms.values() if not term.stopword]
-        valid_tfs = np.array([x.tf for x in valid_terms])
-
-        # Skip if no valid terms
-        if not valid_tfs.size:
+        if vectorized is None:
+            vectorized = self.vectorized
+
+        if vectorized:
+            arrays = self.term_feature_arrays(features=features)
+            if not arrays:
+                return
+            for name in ("wrel", "wfreq", "wspread", "wcase", "wpos", "pl", "pr", "h"):
+                self.term_table.set_column(name, arrays[name])
             return
 
         # Calculate frequency statistics
-        avg_tf = valid_tfs.mean()
-        std_tf = valid_tfs.std()
-        max_tf = max(x.tf for x in self.terms.values())
-
-        # Prepare statistics dictionary for updating terms
-        stats = {
-            "max_tf": max_tf,
-            "avg_tf": avg_tf,
-            "std_tf": std_tf,
-            "number_of_sentences": self.number_of_sentences,
-        }
+        stats = self._term_stats()
+        if stats is None:
+            return
 
         # Update all terms with the calculated statistics
         for term in self.terms.values():
             term.update_h(stats, features=features)
 
-    def build_mult_terms_features(self, features: Optional[List[str]] = None) -> None:
+    def term_feature_arrays(
+        self, features: Optional[List[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute the single-term features of all terms as NumPy arrays.
+
+        Takes tf, tf_a, tf_n, sentence counts and median sentence positions
+        from the term table and the graph degrees and weights from the graph,
+        as arrays indexed by term id, then computes
+        WRel, WFreq, WSpread, WCase, WPos and H for every term in one pass.
+        The terms themselves are not modified.
+
+        Args:
+            features: Specific features to calculate. If None, all available
+                features will be built.
+
+        Returns:
+            Dictionary of arrays (wrel, wfreq, wspread, wcase, wpos, pl, pr, h,
+            plus the tf, tf_a and tf_n inputs) in term id order, or an empty
+            dictionary if the document has no valid terms
+        """
+        stats = self._term_stats()
+        if stats is None:
+            return {}
+
+        table = self.term_table
+        count = len(table)
+        wdr, wir, wdl, wil = self.g.metric_arrays()
+        arrays = {
+            "tf": table.column("tf"),
+            "tf_a": table.column("tf_a"),
+            "tf_n": table.column("tf_n"),
+            "sentences": np.array(table.sentence_counts, dtype=np.float64),
+            "median_sentence": table.median_sentences(),
+            "wdr": wdr[:count], "wir": wir[:count],
+            "wdl": wdl[:count], "wil": wil[:count],
+        }
+        for name in ("wrel", "wfreq", "wspread", "wcase", "wpos", "pl", "pr"):
+            arrays[name] = table.column(name)
+
+        result = calculate_term_features_batch(arrays, stats, features=features)
+        result.update(tf=arrays["tf"], tf_a=arrays["tf_a"], tf_n=arrays["tf_n"])
+        return result
+
+    def build_mult_terms_features(
+        self,
+        features: Optional[List[str]] = None,
+        vectorized: Optional[bool] = None
+    ) -> None:
         """
         Build features for multi-word terms.
 
@@ -493,13 +910,77 @@ class DataCore:
         Args:
             features: List of features to build. If None, all
                 available features will be built.
+            vectorized: Score all valid candidates in one NumPy pass (see
+                candidate_feature_arrays) and write the scores back. If None,
+                the DataCore "vectorized" setting is used.
         """
+        if vectorized is None:
+            vectorized = self.vectorized
+
+        if vectorized:
+            candidates = [cand for cand in self.candidates.values() if cand.is_valid()]
+            if not candidates:
+                return
+            scores = self.candidate_feature_arrays(candidates, features=features)
+            for cand, h in zip(candidates, scores["h"].tolist()):
+                cand.h = h
+            return
+
         # Update only valid candidates using single pass generator expression
         # This is more efficient than separate filter + map operations
         for cand in self.candidates.values():
             if cand.is_valid():
                 cand.update_h(features=features)
 
+    def candidate_feature_arrays(
+        self,
+        candidates: Optional[List[ComposedWord]] = None,
+        features: Optional[List[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score candidates as NumPy arrays.
+
+        Turns the candidates into a matrix of term ids (one row per candidate,
+        at most n columns, padded with -1) and computes sum_h, prod_h and H for
+        all of them at once, using the current H scores of the single terms.
+        The candidates themselves are not modified.
+
+        Args:
+            candidates: Candidates to score (default: all valid candidates)
+            features: List of features to build. If None, all
+                available features will be built.
+
+        Returns:
+            Dictionary of arrays (sum_h, prod_h, tf_used, h) in the order of
+            ``candidates``
+        """
+        if candidates is None:
+            candidates = [cand for cand in self.candidates.values() if cand.is_valid()]
+
+        # Scatter the flattened term ids into a -1 padded matrix
+        lengths = np.fromiter((len(cand.terms) for cand in candidates), dtype=np.int64,
+                              count=len(candidates))
+        flat_ids = np.fromiter((term.id for cand in candidates for term in cand.terms),
+                               dtype=np.int64, count=int(lengths.sum()))
+        width = int(lengths.max(initial=1))
+        term_ids = np.full((len(candidates), width), -1, dtype=np.int64)
+        row_index = np.repeat(np.arange(len(candidates)), lengths)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        term_ids[row_index, np.arange(flat_ids.size) - starts] = flat_ids
+
+        table = self.term_table
+        return calculate_composed_features_batch(
+            term_ids,
+            term_h=table.column("h"),
+            term_tf=table.column("tf"),
+            term_stopword=np.array(table.stopwords, dtype=bool),
+            edge_weights=self.g.edge_weights,
+            cand_tf=np.fromiter((c.tf for c in candidates), dtype=np.float64,
+                                count=len(candidates)),
+            features=features,
+            stopword_weight=STOPWORD_WEIGHT,
+        )
+
     def get_term(self, str_word: str, save_non_seen: bool = True) -> SingleWord:
         """
         Get or create a term object for a word.
@@ -545,8 +1026,10 @@ class DataCore:
         )
 
         # Create the term object
+        # Terms that are not saved get a table of their own
         term_id = len(self.terms)
-        term_obj = SingleWord(unique_term, term_id, self.g)
+        term_obj = SingleWord(unique_term, term_id, self.g,
+                              self.term_table if save_non_seen else None)
         term_obj.stopword = isstopword
 
         # Save the term to the collection if requested
@@ -568,17 +1051,9 @@ class DataCore:
             left_term: Left term in the co-occurrence relationship
             right_term: Right term in the co-occurrence relationship
         """
-        # Check if the edge already exists
-        if right_term.id not in self.g[left_term.id]:
-            # Create a new edge with initial weight
-            self.g.add_edge(left_term.id, right_term.id, tf=0.0)
-
-        # Increment the co-occurrence frequency
-        self.g[left_term.id][right_term.id]["tf"] += 1.0
-
-        # Invalidate graph metrics cache for affected terms
-        left_term.invalidate_graph_cache()
-        right_term.invalidate_graph_cache()
+        # Create the edge if needed and increment the co-occurrence frequency;
+        # the graph keeps the degree and weight totals read by SingleWord
+        self.g.add_cooccurrence(left_term.id, right_term.id)
 
     def add_or_update_composedword(self, cand):
         """
@@ -10,7 +10,7 @@ Based on the modular architecture from the reference YAKE implementation.
 
 import logging
 import math
-from typing import Dict, Any, Tuple
+from typing import Callable, Dict, Any, Optional, List, Tuple
 import numpy as np  # pylint: disable=import-error
 
 # Configure module logger
@@ -86,6 +86,96 @@ def calculate_term_features(
     }
 
 
+def _apply_by_value(values: np.ndarray, func: Callable[[float], float]) -> np.ndarray:
+    """
+    Apply a scalar function to an array, once per distinct value.
+
+    Used for the logarithms in the term features: their inputs (term
+    frequencies, median sentence positions) take few distinct values, and
+    evaluating them with ``math`` keeps the results bit-identical to the
+    scalar path.
+
+    Args:
+        values: Input array
+        func: Scalar function to apply
+
+    Returns:
+        Array of ``func(value)`` for every element of ``values``
+    """
+    if not values.size:
+        return np.zeros(0, dtype=np.float64)
+    unique, inverse = np.unique(values, return_inverse=True)
+    mapped = np.array([func(float(value)) for value in unique], dtype=np.float64)
+    return mapped[inverse.reshape(-1)]
+
+
+# pylint: disable=too-many-locals
+def calculate_term_features_batch(
+    arrays: Dict[str, np.ndarray],
+    stats: Dict[str, float],
+    features: Optional[List[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate the statistical features of many terms in one vectorised pass.
+
+    Array counterpart of ``SingleWord.update_h``: every input is an array with
+    one entry per term, and the same formulas are applied element-wise, in the
+    same order of operations, so the results match the per-term computation.
+
+    Args:
+        arrays: Per-term input arrays:
+            - tf, tf_a, tf_n: term frequency, uppercase and proper noun counts
+            - wdl, wil, wdr, wir: in/out degree and in/out edge weight
+            - sentences: number of distinct sentences containing the term
+            - median_sentence: median sentence id of the term occurrences
+            - wrel, wfreq, wspread, wcase, wpos, pl, pr: current values,
+              kept for features that are not recalculated
+        stats: Document statistics (max_tf, avg_tf, std_tf, number_of_sentences)
+        features: List of specific features to calculate or None to calculate all
+
+    Returns:
+        Arrays for wrel, wfreq, wspread, wcase, wpos, pl, pr and h
+    """
+    max_tf = stats["max_tf"]
+    tf = arrays["tf"]
+    result = {
+        name: np.array(arrays[name], dtype=np.float64)
+        for name in ("wrel", "wfreq", "wspread", "wcase", "wpos", "pl", "pr")
+    }
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if features is None or "wrel" in features:
+            wil, wir = arrays["wil"], arrays["wir"]
+            pwl = np.where(wil == 0, 0.0, arrays["wdl"] / wil)
+            pwr = np.where(wir == 0, 0.0, arrays["wdr"] / wir)
+            result["pl"] = arrays["wdl"] / max_tf
+            result["pr"] = arrays["wdr"] / max_tf
+            result["wrel"] = (0.5 + (pwl * (tf / max_tf))) + (0.5 + (pwr * (tf / max_tf)))
+
+        if features is None or "wfreq" in features:
+            result["wfreq"] = tf / (stats["avg_tf"] + stats["std_tf"])
+
+        if features is None or "wspread" in features:
+            result["wspread"] = arrays["sentences"] / stats["number_of_sentences"]
+
+        if features is None or "wcase" in features:
+            result["wcase"] = np.maximum(arrays["tf_a"], arrays["tf_n"]) / (
+                1.0 + _apply_by_value(tf, math.log)
+            )
+
+        if features is None or "wpos" in features:
+            result["wpos"] = _apply_by_value(
+                3.0 + arrays["median_sentence"], lambda x: math.log(math.log(x))
+            )
+
+        wrel = result["wrel"]
+        result["h"] = (result["wpos"] * wrel) / (
+            result["wcase"] + (result["wfreq"] / wrel) + (result["wspread"] / wrel)
+        )
+
+    return result
+
+
 def calculate_composed_features(
     composed_word: Any,
     stopword_weight: str = 'bi'
@@ -154,6 +244,105 @@ def calculate_composed_features(
     }
 
 
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def calculate_composed_features_batch(
+    term_ids: np.ndarray,
+    term_h: np.ndarray,
+    term_tf: np.ndarray,
+    term_stopword: np.ndarray,
+    edge_weights: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    cand_tf: np.ndarray,
+    features: Optional[List[str]] = None,
+    stopword_weight: str = 'bi'
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate the H score of many n-gram candidates in one vectorised pass.
+
+    Array counterpart of ``ComposedWord.update_h``. Candidates are given as a
+    padded matrix of term ids, one row per candidate and one column per word
+    position (-1 marks padding after the last word). Columns are processed in
+    order with the same operations as the per-object loop, so the results
+    match it exactly.
+
+    Args:
+        term_ids: (candidates x max n-gram size) matrix of term ids, -1 padded
+        term_h: H score of every term, indexed by term id
+        term_tf: Term frequency of every term, indexed by term id
+        term_stopword: Stopword flag of every term, indexed by term id
+        edge_weights: Function returning co-occurrence weights for arrays of
+            (left, right) term ids, 0.0 for missing edges
+        cand_tf: Frequency of every candidate
+        features: Specific features to use for scoring (only "KPF" matters)
+        stopword_weight: Method for handling stopwords ('bi', 'h', or 'none')
+
+    Returns:
+        Arrays for sum_h, prod_h, tf_used and h, one entry per candidate
+    """
+    rows, columns = term_ids.shape
+    sum_h = np.zeros(rows, dtype=np.float64)
+    prod_h = np.ones(rows, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for t in range(columns):
+            current = term_ids[:, t]
+            present = current >= 0
+            ids = np.where(present, current, 0)
+            stopword = present & term_stopword[ids]
+            h_t = term_h[ids]
+
+            # Non-stopwords (and stopwords in "h" mode) contribute their H score
+            direct = present & ~stopword if stopword_weight != 'h' else present
+            sum_h = np.where(direct, sum_h + h_t, sum_h)
+            prod_h = np.where(direct, prod_h * h_t, prod_h)
+
+            if stopword_weight != 'bi' or not stopword.any():
+                continue
+
+            # BiWeight: probabilities of the edges to the neighbouring terms
+            prob_t1 = np.zeros(rows, dtype=np.float64)
+            if t > 0:
+                previous = term_ids[:, t - 1]
+                prob_t1 = np.where(
+                    stopword,
+                    edge_weights(previous, ids) / term_tf[previous],
+                    0.0,
+                )
+
+            prob_t2 = np.zeros(rows, dtype=np.float64)
+            if t < columns - 1:
+                following = term_ids[:, t + 1]
+                has_next = stopword & (following >= 0)
+                next_ids = np.where(has_next, following, 0)
+                prob_t2 = np.where(
+                    has_next,
+                    edge_weights(ids, next_ids) / term_tf[next_ids],
+                    0.0,
+                )
+
+            prob = prob_t1 * prob_t2
+            prod_h = np.where(stopword, prod_h * (1 + (1 - prob)), prod_h)
+            sum_h = np.where(stopword, sum_h - (1 - prob), sum_h)
+
+        # Determine term frequency to use in scoring
+        if features is None or "KPF" in features:
+            tf_used = np.asarray(cand_tf, dtype=np.float64)
+        else:
+            tf_used = np.ones(rows, dtype=np.float64)
+
+        denominator = (sum_h + 1) * tf_used
+        if not np.all(denominator):
+            # Same failure as the per-object computation
+            raise ZeroDivisionError("float division by zero")
+        h_score = prod_h / denominator
+
+    return {
+        'sum_h': sum_h,
+        'prod_h': prod_h,
+        'tf_used': tf_used,
+        'h': h_score
+    }
+
+
 def get_feature_aggregation(
     composed_word: Any,
     feature_name: str,
@@ -0,0 +1,97 @@
+"""
+Extraction instrumentation for YAKE.
+
+This module contains the ExtractionStats class, which records how long each
+stage of one keyword extraction took and how much data it handled. Stages
+run one after another, so each is timed with a single lap() call at its end;
+code paths check ``stats is not None`` before recording anything, which keeps
+the cost negligible when instrumentation is turned off.
+
+Stages, in pipeline order:
+
+- pre_filter: text normalization
+- segmentation: sentence splitting and tokenization
+- build: term, co-occurrence and candidate construction
+- term_features: single-term feature computation
+- candidate_features: n-gram candidate feature computation
+- ranking: candidate validity filtering (and ordering when there is no
+  deduplication)
+- dedup: score-ordered candidate selection with deduplication
+- lemmatization: lemma aggregation (only when enabled)
+- result_cache: persistent result cache lookup and storage
+"""
+
+from time import perf_counter
+from typing import Any, Dict
+
+STAGES = (
+    "pre_filter",
+    "segmentation",
+    "build",
+    "term_features",
+    "candidate_features",
+    "ranking",
+    "dedup",
+    "lemmatization",
+    "result_cache",
+)
+
+
+class ExtractionStats:
+    """
+    Per-stage wall times and counts of one keyword extraction.
+
+    Attributes:
+        timings: Seconds spent per stage, in the order the stages ran
+        counts: Sizes and counters (sentences, words, terms, candidates,
+            valid_candidates, dedup_comparisons, similarity_cache_hits,
+            similarity_cache_misses, keywords, result_cache_hits)
+    """
+
+    __slots__ = ("timings", "counts", "_mark")
+
+    def __init__(self):
+        """Start the clock for the first stage."""
+        self.timings: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._mark = perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """
+        Charge the time since the previous lap to ``stage``.
+
+        Args:
+            stage: Stage that just finished (see STAGES)
+        """
+        now = perf_counter()
+        self.timings[stage] = self.timings.get(stage, 0.0) + now - self._mark
+        self._mark = now
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    @property
+    def total(self) -> float:
+        """Get the total time of all recorded stages, in seconds."""
+        return sum(self.timings.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the recorded values as plain dictionaries.
+
+        Returns:
+            Dictionary with "timings", "counts" and "total" entries
+        """
+        return {"timings": dict(self.timings), "counts": dict(self.counts), "total": self.total}
+
+    def __repr__(self) -> str:
+        """Summarize the stage times in milliseconds."""
+        stages = ", ".join(f"{stage}={seconds * 1000:.2f}ms" for stage, seconds in self.timings.items())
+        return f"ExtractionStats({stages})"
@@ -9,14 +9,74 @@ a relevance score for each word.
 
 import logging
 import math
-from typing import Any
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, Optional, Tuple
 import numpy as np  # pylint: disable=import-error
-import networkx as nx  # pylint: disable=import-error
+
+from .term_table import TermTable
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
 
+class TermData(MutableMapping):
+    """
+    Live dictionary view over the values of a SingleWord.
+
+    Reads and writes go through the term, so ``term.data["wfreq"] = 0.5``
+    updates the TermTable row just like ``term["wfreq"] = 0.5``. The keys
+    unique_term and occurs are read-only, and only extra metrics can be
+    deleted.
+    """
+
+    __slots__ = ("_term",)
+
+    def __init__(self, term: "SingleWord"):
+        """
+        Initialize the view.
+
+        Args:
+            term: Term whose values the view exposes
+        """
+        self._term = term
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a value of the term."""
+        return self._term[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a value of the term in its table row."""
+        self._term[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an extra metric of the term."""
+        term = self._term
+        extra = term.table.extra.get(term._row, {})  # pylint: disable=protected-access
+        if key not in extra:
+            raise KeyError(f"{key!r} cannot be removed")
+        del extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of the term."""
+        term = self._term
+        yield "unique_term"
+        yield "stopword"
+        yield from term.table.columns
+        yield "occurs"
+        yield from tuple(term.table.extra.get(term._row, {}))  # pylint: disable=protected-access
+
+    def __len__(self) -> int:
+        """Get the number of keys of the term."""
+        term = self._term
+        extra = term.table.extra.get(term._row, {})  # pylint: disable=protected-access
+        return 3 + len(term.table.columns) + len(extra)
+
+    def __repr__(self) -> str:
+        """Represent the view by its current values."""
+        return f"TermData({dict(self)!r})"
+
+
 class SingleWord:
     """
     Representation of a single word term in the document.
@@ -26,14 +86,17 @@ class SingleWord:
     are used to calculate a relevance score that indicates the word's importance
     in the document.
 
+    The values live in one row of a TermTable shared by all the terms of a
+    document; a SingleWord created on its own gets a private one-row table.
+
     Attributes:
         See property accessors below for available attributes.
     """
 
     # Use __slots__ to reduce memory overhead per instance
-    __slots__ = ('id', 'g', 'data', '_graph_metrics_cache', '_graph_version')
+    __slots__ = ('id', 'g', 'table', '_row', '_graph_metrics_cache', '_graph_version')
 
-    def __init__(self, unique: str, idx: int, graph: nx.DiGraph):
+    def __init__(self, unique: str, idx: int, graph: Any, table: Optional[TermTable] = None):
         """
         Initialize a SingleWord term object.
 
@@ -41,6 +104,9 @@ class SingleWord:
             unique: The unique normalized term this object represents
             idx: Unique identifier for the term in the document
             graph: Word co-occurrence graph from the document
+                (a CooccurrenceGraph or a networkx DiGraph)
+            table: Term table of the document, to which a row is added for
+                this term. If None, the term gets a table of its own.
         """
         self.id = idx  # Fast access needed as it's used in graph operations
         self.g = graph  # Fast access needed for network calculations
@@ -49,29 +115,21 @@ class SingleWord:
         self._graph_metrics_cache = None
         self._graph_version = 0  # Track graph changes for cache invalidation
 
-        self.data = {
-            # Basic information
-            "unique_term": unique,
-            "stopword": False,
-            "h": 0.0,  # Final Score
-            # Term frequency statistics
-            "tf": 0.0,  # Term frequency
-            "tf_a": 0.0,  # Term Frequency for uppercase words
-            "tf_n": 0.0,  # Term Frequency for proper nouns
-            # Word characteristic metrics
-            "wfreq": 0.0,  # Word frequency
-            "wcase": 0.0,  # Word case metric
-            "wrel": 1.0,  # Word relevance metric
-            "wpos": 1.0,  # Word position metric
-            "wspread": 0.0,  # Word spread across document
-            "pl": 0.0,  # Probability left
-            "pr": 0.0,  # Probability right
-            "pagerank": 1.0,  # PageRank score
-            # Ocurrence tracking
-            "occurs": {},  # Sentence Occurrences
-        }
+        self.table = table if table is not None else TermTable()
+        self._row = self.table.add(unique)
+
+    @property
+    def data(self) -> TermData:
+        """
+        Get a dictionary view of all the values of this term.
 
-    # Forward common dictionary operations to self.data
+        Returns:
+            Live view with unique_term, stopword, the metric columns, occurs
+            and any extra metrics; assignments write back to the term table
+        """
+        return TermData(self)
+
+    # Forward common dictionary operations to the term table
     def __getitem__(self, key: str) -> Any:
         """
         Access attributes dictionary-style with obj['key'].
@@ -82,7 +140,16 @@ class SingleWord:
         Returns:
             The value associated with the key
         """
-        return self.data[key]
+        column = self.table.columns.get(key)
+        if column is not None:
+            return column[self._row]
+        if key == "unique_term":
+            return self.unique_term
+        if key == "stopword":
+            return self.stopword
+        if key == "occurs":
+            return self.occurs
+        return self.table.extra.get(self._row, {})[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         """
@@ -92,7 +159,15 @@ class SingleWord:
             key: The attribute key to set
             value: The value to associate with the key
         """
-        self.data[key] = value
+        column = self.table.columns.get(key)
+        if column is not None:
+            column[self._row] = value
+        elif key == "stopword":
+            self.stopword = value
+        elif key in ("unique_term", "occurs"):
+            raise KeyError(f"{key!r} is read-only")
+        else:
+            self.table.extra.setdefault(self._row, {})[key] = value
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -105,18 +180,21 @@ class SingleWord:
         Returns:
             The value associated with the key or the default value
         """
-        return self.data.get(key, default)
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
     # The most commonly used properties remain as explicit accessors for backward compatibility
     @property
     def unique_term(self):
         """Get the unique normalized term this object represents."""
-        return self.data["unique_term"]
+        return self.table.unique_terms[self._row]
 
     @property
     def stopword(self):
         """Get whether this term is a stopword."""
-        return self.data["stopword"]
+        return bool(self.table.stopwords[self._row])
 
     @stopword.setter
     def stopword(self, value):
@@ -126,12 +204,12 @@ class SingleWord:
         Args:
             value (bool): True if the term is a stopword, False otherwise
         """
-        self.data["stopword"] = value
+        self.table.stopwords[self._row] = bool(value)
 
     @property
     def h(self):
         """Get the final relevance score of this term (lower is better)."""
-        return self.data["h"]
+        return self.table.columns["h"][self._row]
 
     @h.setter
     def h(self, value):
@@ -141,12 +219,12 @@ class SingleWord:
         Args:
             value (float): The new score value
         """
-        self.data["h"] = value
+        self.table.columns["h"][self._row] = value
 
     @property
     def tf(self):
         """Get the term frequency (number of occurrences) in the document."""
-        return self.data["tf"]
+        return self.table.columns["tf"][self._row]
 
     @tf.setter
     def tf(self, value):
@@ -156,12 +234,23 @@ class SingleWord:
         Args:
             value (float): The new term frequency value
         """
-        self.data["tf"] = value
+        self.table.columns["tf"][self._row] = value
 
     @property
-    def occurs(self):
-        """Get the dictionary of sentence occurrences for this term."""
-        return self.data["occurs"]
+    def occurs(self) -> Mapping[int, Tuple[Tuple[int, int], ...]]:
+        """
+        Get the sentence occurrences for this term.
+
+        The occurrences live in a flat buffer of the term table, so the
+        result is read-only: mutating it raises TypeError or AttributeError.
+        Use add_occur() to record more.
+
+        Returns:
+            Read-only mapping of sentence ids to tuples of
+            (pos_sent, pos_text) tuples
+        """
+        grouped = self.table.occurs(self._row)
+        return MappingProxyType({sent_id: tuple(positions) for sent_id, positions in grouped.items()})
 
     # Everything else uses the generic accessor methods
     def get_metric(self, name):
@@ -174,7 +263,7 @@ class SingleWord:
         Returns:
             float: The value of the requested metric
         """
-        return self.data.get(name, 0.0)
+        return self.get(name, 0.0)
 
     def set_metric(self, name, value):
         """
@@ -184,7 +273,7 @@ class SingleWord:
             name (str): The name of the metric to set
             value (float): The new value for the metric
         """
-        self.data[name] = value
+        self[name] = value
 
     def invalidate_graph_cache(self):
         """
@@ -202,7 +291,9 @@ class SingleWord:
 
         Analyzes the term's connections in the co-occurrence graph to compute
         various relationship metrics that measure its contextual importance.
-        Results are cached to avoid recalculation on subsequent calls.
+        A CooccurrenceGraph provides the degree and weight totals directly;
+        for networkx graphs the edges are walked and the results cached to
+        avoid recalculation on subsequent calls.
 
         Returns:
             dict: Dictionary containing the calculated graph metrics:
@@ -217,6 +308,14 @@ class SingleWord:
         if self._graph_metrics_cache is not None:
             return self._graph_metrics_cache
 
+        # Compact co-occurrence store: totals are maintained incrementally
+        if hasattr(self.g, "node_metrics"):
+            wdr, wir, wdl, wil = self.g.node_metrics(self.id)
+            return {
+                "wdr": wdr, "wir": wir, "pwr": 0 if wir == 0 else wdr / wir,
+                "wdl": wdl, "wil": wil, "pwl": 0 if wil == 0 else wdl / wil,
+            }
+
         # Calculate metrics if not cached
         # Out-edges metrics
         wdr = len(self.g.out_edges(self.id))
@@ -268,43 +367,48 @@ class SingleWord:
         std_tf = stats["std_tf"]
         number_of_sentences = stats["number_of_sentences"]
 
+        columns = self.table.columns
+        row = self._row
+        tf = columns["tf"][row]
+
         # Get all graph metrics at once
         graph_metrics = self.get_graph_metrics()
 
         # Update metrics based on features
         if features is None or "wrel" in features:
             # Calculate relatedness metrics using graph connections
-            self.data["pl"] = graph_metrics["wdl"] / max_tf
-            self.data["pr"] = graph_metrics["wdr"] / max_tf
-            self.data["wrel"] = (0.5 + (graph_metrics["pwl"] * (self.tf / max_tf))) + (
-                0.5 + (graph_metrics["pwr"] * (self.tf / max_tf))
+            columns["pl"][row] = graph_metrics["wdl"] / max_tf
+            columns["pr"][row] = graph_metrics["wdr"] / max_tf
+            columns["wrel"][row] = (0.5 + (graph_metrics["pwl"] * (tf / max_tf))) + (
+                0.5 + (graph_metrics["pwr"] * (tf / max_tf))
             )
 
         if features is None or "wfreq" in features:
             # Calculate frequency metric normalized by corpus statistics
-            self.data["wfreq"] = self.tf / (avg_tf + std_tf)
+            columns["wfreq"][row] = tf / (avg_tf + std_tf)
 
         if features is None or "wspread" in features:
             # Calculate spread as proportion of sentences containing the term
-            self.data["wspread"] = len(self.occurs) / number_of_sentences
+            columns["wspread"][row] = self.table.sentence_counts[row] / number_of_sentences
 
         if features is None or "wcase" in features:
             # Calculate case feature from uppercase and proper noun occurrences
-            self.data["wcase"] = max(self.data["tf_a"], self.data["tf_n"]) / (
-                1.0 + math.log(self.tf)
+            columns["wcase"][row] = max(columns["tf_a"][row], columns["tf_n"][row]) / (
+                1.0 + math.log(tf)
             )
 
         if features is None or "wpos" in features:
             # Calculate position feature from median position of occurrences
-            self.data["wpos"] = math.log(
-                math.log(3.0 + np.median(list(self.occurs.keys())))
+            columns["wpos"][row] = math.log(
+                math.log(3.0 + np.median(self.table.sentence_ids(row)))
             )
 
         # Calculate final score
-        self.data["h"] = (self.data["wpos"] * self.data["wrel"]) / (
-            self.data["wcase"]
-            + (self.data["wfreq"] / self.data["wrel"])
-            + (self.data["wspread"] / self.data["wrel"])
+        wrel = columns["wrel"][row]
+        columns["h"][row] = (columns["wpos"][row] * wrel) / (
+            columns["wcase"][row]
+            + (columns["wfreq"][row] / wrel)
+            + (columns["wspread"][row] / wrel)
         )
 
     def add_occur(self, tag, sent_id, pos_sent, pos_text):
@@ -321,87 +425,75 @@ class SingleWord:
             pos_sent: Position within the sentence
             pos_text: Global position in the entire text
         """
-        # Create empty list for this sentence if it's the first occurrence
-        if sent_id not in self.occurs:
-            self.occurs[sent_id] = []
-
-        # Record position information for this occurrence
-        self.occurs[sent_id].append((pos_sent, pos_text))
-        self.data["tf"] += 1.0
-
-        # Update special counters for acronyms and proper nouns
-        if tag == "a":
-            self.data["tf_a"] += 1.0
-        if tag == "n":
-            self.data["tf_n"] += 1.0
+        self.table.add_occur(self._row, tag, sent_id, pos_sent, pos_text)
 
     # For backward compatibility, define access to common metrics as properties
     @property
     def wfreq(self):
         """Get the word frequency metric."""
-        return self.data["wfreq"]
+        return self.table.columns["wfreq"][self._row]
 
     @wfreq.setter
     def wfreq(self, value):
         """Set the word frequency metric."""
-        self.data["wfreq"] = value
+        self.table.columns["wfreq"][self._row] = value
 
     @property
     def wcase(self):
         """Get the word case metric."""
-        return self.data["wcase"]
+        return self.table.columns["wcase"][self._row]
 
     @wcase.setter
     def wcase(self, value):
         """Set the word case metric."""
-        self.data["wcase"] = value
+        self.table.columns["wcase"][self._row] = value
 
     @property
     def wrel(self):
         """Get the word relevance metric."""
-        return self.data["wrel"]
+        return self.table.columns["wrel"][self._row]
 
     @wrel.setter
     def wrel(self, value):
         """Set the word relevance metric."""
-        self.data["wrel"] = value
+        self.table.columns["wrel"][self._row] = value
 
     @property
     def wpos(self):
         """Get the word position metric."""
-        return self.data["wpos"]
+        return self.table.columns["wpos"][self._row]
 
     @wpos.setter
     def wpos(self, value):
         """Set the word position metric."""
-        self.data["wpos"] = value
+        self.table.columns["wpos"][self._row] = value
 
     @property
     def wspread(self):
         """Get the word spread metric."""
-        return self.data["wspread"]
+        return self.table.columns["wspread"][self._row]
 
     @wspread.setter
     def wspread(self, value):
         """Set the word spread metric."""
-        self.data["wspread"] = value
+        self.table.columns["wspread"][self._row] = value
 
     @property
     def pl(self):
         """Get the probability left metric."""
-        return self.data["pl"]
+        return self.table.columns["pl"][self._row]
 
     @pl.setter
     def pl(self, value):
         """Set the probability left metric."""
-        self.data["pl"] = value
+        self.table.columns["pl"][self._row] = value
 
     @property
     def pr(self):
         """Get the probability right metric."""
-        return self.data["pr"]
+        return self.table.columns["pr"][self._row]
 
     @pr.setter
     def pr(self, value):
         """Set the probability right metric."""
-        self.data["pr"] = value
+        self.table.columns["pr"][self._row] = value
@@ -0,0 +1,195 @@
+"""
+Struct-of-arrays storage of single-term statistics for YAKE.
+
+This module contains the TermTable class, which holds the statistics of all
+single terms of a document in columns indexed by term id: frequencies,
+feature values and the H score in typed ``array('d')`` columns, and the
+occurrences of each term in a compact ``array('i')`` buffer. SingleWord
+objects are thin views over one row of a table, so the per-term API keeps
+working while whole columns can be handed to NumPy without walking the
+term objects (see DataCore.term_feature_arrays).
+"""
+
+from array import array
+from typing import Any, Dict, List, Tuple
+
+import numpy as np  # pylint: disable=import-error
+
+# Float columns and the value of a new row
+COLUMNS = {
+    "h": 0.0,  # Final Score
+    "tf": 0.0,  # Term frequency
+    "tf_a": 0.0,  # Term Frequency for uppercase words
+    "tf_n": 0.0,  # Term Frequency for proper nouns
+    "wfreq": 0.0,  # Word frequency
+    "wcase": 0.0,  # Word case metric
+    "wrel": 1.0,  # Word relevance metric
+    "wpos": 1.0,  # Word position metric
+    "wspread": 0.0,  # Word spread across document
+    "pl": 0.0,  # Probability left
+    "pr": 0.0,  # Probability right
+    "pagerank": 1.0,  # PageRank score
+}
+
+# Integers stored per occurrence: sentence id, position in sentence, position in text
+OCCURRENCE_WIDTH = 3
+
+
+class TermTable:
+    """
+    Column store of the single terms of a document.
+
+    Rows are appended with add() and never removed; a row number is the id
+    of the term in its document. Occurrences are stored as flat
+    (sent_id, pos_sent, pos_text) triples in insertion order, and the number
+    of distinct sentences of each term is maintained as they are added.
+
+    Attributes:
+        columns: Float columns by metric name (see COLUMNS)
+        unique_terms: Normalized term of each row
+        stopwords: Stopword flag of each row (0 or 1)
+        occurrences: Occurrence buffer of each row
+        sentence_counts: Number of distinct sentences of each row
+        extra: Metrics without a column, by row (rarely used)
+    """
+
+    __slots__ = (
+        "columns", "unique_terms", "stopwords", "occurrences",
+        "sentence_counts", "_last_sentence", "extra",
+    )
+
+    def __init__(self):
+        """Create an empty table."""
+        self.columns: Dict[str, array] = {name: array("d") for name in COLUMNS}
+        self.unique_terms: List[str] = []
+        self.stopwords = array("b")
+        self.occurrences: List[array] = []
+        self.sentence_counts = array("i")
+        self._last_sentence = array("i")  # Highest sentence id seen per row
+        self.extra: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return len(self.unique_terms)
+
+    def add(self, unique_term: str, stopword: bool = False) -> int:
+        """
+        Append a row for a new term.
+
+        Args:
+            unique_term: The normalized term
+            stopword: Whether the term is a stopword
+
+        Returns:
+            The row number of the term
+        """
+        row = len(self.unique_terms)
+        for name, default in COLUMNS.items():
+            self.columns[name].append(default)
+        self.unique_terms.append(unique_term)
+        self.stopwords.append(stopword)
+        self.occurrences.append(array("i"))
+        self.sentence_counts.append(0)
+        self._last_sentence.append(0)
+        return row
+
+    def add_occur(self, row: int, tag: str, sent_id: int, pos_sent: int, pos_text: int) -> None:
+        """
+        Record an occurrence of a term and update its frequencies.
+
+        Args:
+            row: Row of the term
+            tag: Term tag ('a' for acronym, 'n' for proper noun, etc.)
+            sent_id: Sentence ID where the term appears
+            pos_sent: Position within the sentence
+            pos_text: Global position in the entire text
+        """
+        buffer = self.occurrences[row]
+        # Sentences arrive in increasing order during a build; anything
+        # else falls back to a scan of the recorded sentence ids
+        last = self._last_sentence[row]
+        if not buffer or sent_id > last:
+            self.sentence_counts[row] += 1
+            self._last_sentence[row] = sent_id
+        elif sent_id != last and sent_id not in buffer[::OCCURRENCE_WIDTH]:
+            self.sentence_counts[row] += 1
+        buffer.extend((sent_id, pos_sent, pos_text))
+
+        columns = self.columns
+        columns["tf"][row] += 1.0
+        # Update special counters for acronyms and proper nouns
+        if tag == "a":
+            columns["tf_a"][row] += 1.0
+        if tag == "n":
+            columns["tf_n"][row] += 1.0
+
+    def sentence_ids(self, row: int) -> List[int]:
+        """
+        Get the distinct sentences of a term.
+
+        Args:
+            row: Row of the term
+
+        Returns:
+            Sentence ids in order of first occurrence
+        """
+        return list(dict.fromkeys(self.occurrences[row][::OCCURRENCE_WIDTH]))
+
+    def occurs(self, row: int) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Get the occurrences of a term grouped by sentence.
+
+        Args:
+            row: Row of the term
+
+        Returns:
+            New dictionary mapping sentence ids to lists of
+            (pos_sent, pos_text) tuples
+        """
+        buffer = self.occurrences[row]
+        grouped: Dict[int, List[Tuple[int, int]]] = {}
+        for start in range(0, len(buffer), OCCURRENCE_WIDTH):
+            grouped.setdefault(buffer[start], []).append((buffer[start + 1], buffer[start + 2]))
+        return grouped
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Copy a float column into a NumPy array.
+
+        Args:
+            name: Column name (see COLUMNS)
+
+        Returns:
+            float64 array in row order
+        """
+        return np.array(self.columns[name], dtype=np.float64)
+
+    def set_column(self, name: str, values: np.ndarray) -> None:
+        """
+        Overwrite a float column.
+
+        Args:
+            name: Column name (see COLUMNS)
+            values: One value per row, in row order
+        """
+        self.columns[name] = array("d", np.asarray(values, dtype=np.float64).tobytes())
+
+    def median_sentences(self) -> np.ndarray:
+        """
+        Get the median sentence id of every term.
+
+        The median is taken over the distinct sentences of each term, like
+        ``np.median(list(term.occurs))``.
+
+        Returns:
+            float64 array in row order
+        """
+        medians = np.empty(len(self), dtype=np.float64)
+        for row, buffer in enumerate(self.occurrences):
+            ids = sorted(set(buffer[::OCCURRENCE_WIDTH]))
+            if not ids:
+                medians[row] = np.nan
+                continue
+            middle = len(ids) // 2
+            medians[row] = ids[middle] if len(ids) % 2 else (ids[middle - 1] + ids[middle]) / 2
+        return medians
@@ -0,0 +1,538 @@
+"""
+Sentence segmentation and word tokenization backends for YAKE.
+
+A tokenizer backend splits a pre-filtered text into sentences and each
+sentence into word tokens. Two backends are available:
+
+- "segtok" (default): the segtok segmenter and web tokenizer, as YAKE has
+  always used them;
+- "regex": the same rules ported to precompiled patterns of the standard
+  ``re`` module, with fast paths for plain words. It agrees with segtok on
+  nearly every sentence and token of ordinary text and is faster; keep
+  "segtok" where exact legacy output matters.
+
+Custom backends subclass Tokenizer and can be passed as instances wherever
+a backend name is accepted (DataCore config, KeywordExtractor).
+"""
+
+import abc
+import re
+import unicodedata
+from functools import lru_cache
+from html import unescape
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from segtok.segmenter import split_multi  # pylint: disable=import-error
+from .utils import SENTENCE_HOLD_BACK, pre_filter, split_complete_sentences, tokenize_sentence
+
+# Backend used when none is configured
+DEFAULT_TOKENIZER = "segtok"
+
+# Character sets shared with segtok
+SENTENCE_TERMINALS = ".!?‼‽⁇⁈⁉。﹒﹗！．？｡"
+HYPHENS = "­֊־༌᐀᠆‐-‒⸗゠-"
+APOSTROPHES = "'´ʹʼ’′"
+
+# Abbreviations that do not end a sentence (segtok's list); lower-case ones
+# also match capitalized
+ABBREVIATIONS = r"""
+approx Capt cf Col Dr f\.?e figs? Gen e\.?g i\.?e i\.?v
+Mag med Mr Mrs Mt nat No nr p\.e phil prof rer
+sci Sgt Sr Sra Srta St univ vol vs z\.B
+Jän Jan Ene Feb Mär Mar Apr Abr May Jun Jul Aug Sep Sept Oct Okt Nov Dic Dez Dec
+E\.U U\.K U\.S
+""".split()
+
+# Bracketed fragments shorter than this are not split into sentences
+SHORT_SENTENCE_LENGTH = 55
+
+
+class Tokenizer(abc.ABC):
+    """
+    Base class of tokenizer backends.
+
+    Subclasses implement split_sentences() and tokenize(); a subclass
+    missing either cannot be instantiated. Instances are stateless and must
+    be picklable, as extractors holding them are sent to worker processes.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    def split_sentences(self, text: str) -> Iterable[str]:
+        """
+        Split a pre-filtered text into sentences.
+
+        Args:
+            text: Text returned by pre_filter()
+
+        Returns:
+            Stripped sentence strings in document order (some may be empty)
+        """
+
+    @abc.abstractmethod
+    def tokenize(self, sentence: str) -> List[str]:
+        """
+        Split a sentence into word tokens.
+
+        Args:
+            sentence: The sentence to be tokenized
+
+        Returns:
+            List of word tokens, without standalone apostrophes and empty tokens
+        """
+
+    def tokenize_sentences(self, text: str) -> List[List[str]]:
+        """
+        Split text into sentences and tokenize them, skipping empty sentences.
+
+        Args:
+            text: Text returned by pre_filter()
+
+        Returns:
+            A nested list where each inner list contains tokens for one sentence
+        """
+        tokenize = self.tokenize
+        return [tokenize(s) for s in self.split_sentences(text) if s.strip()]
+
+    def split_complete_sentences(
+        self, text: str, hold_back: int = SENTENCE_HOLD_BACK
+    ) -> Tuple[List[str], int]:
+        """
+        Split the sentences of a text prefix that further text cannot change.
+
+        Used by DataCore.feed(); see yake.data.utils.split_complete_sentences.
+        This default cuts at the start of the first held-back sentence.
+
+        Args:
+            text: Pre-filtered text received so far (not yet segmented)
+            hold_back: Number of trailing sentences to keep unsplit
+
+        Returns:
+            Tuple of (complete sentences, offset of the remaining text)
+        """
+        return split_complete_sentences(
+            text, hold_back, splitter=self.split_sentences, segment_pattern=None
+        )
+
+    def __repr__(self) -> str:
+        """Name the backend (also part of result cache fingerprints)."""
+        return f"{type(self).__name__}()"
+
+    def __eq__(self, other: object) -> bool:
+        """Backends of the same class are interchangeable."""
+        return type(self) is type(other)
+
+    def __hash__(self) -> int:
+        """Hash consistently with __eq__."""
+        return hash(type(self))
+
+
+class SegtokTokenizer(Tokenizer):
+    """The segtok segmenter and web tokenizer (legacy behaviour, default)."""
+
+    name = "segtok"
+
+    def split_sentences(self, text: str) -> Iterable[str]:
+        """Split a pre-filtered text into sentences with segtok."""
+        return split_multi(text)
+
+    def tokenize(self, sentence: str) -> List[str]:
+        """Tokenize a sentence with segtok's web tokenizer."""
+        return tokenize_sentence(sentence)
+
+    def split_complete_sentences(
+        self, text: str, hold_back: int = SENTENCE_HOLD_BACK
+    ) -> Tuple[List[str], int]:
+        """Split the final sentences of a prefix, cutting at a segtok span."""
+        return split_complete_sentences(text, hold_back)
+
+
+@lru_cache(maxsize=1)
+def _category_ranges() -> Dict[str, List[Tuple[int, int]]]:
+    """Group the BMP code points into ranges by Unicode category, in one pass."""
+    ranges: Dict[str, List[Tuple[int, int]]] = {}
+    start, current = 0, unicodedata.category("\x00")
+    for code in range(1, 0x10000):
+        category = unicodedata.category(chr(code))
+        if category != current:
+            ranges.setdefault(current, []).append((start, code - 1))
+            start, current = code, category
+    ranges.setdefault(current, []).append((start, 0xFFFF))
+    return ranges
+
+
+def _char_class(*categories: str) -> str:
+    """Build the body of a regex character class of the BMP characters in some categories."""
+    ranges = sorted(
+        code_range for category in categories for code_range in _category_ranges().get(category, ())
+    )
+    merged: List[List[int]] = []
+    for first, last in ranges:
+        if merged and merged[-1][1] == first - 1:
+            merged[-1][1] = last
+        else:
+            merged.append([first, last])
+    return "".join(
+        re.escape(chr(first)) if first == last else f"{re.escape(chr(first))}-{re.escape(chr(last))}"
+        for first, last in merged
+    )
+
+
+@lru_cache(maxsize=1)
+def _patterns() -> Dict[str, "re.Pattern"]:
+    """
+    Compile the RegexTokenizer patterns on first use.
+
+    segtok relies on the Unicode properties of the ``regex`` module
+    (\\p{Lu}, ...); here they become explicit character classes.
+    """
+    upper_only = _char_class("Lu")
+    upper = upper_only + _char_class("Lt")
+    lower = _char_class("Ll")
+    modifier = _char_class("Lm")
+    letter = _char_class("Ll", "Lm", "Lt", "Lu")
+    any_letter = _char_class("Ll", "Lm", "Lt", "Lu", "Lo")
+    digit = _char_class("Nd")
+    number = _char_class("Nd", "Nl")
+    space = _char_class("Zs")
+    alnum = f"[{letter}{number}]"
+    hyphen = f"[{HYPHENS}]"
+    apostrophe = "[´ʹʼ’′]"
+    terminal = f"[{SENTENCE_TERMINALS}]"
+    abbreviations = "|".join(sorted(
+        ABBREVIATIONS + [a.capitalize() for a in ABBREVIATIONS if a[0].islower()]
+    ))
+
+    return {
+        # Sentence segmentation
+        "segment": re.compile(f"({terminal}['’\"”]?[\\]\\)]*\\s+|\\n{{2,}})"),
+        "abbreviation": re.compile(
+            rf"""
+            (?: \b(?:{abbreviations})
+            |   ^\S
+            |   ^\d+
+            |   (?: \b
+                (?: [Bb]y | [Cc](?:aptain|ommander) | [Dd]o[ck]tor | [Gg]eneral
+                |   [Mm](?:ag)?is(?:ter|s) | [Pp]rofessor | [Ss]eñor(?:it)?a?
+                ) \s
+            |   (?: (?<!\b[{upper_only}][{modifier}])(?<!\b[{upper_only}]) , (?: \s and )?
+                |   (?<!\b[{upper_only},][{modifier}])(?<!\b[{upper_only},]) \s and
+                ) \s
+            |   [\[\(]
+            ) (?: [{upper}] [{modifier}]? \. [{HYPHENS}]? )? [{upper}] [{modifier}]?
+            ) $""",
+            re.VERBOSE,
+        ),
+        "date_digits": re.compile(r"\b[0123]?[0-9]$"),
+        "month": re.compile(
+            r"(J[äa]n|Ene|Feb|M[äa]r|A[pb]r|May|Jun|Jul|Aug|Sep|O[ck]t|Nov|D[ei][cz]"
+            r"|0?[1-9]|1[012])"
+        ),
+        "continuation": re.compile(
+            r"(?:a(?:nd|re)|b(?:etween|y)|from|has|i(?:nto|s)|o[fr]"
+            r"|t(?:han|hat|hrough)|via|w(?:as|ere|hether|ith))\b"
+        ),
+        "before_lower": re.compile(
+            rf"(?:{terminal}\"[\)\]]*|{terminal}[\)\]]+|\bspp\.|\b[{any_letter}][{lower}]?\.)\s+$"
+        ),
+        "lower_word": re.compile(rf"[{lower}]+{hyphen}?[{lower}]*\b"),
+        "middle_initial_end": re.compile(rf"\b[{upper_only}][{lower}]+\W+[{upper_only}]$"),
+        "upper_word_start": re.compile(rf"[{upper_only}][{lower}]+\b"),
+        "lone_word": re.compile(rf"[{lower}]+[{lower}{digit}{HYPHENS}]*$"),
+        "upper_case_end": re.compile(rf"\b[{upper}][{any_letter}]*\.\s+$"),
+        "upper_case_start": re.compile(
+            rf"(?:(?:\(\d{{4}}\)\s)?[{upper}][{any_letter}]*|\d+)[\.,:]\s+"
+        ),
+        # Word tokenization
+        "web": re.compile(
+            r"""
+            (?:^|(?<=[\s<"'(\[{]))
+            (
+                [A-z]+ :// (?:[^@]+@)? (?:[\w-]+\.)+\w+ (?::\d+)?
+                (?:/[^?\#\s'">)\]}]*)? (?:\?[^\#\s'">)\]}]+)? (?:\#[^\s'">)\]}]+)?
+            |   [\w.\#$%&'*+/=!?^`{|}~-]+ @ (?:[\w-]+\.)+ \w+
+            )(?=[\s>"')\]}]|$)""",
+            re.VERBOSE,
+        ),
+        "word": re.compile(
+            rf"""((?:
+                {alnum} \. (?!\.\.)
+            |   {alnum} , (?={alnum})
+            |   [{number}] : (?=[{number}])
+            |   {alnum} {apostrophe}? {hyphen} (?={alnum})
+            |   {apostrophe} (?!{apostrophe})
+            |   {alnum} ' (?={alnum})
+            |   s ' $
+            |   \b [yzafpnµmcdhkMGTPEZY]? [{letter}]{{1,3}} ⁻?[¹²³] $
+            |   \b (?:[A-Z][a-z]?|[\)\]])+ [₀-₉]+ (?:[²³]?[⁺⁻])?
+            |   {alnum}
+            )+)""",
+            re.VERBOSE,
+        ),
+        "letters": re.compile(f"[{letter}]+"),
+        "hyphenated_linebreak": re.compile(
+            rf"({alnum}{hyphen})[{space}\t]*?(?:\r\n|\n|\r|\u2028)[{space}\t]*?({alnum})"
+        ),
+        "contraction": re.compile(
+            rf"{alnum}+(?:{hyphen}{alnum}+)*[{APOSTROPHES}](?:d|ll|m|re|s|t|ve)$"
+        ),
+        "apostrophe": re.compile(apostrophe),
+    }
+
+
+def _is_open(span: str, opener: str = "(", closer: str = ")") -> bool:
+    """Check if the span ends with an unclosed bracket."""
+    first = span.find(opener)
+    return first >= 0 and span.count(opener, first) > span.count(closer, first)
+
+
+def _is_not_opened(span: str, opener: str = "(", closer: str = ")") -> bool:
+    """Check if the span starts with an unopened bracket."""
+    last = span.rfind(closer)
+    return last >= 0 and span.count(closer, 0, last + 1) > span.count(opener, 0, last)
+
+
+class RegexTokenizer(Tokenizer):
+    """
+    Fast backend: segtok's rules on precompiled ``re`` patterns.
+
+    Sentence boundaries follow the segtok segmenter (terminal marks followed
+    by spaces and paragraph breaks, with the same abbreviation, initial,
+    date, continuation and bracket joins). Tokens follow segtok's web
+    tokenizer and contraction splitting, but words made of letters only,
+    the bulk of any text, skip the patterns altogether. Unicode properties
+    are only resolved in the Basic Multilingual Plane.
+    """
+
+    name = "regex"
+
+    def split_sentences(self, text: str) -> Iterable[str]:
+        """Split a pre-filtered text into sentences."""
+        patterns = _patterns()
+        spans = patterns["segment"].split(text)
+        return self._join_sentences(self._join_abbreviations(spans, patterns), patterns)
+
+    def split_complete_sentences(
+        self, text: str, hold_back: int = SENTENCE_HOLD_BACK
+    ) -> Tuple[List[str], int]:
+        """Split the final sentences of a prefix, cutting at a segment span."""
+        return split_complete_sentences(
+            text, hold_back, splitter=self.split_sentences, segment_pattern=_patterns()["segment"]
+        )
+
+    @staticmethod
+    def _join_abbreviations(spans: List[str], patterns) -> Iterator[str]:
+        """Join segments across markers that do not end a sentence."""
+        abbreviation = patterns["abbreviation"]
+        segment = None
+        total = len(spans)
+        for pos in range(total):
+            if pos % 2:  # Even positions hold text segments, odd ones markers
+                prev_s = spans[pos - 1]
+                if prev_s[-1:].isspace():
+                    continue
+                if spans[pos][0] == ".":
+                    if abbreviation.search(prev_s):
+                        continue
+                    next_s = spans[pos + 1] if pos + 1 < total else None
+                    if next_s and (
+                        patterns["lone_word"].match(next_s)
+                        or (patterns["date_digits"].search(prev_s)
+                            and patterns["month"].match(next_s))
+                        or (patterns["middle_initial_end"].search(prev_s)
+                            and patterns["upper_word_start"].match(next_s))
+                    ):
+                        continue
+                yield "".join(spans[segment:pos + 1])
+                segment = None
+            elif segment is None:
+                segment = pos
+        if segment is not None:
+            yield "".join(spans[segment:total])
+
+    @staticmethod
+    def _join_sentences(candidates: Iterable[str], patterns) -> Iterator[str]:
+        """Join sentences that continue in the next candidate; yield them stripped."""
+        last = None
+        for current in candidates:
+            if last is None:
+                last = current
+                continue
+            short = len(current) < SHORT_SENTENCE_LENGTH or len(last) < SHORT_SENTENCE_LENGTH
+            if patterns["before_lower"].search(last) and patterns["lower_word"].match(current):
+                last += current
+            elif short and (
+                (_is_open(last) and _is_not_opened(current))
+                or (_is_open(last, "[", "]") and _is_not_opened(current, "[", "]"))
+                or ((_is_open(last) or _is_open(last, "[", "]")) and (
+                    last.endswith(" et al. ") or (
+                        patterns["upper_case_end"].search(last)
+                        and patterns["upper_case_start"].match(current)
+                    )
+                ))
+            ):
+                last += current
+            elif patterns["continuation"].match(current):
+                last += current
+            else:
+                yield last.strip()
+                last = current
+        if last is not None:
+            yield last.strip()
+
+    def tokenize(self, sentence: str) -> List[str]:
+        """Tokenize a sentence like segtok's web tokenizer and contraction splitter."""
+        patterns = _patterns()
+        if "@" in sentence or "://" in sentence:
+            # URIs and e-mail addresses are kept whole
+            spans = patterns["web"].split(sentence)
+        else:
+            spans = (sentence,)
+
+        tokens: List[str] = []
+        for index, span in enumerate(spans):
+            if index % 2:
+                tokens.append(span)
+            else:
+                tokens.extend(self._word_tokens(unescape(span) if "&" in span else span, patterns))
+
+        if any(apostrophe in sentence for apostrophe in APOSTROPHES):
+            tokens = self._split_contractions(tokens, patterns)
+        return [w for w in tokens if w and not (w[0] == "'" and len(w) > 1)]
+
+    @staticmethod
+    def _word_tokens(text: str, patterns) -> List[str]:
+        """Tokenize a span of text outside URIs (segtok's word tokenizer)."""
+        if "\n" in text or "\r" in text or "\u2028" in text:
+            text = patterns["hyphenated_linebreak"].sub(r"\1\2", text)
+        split = patterns["word"].split
+        letters = patterns["letters"].fullmatch
+
+        tokens: List[str] = []
+        for span in text.split():
+            if (span.isascii() and span.isalpha()) or letters(span):
+                tokens.append(span)
+            else:
+                tokens.extend(token for token in split(span) if token)
+
+        # The sentence terminal is split off one of the last three tokens
+        word_match = patterns["word"].match
+        apostrophe_match = patterns["apostrophe"].match
+        for idx, word in enumerate(reversed(tokens[-3:]), 1):
+            if (word_match(word) and not apostrophe_match(word)) or any(
+                t in word for t in SENTENCE_TERMINALS
+            ):
+                if len(word) == 1 or word == "...":
+                    pass
+                elif word[-1] in SENTENCE_TERMINALS:
+                    tokens[-idx:len(tokens) - idx + 1] = [word[:-1], word[-1]]
+                elif word[0] in SENTENCE_TERMINALS:
+                    tokens[-idx:len(tokens) - idx + 1] = [word[0], word[1:]]
+                break
+
+        # Dangling commas, semicolons and colons become tokens
+        result = []
+        for word in tokens:
+            base = word
+            while len(base) > 1 and base[-1] in ",;:":
+                base = base[:-1]
+            result.append(base)
+            if base is not word:
+                result.extend(word[len(base):])
+        return result
+
+    @staticmethod
+    def _split_contractions(tokens: List[str], patterns) -> List[str]:
+        """Split contractions like "don't" or "it's" (segtok's split_contractions)."""
+        contraction = patterns["contraction"].match
+        result = []
+        for token in tokens:
+            if len(token) > 1 and contraction(token):
+                pos = max(token.rfind(apostrophe) for apostrophe in APOSTROPHES)
+                if 2 < len(token) and pos + 2 == len(token) and token[-1] == "t" and token[pos - 1] == "n":
+                    pos -= 1
+                result.append(token[:pos])
+                result.append(token[pos:])
+            else:
+                result.append(token)
+        return result
+
+
+# Registered backends, by name
+TOKENIZERS = {"segtok": SegtokTokenizer, "regex": RegexTokenizer}
+
+_INSTANCES: Dict[str, Tokenizer] = {}
+
+
+def get_tokenizer(tokenizer: Union[str, Tokenizer, None] = None) -> Tokenizer:
+    """
+    Resolve a tokenizer backend.
+
+    Args:
+        tokenizer: Backend name (see TOKENIZERS), Tokenizer instance, or
+            None for DEFAULT_TOKENIZER
+
+    Returns:
+        Tokenizer instance (shared between callers for named backends)
+
+    Raises:
+        ValueError: If the name is not a registered backend
+    """
+    if isinstance(tokenizer, Tokenizer):
+        return tokenizer
+    name = DEFAULT_TOKENIZER if tokenizer is None else tokenizer
+    instance: Optional[Tokenizer] = _INSTANCES.get(name)
+    if instance is None:
+        if name not in TOKENIZERS:
+            raise ValueError(
+                f"Unknown tokenizer: {name!r} (expected one of {', '.join(TOKENIZERS)})"
+            )
+        instance = _INSTANCES[name] = TOKENIZERS[name]()
+    return instance
+
+
+def tokenizer_agreement(
+    texts: Iterable[str], candidate: Union[str, Tokenizer], reference: Union[str, Tokenizer] = "segtok"
+) -> Dict[str, float]:
+    """
+    Measure how closely a backend reproduces another one.
+
+    Args:
+        texts: Raw documents (pre_filter() is applied)
+        candidate: Backend to evaluate
+        reference: Backend taken as correct (default: "segtok")
+
+    Returns:
+        Dictionary with sentence_agreement (share of the reference
+        sentences that the candidate tokenizes identically), token_agreement
+        (share of the reference tokens that the candidate also produces,
+        compared as multisets per document) and the numbers of reference
+        sentences and tokens
+    """
+    candidate, reference = get_tokenizer(candidate), get_tokenizer(reference)
+    sentences = same_sentences = tokens = same_tokens = 0
+    for text in texts:
+        text = pre_filter(text)
+        expected = reference.tokenize_sentences(text)
+        produced = candidate.tokenize_sentences(text)
+        produced_sentences = Counter(tuple(s) for s in produced)
+        for sentence in expected:
+            key = tuple(sentence)
+            if produced_sentences[key] > 0:
+                produced_sentences[key] -= 1
+                same_sentences += 1
+        sentences += len(expected)
+
+        expected_tokens = Counter(token for sentence in expected for token in sentence)
+        produced_tokens = Counter(token for sentence in produced for token in sentence)
+        same_tokens += sum((expected_tokens & produced_tokens).values())
+        tokens += sum(expected_tokens.values())
+
+    return {
+        "sentence_agreement": same_sentences / sentences if sentences else 1.0,
+        "token_agreement": same_tokens / tokens if tokens else 1.0,
+        "sentences": sentences,
+        "tokens": tokens,
+    }
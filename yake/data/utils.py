@@ -9,11 +9,14 @@ text analysis throughout the keyword extraction pipeline.
 
 import re
 from functools import lru_cache
-from segtok.segmenter import split_multi  # pylint: disable=import-error
+from typing import Callable, Iterable, Iterator, List, Optional, Pattern, Tuple
+from segtok.segmenter import split_multi, MAY_CROSS_ONE_LINE  # pylint: disable=import-error
 from segtok.tokenizer import web_tokenizer, split_contractions  # pylint: disable=import-error
 
 # Pre-compiled regex patterns for better performance
 _CAPITAL_LETTER_PATTERN = re.compile(r"^(\s*([A-Z]))")
+# Line break not followed by a line starting with a capital letter
+_SOFT_LINE_BREAK_PATTERN = re.compile(r"\n(?![^\S\n]*[A-Z])")
 
 # Stopword weighting method for multi-word term scoring:
 # - "bi": Use bi-directional weighting (default, considers term connections)
@@ -39,27 +42,134 @@ def pre_filter(text: str) -> str:
     whitespace, which improves the accuracy of subsequent text analysis steps
     like sentence boundary detection and keyword extraction.
 
+    All lines are handled by two whole-text substitutions instead of one
+    regex match and string concatenation per line, so the cost is linear in
+    the size of the text regardless of how many lines it has.
+
     Args:
         text: Raw input text to be pre-filtered
 
     Returns:
         Normalized text with consistent spacing and paragraph structure
     """
-    # Split the text into lines
-    parts = text.split("\n")
-    buffer = ""
+    # Every line, including the first, is preceded by its separator: line
+    # breaks before capitalized lines become paragraph breaks, the others
+    # become spaces
+    return (
+        _SOFT_LINE_BREAK_PATTERN.sub(" ", "\n" + text)
+        .replace("\n", "\n\n")
+        .replace("\t", " ")
+    )
+
+
+class PreFilterStream:
+    """
+    Incremental version of pre_filter() for text that arrives in chunks.
+
+    A line's separator depends on how the line starts, so only the beginning
+    of the current line is buffered, until its first non-whitespace character
+    (or the end of the line) arrives. Concatenating the output of every
+    feed() call and the final flush() gives exactly ``pre_filter(text)``.
+    """
+
+    __slots__ = ("_line", "_line_started")
+
+    def __init__(self):
+        """Initialize the stream at the start of an empty text."""
+        self._line = ""  # Start of the current line while its separator is unknown
+        self._line_started = False  # Whether the current line separator was emitted
+
+    def _start_line(self, line: str, buffer: List[str]) -> None:
+        """Emit the current line once its separator can be decided."""
+        if line.strip():
+            buffer.append(("\n\n" if _CAPITAL_LETTER_PATTERN.match(line) else " ") + line)
+            self._line = ""
+            self._line_started = True
+        else:
+            self._line = line
+
+    def feed(self, chunk: str) -> str:
+        """
+        Pre-filter the next chunk of text.
+
+        Args:
+            chunk: Next piece of raw text (may split lines anywhere)
+
+        Returns:
+            Pre-filtered text that can be emitted so far
+        """
+        first = chunk.find("\n")
+        head = chunk if first < 0 else chunk[:first]
+        buffer = []
 
-    # Process each line
-    for part in parts:
-        # Determine separator: preserve paragraph breaks for lines starting with capital letters
-        sep = " "
-        if _CAPITAL_LETTER_PATTERN.match(part):
-            sep = "\n\n"
+        # The beginning of the chunk continues the current line
+        if self._line_started:
+            buffer.append(head)
+        else:
+            self._start_line(self._line + head, buffer)
 
-        # Append the processed line to the buffer, replacing tabs with spaces
-        buffer += sep + part.replace("\t", " ")
+        if first >= 0:
+            # The current line ended before its separator could be decided
+            if not self._line_started:
+                buffer.append(" " + self._line)
+            # Complete lines inside the chunk
+            last = chunk.rfind("\n")
+            if last > first:
+                buffer.append(pre_filter(chunk[first + 1:last]))
+            # The end of the chunk starts a new line
+            self._line = ""
+            self._line_started = False
+            self._start_line(chunk[last + 1:], buffer)
 
-    return buffer
+        return "".join(buffer).replace("\t", " ")
+
+    def flush(self) -> str:
+        """
+        Finish the text and emit anything still buffered.
+
+        Returns:
+            Remaining pre-filtered text
+        """
+        remaining = "" if self._line_started else " " + self._line.replace("\t", " ")
+        self._line = ""
+        self._line_started = True
+        return remaining
+
+
+def iter_pre_filter(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Pre-filter a text given as an iterable of chunks.
+
+    Args:
+        chunks: Consecutive pieces of raw text
+
+    Yields:
+        Pre-filtered pieces whose concatenation equals ``pre_filter(text)``
+    """
+    stream = PreFilterStream()
+    for chunk in chunks:
+        filtered = stream.feed(chunk)
+        if filtered:
+            yield filtered
+    yield stream.flush()
+
+
+def tokenize_sentence(sentence: str) -> List[str]:
+    """
+    Tokenize a single sentence into words.
+
+    Args:
+        sentence: The sentence to be tokenized
+
+    Returns:
+        List of word tokens, without standalone apostrophes and empty tokens
+    """
+    return [
+        w  # Keep only valid word tokens
+        for w in split_contractions(web_tokenizer(sentence))
+        # Filter out standalone apostrophes and empty tokens
+        if not (w.startswith("'") and len(w) > 1) and len(w) > 0
+    ]
 
 
 def tokenize_sentences(text: str) -> list:
@@ -77,12 +187,7 @@ def tokenize_sentences(text: str) -> list:
     """
     return [
         # Inner list: tokenize each sentence into words
-        [
-            w  # Keep only valid word tokens
-            for w in split_contractions(web_tokenizer(s))
-            # Filter out standalone apostrophes and empty tokens
-            if not (w.startswith("'") and len(w) > 1) and len(w) > 0
-        ]
+        tokenize_sentence(s)
         # Outer list: iterate through sentences
         for s in list(split_multi(text))
         # Skip empty sentences
@@ -90,6 +195,66 @@ def tokenize_sentences(text: str) -> list:
     ]
 
 
+# Number of trailing sentences held back by split_complete_sentences. The
+# segmenter decides whether two sentences should be joined by looking at the
+# start of the following one, so a sentence is final once two complete
+# sentences follow it.
+SENTENCE_HOLD_BACK = 3
+
+
+def split_complete_sentences(
+    text: str,
+    hold_back: int = SENTENCE_HOLD_BACK,
+    splitter: Callable[[str], Iterable[str]] = split_multi,
+    segment_pattern: Optional[Pattern] = MAY_CROSS_ONE_LINE,
+) -> Tuple[List[str], int]:
+    """
+    Split the sentences of a text prefix that further text cannot change.
+
+    Used to segment a document that arrives in chunks: the last ``hold_back``
+    sentences may still grow or be joined with text that has not arrived
+    yet, so they are left unsplit. The returned offset is the start of the
+    segmenter span where the first held-back sentence begins, so that
+    splitting ``text[offset:] + more_text`` later gives the same sentences as
+    splitting the whole document at once.
+
+    Args:
+        text: Pre-filtered text received so far (not yet segmented)
+        hold_back: Number of trailing sentences to keep unsplit
+        splitter: Sentence splitter (default: segtok's split_multi)
+        segment_pattern: Pattern whose split() gives the splitter's spans
+            (text segments alternating with sentence-ending markers), or
+            None to cut at the start of the held-back sentence itself
+
+    Returns:
+        Tuple of (complete sentences, offset of the remaining text)
+    """
+    sentences = list(splitter(text))
+    if len(sentences) <= hold_back:
+        return [], 0
+
+    # Locate the first held-back sentence in the text
+    offset = 0
+    for sentence in sentences[: len(sentences) - hold_back + 1]:
+        start = text.index(sentence, offset)
+        offset = start + len(sentence)
+    if segment_pattern is None:
+        return sentences[: len(sentences) - hold_back], start
+
+    # Move back to the beginning of the segmenter span containing it
+    # (spans alternate between text segments and sentence-ending markers)
+    cut = 0
+    position = 0
+    for index, span in enumerate(segment_pattern.split(text)):
+        if index % 2 == 0:
+            if position > start:
+                break
+            cut = position
+        position += len(span)
+
+    return sentences[: len(sentences) - hold_back], cut
+
+
 @lru_cache(maxsize=10000)
 def get_tag(word: str, i: int, exclude: frozenset) -> str:
     """